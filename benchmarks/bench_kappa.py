@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+System Classification: A.3 He-II λ-Transition κ Analysis
+Author: Oleksii Onasenko
+Developer: SubstanceNet
+Theoretical Framework: The Emergence Parameter κ ≈ 1: An Empirical Signature 
+                       of Criticality in Physical and Biological Systems
+
+Copyright 2025 Oleksii Onasenko
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Benchmark harness for the κ analysis and visualization hot paths.
+
+Every (case, grid size) pair runs in a fresh process, so peak RSS is per
+case. Wall time is the minimum over repeats; allocation peaks come from a
+separate tracemalloc pass so tracing does not distort timings.
+
+Usage:
+    python benchmarks/bench_kappa.py run [--sizes 1e2,1e4,1e6] [--cases ...]
+    python benchmarks/bench_kappa.py compare --baseline baseline.json
+    python benchmarks/bench_kappa.py imports
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HISTORY_PATH = os.path.join(HERE, 'history.json')
+
+DEFAULT_SIZES = (10**2, 10**4, 10**6)
+PLOT_CASES = ('plot_kappa_plateau', 'plot_component_analysis',
+              'plot_phase_diagram', 'plot_scaling_verification')
+CASES = ('calculate_kappa', 'generate_synthetic_data', 'analyze_compute',
+         'analyze_io', 'csv_load') + PLOT_CASES
+
+# Relative slowdown (or RSS growth) flagged as a regression
+THRESHOLD = 0.10
+
+# Cumulative import-time budget per module (seconds), checked with -X importtime
+IMPORT_BUDGETS = {'kappa_analyzer': 0.25, 'visualizer': 0.35}
+
+# Packages that must only load inside I/O and plotting paths
+LAZY_IMPORTS = ('pandas', 'matplotlib')
+
+def _setup(case, size, workdir):
+    """Prepare inputs outside the timed region; return the timed callable."""
+    import numpy as np
+    from kappa_analyzer import HeliumLambdaAnalyzer
+    from kappa_stats import accumulate
+    
+    analyzer = HeliumLambdaAnalyzer()
+    if case == 'calculate_kappa':
+        T = np.linspace(0.5, analyzer.T_lambda - 1e-9, size)
+        return lambda: analyzer.calculate_kappa(T)
+    if case == 'generate_synthetic_data':
+        return lambda: analyzer.generate_synthetic_data(size)
+    
+    data = analyzer.generate_synthetic_data(size)
+    if case == 'analyze_compute':
+        return lambda: accumulate(data['T'].values, data['t'].values,
+                                  data['kappa'].values, analyzer.T_lambda)
+    if case == 'analyze_io':
+        results = analyzer._results_from(accumulate(
+            data['T'].values, data['t'].values, data['kappa'].values, analyzer.T_lambda))
+        return lambda: analyzer._write_outputs(workdir, results, export_csv=True)
+    if case == 'csv_load':
+        from visualizer import HeliumVisualizer
+        path = os.path.join(workdir, 'kappa_analysis.csv')
+        data.to_csv(path, index=False)
+        return lambda: HeliumVisualizer(path)
+    if case in PLOT_CASES:
+        from visualizer import HeliumVisualizer
+        viz = HeliumVisualizer.from_data(data)
+        return lambda: getattr(viz, case)(workdir)
+    raise ValueError(f"unknown case '{case}'")
+
+def _run_case(case, size, repeat):
+    """Child process: time one case, then measure its allocation peak."""
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    with tempfile.TemporaryDirectory() as workdir, open(os.devnull, 'w') as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            fn = _setup(case, size, workdir)
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                times.append(time.perf_counter() - start)
+            tracemalloc.start()
+            fn()
+            _, alloc_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        finally:
+            sys.stdout = stdout
+    # ru_maxrss is in KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss *= 1 if sys.platform == 'darwin' else 1024
+    return {
+        'case': case,
+        'size': size,
+        'wall_s': min(times),
+        'wall_mean_s': sum(times) / len(times),
+        'peak_rss_bytes': rss,
+        'alloc_peak_bytes': alloc_peak,
+    }
+
+def _environment():
+    import numpy
+    import pandas
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'numpy': numpy.__version__,
+        'pandas': pandas.__version__,
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+def load_history(path):
+    """Read a history file ({'runs': [...]}), empty if missing."""
+    if not os.path.exists(path):
+        return {'runs': []}
+    with open(path) as f:
+        return json.load(f)
+
+def run(cases=CASES, sizes=DEFAULT_SIZES, repeat=3, label='', history=HISTORY_PATH):
+    """
+    Run the benchmark matrix and append it to the history file.
+    
+    Parameters
+    ----------
+    cases : sequence of str
+        Benchmark cases (see CASES).
+    sizes : sequence of int
+        Grid sizes.
+    repeat : int
+        Timed repetitions per case (minimum is reported).
+    label : str
+        Free-form run label.
+    history : str
+        JSON history file.
+        
+    Returns
+    -------
+    dict
+        The recorded run.
+    """
+    results = []
+    ctx = get_context('spawn')
+    for size in sizes:
+        for case in cases:
+            with ProcessPoolExecutor(1, mp_context=ctx) as pool:
+                result = pool.submit(_run_case, case, size, repeat).result()
+            results.append(result)
+            print(f"{case:<28s} n={size:<11d} {result['wall_s']*1e3:10.2f} ms "
+                  f"rss {result['peak_rss_bytes']/2**20:8.1f} MiB "
+                  f"alloc {result['alloc_peak_bytes']/2**20:8.1f} MiB")
+    
+    record = {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'label': label,
+              'environment': _environment(), 'results': results}
+    data = load_history(history)
+    data['runs'].append(record)
+    with open(history, 'w') as f:
+        json.dump(data, f, indent=2)
+    return record
+
+def compare(baseline, current, threshold=THRESHOLD):
+    """
+    Compare two runs and report regressions.
+    
+    Parameters
+    ----------
+    baseline, current : dict
+        Recorded runs.
+    threshold : float
+        Relative increase in wall time or peak RSS flagged as a regression.
+        
+    Returns
+    -------
+    list of str
+        Descriptions of the regressions found.
+    """
+    base = {(r['case'], r['size']): r for r in baseline['results']}
+    regressions = []
+    print(f"{'case':<28s} {'size':>11s} {'base ms':>10s} {'now ms':>10s} {'ratio':>7s}")
+    for r in current['results']:
+        b = base.get((r['case'], r['size']))
+        if b is None:
+            continue
+        ratio = r['wall_s'] / b['wall_s'] if b['wall_s'] else float('inf')
+        rss_ratio = r['peak_rss_bytes'] / b['peak_rss_bytes'] if b['peak_rss_bytes'] else 1.0
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = 'SLOWER'
+            regressions.append(f"{r['case']} n={r['size']}: wall x{ratio:.2f}")
+        if rss_ratio > 1 + threshold:
+            flag = (flag + ' RSS').strip()
+            regressions.append(f"{r['case']} n={r['size']}: peak RSS x{rss_ratio:.2f}")
+        print(f"{r['case']:<28s} {r['size']:>11d} {b['wall_s']*1e3:10.2f} "
+              f"{r['wall_s']*1e3:10.2f} {ratio:7.2f} {flag}")
+    return regressions
+
+def _import_profile(module):
+    """Cumulative import time (s) per module of a fresh `import module`."""
+    src = os.path.join(HERE, '..', 'src')
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          cwd=src, capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        times[name.strip()] = int(cumulative_us) / 1e6
+    return times
+
+def check_imports(budgets=IMPORT_BUDGETS, lazy=LAZY_IMPORTS, repeat=5):
+    """
+    Check module import times against their budgets.
+    
+    Parameters
+    ----------
+    budgets : dict
+        Cumulative import-time budget (s) per module.
+    lazy : sequence of str
+        Top-level packages that must not be imported.
+    repeat : int
+        Fresh interpreters per module; the fastest import counts.
+        
+    Returns
+    -------
+    list of str
+        Descriptions of the violations found.
+    """
+    violations = []
+    print(f"{'module':<20s} {'import ms':>10s} {'budget ms':>10s}")
+    for module, budget in budgets.items():
+        profiles = [_import_profile(module) for _ in range(repeat)]
+        elapsed = min(p[module] for p in profiles)
+        loaded = sorted({name for name in profiles[0] if name.split('.')[0] in lazy
+                         and '.' not in name})
+        flag = 'OVER' if elapsed > budget else ''
+        if elapsed > budget:
+            violations.append(f"{module}: {elapsed*1e3:.0f} ms > {budget*1e3:.0f} ms")
+        if loaded:
+            flag = (flag + ' EAGER').strip()
+            violations.append(f"{module} imports {', '.join(loaded)}")
+        print(f"{module:<20s} {elapsed*1e3:10.1f} {budget*1e3:10.1f} {flag}")
+    return violations
+
+def _select_run(path, label=None):
+    """Latest run of a history file, or the latest with `label`."""
+    runs = load_history(path)['runs']
+    if label:
+        runs = [r for r in runs if r['label'] == label]
+    if not runs:
+        raise SystemExit(f"no matching run in {path}")
+    return runs[-1]
+
+def main():
+    """Benchmark command line."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark harness for the κ analysis and visualization hot paths.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    
+    p_run = sub.add_parser('run', help='run benchmarks and append to the history')
+    p_run.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                       help='comma-separated grid sizes, e.g. 1e2,1e4,1e8')
+    p_run.add_argument('--cases', default=','.join(CASES))
+    p_run.add_argument('--repeat', type=int, default=3)
+    p_run.add_argument('--label', default='')
+    p_run.add_argument('--history', default=HISTORY_PATH)
+    
+    p_cmp = sub.add_parser('compare', help='flag regressions against a baseline')
+    p_cmp.add_argument('--baseline', required=True,
+                       help='history file holding the baseline run')
+    p_cmp.add_argument('--baseline-label', default=None)
+    p_cmp.add_argument('--history', default=HISTORY_PATH)
+    p_cmp.add_argument('--threshold', type=float, default=THRESHOLD)
+    
+    p_imp = sub.add_parser('imports', help='check import times against their budgets')
+    p_imp.add_argument('--repeat', type=int, default=5)
+    
+    args = parser.parse_args()
+    if args.command == 'run':
+        sizes = [int(float(s)) for s in args.sizes.split(',')]
+        cases = args.cases.split(',')
+        unknown = set(cases) - set(CASES)
+        if unknown:
+            parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+        run(cases, sizes, args.repeat, args.label, args.history)
+    elif args.command == 'imports':
+        violations = check_imports(repeat=args.repeat)
+        if violations:
+            print("\nImport budget violations:")
+            for line in violations:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nWithin budget")
+    else:
+        regressions = compare(_select_run(args.baseline, args.baseline_label),
+                              _select_run(args.history), args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+System Classification: A.3 He-II λ-Transition κ Analysis
+Author: Oleksii Onasenko
+Developer: SubstanceNet
+Theoretical Framework: The Emergence Parameter κ ≈ 1: An Empirical Signature 
+                       of Criticality in Physical and Biological Systems
+
+Copyright 2025 Oleksii Onasenko
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Batch driver running many analyzer configurations across cores.
+
+A manifest (JSON, CSV or YAML) lists configurations; each one is analyzed
+in a worker process. Completed runs are journaled, so an interrupted batch
+resumes where it stopped, and all results are gathered in one table.
+
+Usage:
+    python batch_runner.py manifest.json --out ../results/batch --jobs 8
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from kappa_analyzer import NU, T_LAMBDA, ZETA, HeliumLambdaAnalyzer, LambdaLine
+from result_cache import CACHE_DIR, ResultCache, cache_key
+from tracing import TRACE_ENV, enable, span
+
+STATE_NAME = 'batch_state.jsonl'
+TABLE_NAME = 'batch_results.csv'
+
+# Defaults for fields a manifest entry may omit
+CONFIG_DEFAULTS = {
+    'T_lambda': T_LAMBDA,
+    'zeta': ZETA,
+    'nu': NU,
+    'n_points': 200,
+    'export_csv': False,
+    'figures': False,
+}
+
+# Columns of the consolidated results table
+TABLE_COLUMNS = ('name', 'pressure', 'T_lambda', 'zeta', 'nu', 'n_points_grid', 'kappa_mean',
+                 'kappa_std', 'kappa_min', 'kappa_max', 'kappa_at_t_001',
+                 'kappa_at_t_01', 'n_points', 'T_min', 'T_max', 'output_dir',
+                 'elapsed_s')
+
+# Manifest fields that are always kept as text (e.g. a run named '001')
+TEXT_FIELDS = ('name', 'output_dir')
+
+def _coerce(value):
+    """Parse CSV/YAML scalars into numbers or booleans where possible."""
+    if not isinstance(value, str):
+        return value
+    lowered = value.strip().lower()
+    if lowered in ('true', 'yes'):
+        return True
+    if lowered in ('false', 'no'):
+        return False
+    for kind in (int, float):
+        try:
+            return kind(value)
+        except ValueError:
+            pass
+    return value
+
+def load_manifest(path):
+    """
+    Read a batch manifest.
+    
+    JSON and YAML manifests hold either a list of configurations or a
+    mapping with optional 'defaults' and a 'runs' list; CSV manifests have
+    one configuration per row. Empty CSV cells fall back to the defaults;
+    other CSV cells are parsed as numbers or booleans, except `TEXT_FIELDS`.
+    
+    Parameters
+    ----------
+    path : str
+        Manifest file (.json, .csv, .yaml/.yml).
+        
+    Returns
+    -------
+    list of dict
+        Complete configurations, each with a unique 'name'.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, newline='') as f:
+        if ext == '.csv':
+            manifest = [{k: v if k in TEXT_FIELDS else _coerce(v)
+                         for k, v in row.items() if v not in ('', None)}
+                        for row in csv.DictReader(f)]
+        elif ext in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("YAML manifests require PyYAML (pip install pyyaml)")
+            manifest = yaml.safe_load(f)
+        else:
+            manifest = json.load(f)
+    
+    defaults = dict(CONFIG_DEFAULTS)
+    if isinstance(manifest, dict):
+        defaults.update(manifest.get('defaults', {}))
+        manifest = manifest['runs']
+    
+    configs = []
+    for i, entry in enumerate(manifest):
+        config = dict(defaults)
+        config.update(entry)
+        config['_explicit'] = sorted(entry)
+        config.setdefault('name', f'run{i:04d}')
+        configs.append(config)
+    
+    names = [c['name'] for c in configs]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"duplicate run names in manifest: {', '.join(map(str, duplicates))}")
+    return [resolve_config(c) for c in configs]
+
+def resolve_config(config):
+    """
+    Derive T_λ for configurations given by pressure.
+    
+    An entry with a 'pressure' (bar) takes its T_λ from the default λ-line
+    unless it also sets 'T_lambda' explicitly.
+    """
+    config = dict(config)
+    if config.get('pressure') is not None and 'T_lambda' not in config.get('_explicit', ()):
+        T_lambda = float(LambdaLine()(config['pressure']))
+        if np.isnan(T_lambda):
+            raise ValueError(f"run '{config['name']}': pressure {config['pressure']} bar "
+                             "is outside the λ-line")
+        config['T_lambda'] = T_lambda
+    config.pop('_explicit', None)
+    return config
+
+def run_config(config, out_root, cache_root=None):
+    """
+    Analyze one configuration (executed in a worker process).
+    
+    Parameters
+    ----------
+    config : dict
+        Configuration from `load_manifest`.
+    out_root : str
+        Batch output directory; runs without 'output_dir' go to out_root/name.
+    cache_root : str, optional
+        Result cache directory (None disables caching).
+        
+    Returns
+    -------
+    dict
+        One row of the consolidated results table.
+    """
+    start = time.perf_counter()
+    output_dir = config.get('output_dir') or os.path.join(out_root, str(config['name']))
+    cache = ResultCache(cache_root) if cache_root else None
+    
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        analyzer = HeliumLambdaAnalyzer(config['T_lambda'], config['zeta'],
+                                        config['nu'], cache=cache)
+        analyzer.generate_synthetic_data(int(config['n_points']))
+        results = analyzer.analyze(output_dir, export_csv=bool(config['export_csv']))
+        if config['figures']:
+            from visualizer import HeliumVisualizer
+            HeliumVisualizer.from_data(analyzer.data, analyzer.metadata()
+                                       ).generate_all_figures(os.path.join(output_dir, 'figures'))
+    
+    return {
+        'name': config['name'],
+        'pressure': config.get('pressure'),
+        'T_lambda': config['T_lambda'],
+        'zeta': config['zeta'],
+        'nu': config['nu'],
+        'n_points_grid': int(config['n_points']),
+        'kappa_mean': float(results['kappa_mean']),
+        'kappa_std': float(results['kappa_std']),
+        'kappa_min': float(results['kappa_min']),
+        'kappa_max': float(results['kappa_max']),
+        'kappa_at_t_001': float(results['kappa_at_t_001']),
+        'kappa_at_t_01': float(results['kappa_at_t_01']),
+        'n_points': int(results['n_points']),
+        'T_min': float(results['T_range'][0]),
+        'T_max': float(results['T_range'][1]),
+        'output_dir': output_dir,
+        'elapsed_s': time.perf_counter() - start,
+    }
+
+def read_state(path):
+    """Completed runs from a batch journal, keyed by name (last entry wins)."""
+    done = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn final line of an interrupted run
+                done[entry['name']] = entry
+    return done
+
+def run_batch(configs, out_root, jobs=None, cache_root=CACHE_DIR, restart=False):
+    """
+    Run configurations on a process pool with journaling and resume.
+    
+    Parameters
+    ----------
+    configs : list of dict
+        Configurations from `load_manifest`.
+    out_root : str
+        Batch output directory (journal and consolidated table live here).
+    jobs : int, optional
+        Maximum concurrent worker processes (defaults to the CPU count).
+    cache_root : str, optional
+        Result cache directory (None disables caching).
+    restart : bool
+        Ignore the journal and rerun everything.
+        
+    Returns
+    -------
+    list of dict
+        Result rows in manifest order (failed runs are omitted).
+    """
+    os.makedirs(out_root, exist_ok=True)
+    state_path = os.path.join(out_root, STATE_NAME)
+    if restart and os.path.exists(state_path):
+        os.remove(state_path)
+    done = read_state(state_path)
+    
+    digests = {c['name']: cache_key(**c) for c in configs}
+    pending = [c for c in configs
+               if done.get(c['name'], {}).get('status') != 'ok'
+               or done[c['name']].get('config_key') != digests[c['name']]]
+    n_total, n_skipped = len(configs), len(configs) - len(pending)
+    if n_skipped:
+        print(f"Resuming: {n_skipped}/{n_total} runs already complete")
+    
+    with open(state_path, 'a') as journal, \
+            ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(run_config, c, out_root, cache_root): c for c in pending}
+        for k, future in enumerate(as_completed(futures), start=n_skipped + 1):
+            config = futures[future]
+            entry = {'name': config['name'], 'config_key': digests[config['name']]}
+            try:
+                entry.update(status='ok', row=future.result())
+                message = f"ok ({entry['row']['elapsed_s']:.2f} s)"
+            except Exception as exc:
+                entry.update(status='error', error=f'{type(exc).__name__}: {exc}')
+                message = f"FAILED: {entry['error']}"
+            journal.write(json.dumps(entry) + '\n')
+            journal.flush()
+            os.fsync(journal.fileno())
+            done[config['name']] = entry
+            print(f"[{k}/{n_total}] {config['name']}: {message}")
+    
+    rows = [done[c['name']]['row'] for c in configs
+            if done.get(c['name'], {}).get('status') == 'ok']
+    write_table(os.path.join(out_root, TABLE_NAME), rows)
+    
+    n_failed = sum(done[c['name']]['status'] != 'ok' for c in configs)
+    print(f"Batch complete: {len(rows)} ok, {n_failed} failed")
+    print(f"Results table: {os.path.join(out_root, TABLE_NAME)}")
+    return rows
+
+def write_table(path, rows):
+    """Write the consolidated results table as CSV."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=TABLE_COLUMNS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+def main():
+    """Batch command line."""
+    parser = argparse.ArgumentParser(
+        description='Run many κ analyzer configurations across cores.')
+    parser.add_argument('manifest', help='JSON, CSV or YAML manifest')
+    parser.add_argument('--out', default='../results/batch', help='batch output directory')
+    parser.add_argument('--jobs', type=int, default=None, help='concurrent worker processes')
+    parser.add_argument('--figures', action='store_true',
+                        help='render figures for every run')
+    parser.add_argument('--no-cache', action='store_true', help='disable the result cache')
+    parser.add_argument('--restart', action='store_true', help='ignore the resume journal')
+    parser.add_argument('--trace', nargs='?', const='1', default=os.environ.get(TRACE_ENV),
+                        metavar='PATH', help='trace the driver (Chrome trace JSON at PATH)')
+    args = parser.parse_args()
+    if args.trace:
+        enable(None if args.trace == '1' else args.trace)
+    
+    with span('load_manifest'):
+        configs = load_manifest(args.manifest)
+    if args.figures:
+        for config in configs:
+            config['figures'] = True
+    
+    with span('run_batch', n_runs=len(configs)):
+        run_batch(configs, args.out, args.jobs,
+                  cache_root=None if args.no_cache else CACHE_DIR, restart=args.restart)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+"""
+System Classification: A.3 He-II λ-Transition κ Analysis
+Author: Oleksii Onasenko
+Developer: SubstanceNet
+Theoretical Framework: The Emergence Parameter κ ≈ 1: An Empirical Signature 
+                       of Criticality in Physical and Biological Systems
+
+Copyright 2025 Oleksii Onasenko
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Local interactive explorer for binary κ result sets.
+
+κ(t), ρ_s and ξ_norm are reduced once to min/max pyramids over log t
+(stored inside the result set), so any zoom window is answered with a
+bounded number of points. Hot tiles are kept in an in-memory LRU cache;
+cold tiles are read from the memory-mapped pyramid files. The service is
+a stdlib HTTP server and runs fully offline.
+
+Usage:
+    python explorer.py ../results/kappa_analysis.kbin --port 8050
+"""
+
+import argparse
+import json
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from kappa_analyzer import T_LAMBDA
+from results_io import ColumnWriter, open_columns
+from tracing import TRACE_ENV, count, enable, span, traced
+from visualizer import source_fingerprint
+
+PYRAMID_NAME = 'pyramid'
+INDEX_NAME = 'index.json'
+
+# Series reduced into the pyramid, when present in the result set
+SERIES = ('kappa', 'rho_s', 'xi_norm')
+PHASES = ('superfluid', 'normal')
+
+# Bins of the finest level (a power of two), bins per tile, rows read per
+# chunk while building, and tiles held by the LRU cache
+BASE_BINS = 1 << 16
+TILE_BINS = 512
+BUILD_CHUNK_ROWS = 1 << 20
+TILE_CACHE_TILES = 1024
+
+# Default point budget of a window query (per series)
+WINDOW_MAX_POINTS = 2000
+
+def _level_path(root, phase, level):
+    return os.path.join(root, phase, f'L{level}.kbin')
+
+def _reduce_level(count_, mins, maxs):
+    """Merge adjacent bin pairs of one level into the next coarser level."""
+    count_ = count_.reshape(-1, 2).sum(axis=1)
+    mins = {name: np.fmin(v[0::2], v[1::2]) for name, v in mins.items()}
+    maxs = {name: np.fmax(v[0::2], v[1::2]) for name, v in maxs.items()}
+    return count_, mins, maxs
+
+@traced('build_pyramid')
+def build_pyramid(data_path, series=None, base_bins=BASE_BINS, chunk_rows=BUILD_CHUNK_ROWS):
+    """
+    Reduce a result set to min/max pyramids over log t.
+    
+    Level 0 splits the finite log t range into `base_bins` equal bins; each
+    coarser level merges bin pairs, down to a single bin.
+    Rows are split by phase (T below or above T_λ) and read in chunks, so
+    memory stays bounded by the pyramid itself.
+    
+    Parameters
+    ----------
+    data_path : str
+        Binary result set (kappa_analysis.kbin).
+    series : sequence of str, optional
+        Columns to reduce (defaults to the available `SERIES`).
+    base_bins : int
+        Bins of the finest level; must be a power of two.
+    chunk_rows : int
+        Rows read per chunk.
+        
+    Returns
+    -------
+    dict
+        The pyramid index (also written to `<data_path>/pyramid/index.json`).
+    """
+    if base_bins < 1 or base_bins & (base_bins - 1):
+        raise ValueError(f"base_bins must be a power of two, got {base_bins}")
+    store = open_columns(data_path)
+    series = [s for s in (series or SERIES) if s in store]
+    if 't' not in store or not series:
+        raise ValueError(f"{data_path} has no 't' column or no series to explore")
+    T_lambda = store.metadata.get('T_lambda', T_LAMBDA)
+    
+    # Finite log t range
+    lo, hi = np.inf, -np.inf
+    for start in range(0, store.n_rows, chunk_rows):
+        t = np.asarray(store['t'][start:start + chunk_rows], dtype=np.float64)
+        t = t[np.isfinite(t) & (t > 0)]
+        if t.size:
+            lo, hi = min(lo, np.log10(t.min())), max(hi, np.log10(t.max()))
+    if not np.isfinite(lo):
+        raise ValueError(f"{data_path} has no positive reduced temperatures")
+    if hi <= lo:
+        lo, hi = lo - 0.5, hi + 0.5
+    scale = base_bins / (hi - lo)
+    
+    counts = {p: np.zeros(base_bins, dtype=np.int64) for p in PHASES}
+    mins = {p: {s: np.full(base_bins, np.inf) for s in series} for p in PHASES}
+    maxs = {p: {s: np.full(base_bins, -np.inf) for s in series} for p in PHASES}
+    for start in range(0, store.n_rows, chunk_rows):
+        stop = min(start + chunk_rows, store.n_rows)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_t = np.log10(np.asarray(store['t'][start:stop], dtype=np.float64))
+        valid = np.isfinite(log_t)
+        bins = np.clip(((log_t[valid] - lo) * scale).astype(np.int64), 0, base_bins - 1)
+        if 'T' in store:
+            superfluid = np.asarray(store['T'][start:stop])[valid] < T_lambda
+        else:
+            superfluid = np.ones(bins.size, dtype=bool)
+        values = {s: np.asarray(store[s][start:stop], dtype=np.float64)[valid] for s in series}
+        for phase, mask in zip(PHASES, (superfluid, ~superfluid)):
+            b = bins[mask]
+            counts[phase] += np.bincount(b, minlength=base_bins)
+            for s in series:
+                v = values[s][mask]
+                np.minimum.at(mins[phase][s], b, v)
+                np.maximum.at(maxs[phase][s], b, v)
+        count('pyramid_rows', stop - start)
+    
+    root = os.path.join(data_path, PYRAMID_NAME)
+    shutil.rmtree(root, ignore_errors=True)
+    n_levels = 0
+    for phase in PHASES:
+        level_count = counts[phase]
+        empty = level_count == 0
+        level_min = {s: np.where(empty, np.nan, v) for s, v in mins[phase].items()}
+        level_max = {s: np.where(empty, np.nan, v) for s, v in maxs[phase].items()}
+        level = 0
+        while True:
+            columns = {'count': level_count}
+            for s in series:
+                columns[f'{s}_min'] = level_min[s]
+                columns[f'{s}_max'] = level_max[s]
+            dtypes = {name: v.dtype for name, v in columns.items()}
+            with ColumnWriter(_level_path(root, phase, level), list(columns),
+                              {'level': level, 'n_bins': level_count.size}, dtypes) as writer:
+                writer.append(columns)
+            if level_count.size == 1:
+                break
+            level_count, level_min, level_max = _reduce_level(level_count, level_min, level_max)
+            level += 1
+        n_levels = level + 1
+    
+    index = {
+        'source': source_fingerprint(data_path),
+        'series': series,
+        'phases': list(PHASES),
+        'log_t_min': float(lo),
+        'log_t_max': float(hi),
+        'base_bins': base_bins,
+        'tile_bins': TILE_BINS,
+        'n_levels': n_levels,
+        'n_rows': store.n_rows,
+        'T_lambda': T_lambda,
+        'counts': {p: int(counts[p].sum()) for p in PHASES},
+    }
+    tmp = os.path.join(root, INDEX_NAME + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp, os.path.join(root, INDEX_NAME))
+    return index
+
+def load_pyramid(data_path, rebuild=False):
+    """
+    Return the pyramid index of a result set, building it when missing.
+    
+    A pyramid whose recorded source fingerprint no longer matches the
+    result set (re-analysis, appended points) is rebuilt.
+    """
+    path = os.path.join(data_path, PYRAMID_NAME, INDEX_NAME)
+    if not rebuild and os.path.isfile(path):
+        with open(path) as f:
+            index = json.load(f)
+        if index.get('source') == source_fingerprint(data_path):
+            return index
+    return build_pyramid(data_path)
+
+def _json_values(values):
+    """List of floats with non-finite entries as None (strict JSON)."""
+    values = np.asarray(values, dtype=np.float64)
+    if np.isfinite(values).all():
+        return values.tolist()
+    return np.where(np.isfinite(values), values, None).tolist()
+
+class TileCache:
+    """Thread-safe LRU cache of pyramid tiles."""
+    
+    def __init__(self, max_tiles=TILE_CACHE_TILES):
+        self.max_tiles = max_tiles
+        self.hits = 0
+        self.misses = 0
+        self._tiles = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, load):
+        """Cached tile for `key`, loaded with `load()` on a miss."""
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+                self.hits += 1
+                return tile
+            self.misses += 1
+        tile = load()
+        with self._lock:
+            self._tiles[key] = tile
+            self._tiles.move_to_end(key)
+            while len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+        return tile
+    
+    def __len__(self):
+        return len(self._tiles)
+
+class KappaExplorer:
+    """Window queries over the min/max pyramids of a result set."""
+    
+    def __init__(self, data_path, max_tiles=TILE_CACHE_TILES, rebuild=False):
+        """
+        Open (building if needed) the pyramid of a result set.
+        
+        Parameters
+        ----------
+        data_path : str
+            Binary result set (kappa_analysis.kbin).
+        max_tiles : int
+            Capacity of the in-memory tile cache.
+        rebuild : bool
+            Rebuild the pyramid even if it is up to date.
+        """
+        self.data_path = data_path
+        self.index = load_pyramid(data_path, rebuild)
+        self.metadata = open_columns(data_path).metadata
+        self.cache = TileCache(max_tiles)
+        root = os.path.join(data_path, PYRAMID_NAME)
+        self._levels = {(phase, level): open_columns(_level_path(root, phase, level))
+                        for phase in self.index['phases']
+                        for level in range(self.index['n_levels'])}
+    
+    def n_bins(self, level):
+        return self.index['base_bins'] >> level
+    
+    def tile(self, phase, level, i):
+        """
+        Bins [i × TILE_BINS, (i + 1) × TILE_BINS) of one level.
+        
+        Returns
+        -------
+        dict
+            'count' and '<series>_min' / '<series>_max' arrays.
+        """
+        if (phase, level) not in self._levels:
+            raise ValueError(f"no pyramid level {level} for phase '{phase}'")
+        
+        def load():
+            store = self._levels[(phase, level)]
+            tile_bins = self.index['tile_bins']
+            return {name: np.array(store[name][i * tile_bins:(i + 1) * tile_bins])
+                    for name in store.columns}
+        
+        return self.cache.get((phase, level, i), load)
+    
+    def window(self, t_min=None, t_max=None, max_points=WINDOW_MAX_POINTS,
+               phase='superfluid', series=None):
+        """
+        Min/max envelope of the series over a reduced-temperature window.
+        
+        The finest level whose bins in the window fit the point budget is
+        used; each non-empty bin contributes its minimum and maximum.
+        
+        Parameters
+        ----------
+        t_min, t_max : float, optional
+            Window in reduced temperature (defaults to the full range).
+        max_points : int
+            Point budget per series (two points per bin).
+        phase : str
+            'superfluid' or 'normal'.
+        series : sequence of str, optional
+            Series to return (defaults to all).
+            
+        Returns
+        -------
+        dict
+            'level', 'log_t' (bin centers), 'count' and per-series 'min' /
+            'max' lists.
+        """
+        index = self.index
+        series = list(series or index['series'])
+        unknown = set(series) - set(index['series'])
+        if unknown:
+            raise ValueError(f"unknown series: {sorted(unknown)}")
+        if phase not in index['phases']:
+            raise ValueError(f"phase must be one of {index['phases']}, got '{phase}'")
+        if (t_min is not None and t_min <= 0) or (t_max is not None and t_max <= 0):
+            raise ValueError("t_min and t_max must be positive")
+        lo, hi = index['log_t_min'], index['log_t_max']
+        a = lo if t_min is None else max(lo, np.log10(t_min))
+        b = hi if t_max is None else min(hi, np.log10(t_max))
+        max_bins = max(1, int(max_points) // 2)
+        
+        for level in range(index['n_levels']):
+            n_bins = self.n_bins(level)
+            width = (hi - lo) / n_bins
+            i0 = int(np.clip(np.floor((a - lo) / width), 0, n_bins))
+            i1 = int(np.clip(np.ceil((b - lo) / width), i0, n_bins))
+            if i1 - i0 <= max_bins:
+                break
+        
+        tile_bins = index['tile_bins']
+        tiles = [self.tile(phase, level, i)
+                 for i in range(i0 // tile_bins, -(-i1 // tile_bins))]
+        offset = (i0 // tile_bins) * tile_bins
+        
+        def column(name):
+            if not tiles:
+                return np.empty(0)
+            return np.concatenate([tile[name] for tile in tiles])[i0 - offset:i1 - offset]
+        
+        counts = column('count')
+        keep = np.flatnonzero(counts > 0)
+        centers = lo + (i0 + keep + 0.5) * width
+        return {
+            'phase': phase,
+            'level': level,
+            'bin_width': width,
+            'log_t': _json_values(centers),
+            'count': counts[keep].tolist(),
+            'series': {s: {'min': _json_values(column(f'{s}_min')[keep]),
+                           'max': _json_values(column(f'{s}_max')[keep])}
+                       for s in series},
+        }
+    
+    def info(self):
+        """Pyramid index plus run metadata and cache statistics."""
+        return dict(self.index, metadata=self.metadata,
+                    cache={'tiles': len(self.cache), 'hits': self.cache.hits,
+                           'misses': self.cache.misses})
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>κ explorer</title>
+<style>body{font-family:serif;margin:1em}canvas{border:1px solid #aaa}</style></head>
+<body>
+<h3>He-II λ-transition κ explorer</h3>
+<label>series <select id="series"></select></label>
+<label>phase <select id="phase"></select></label>
+<button id="reset">full range</button> <span id="status"></span><br>
+<canvas id="plot" width="1000" height="500"></canvas>
+<p>Drag to zoom into a log t range; double-click to zoom out.</p>
+<script>
+const cv = document.getElementById('plot'), ctx = cv.getContext('2d');
+let info, view, drag = null;
+async function get(url) { return (await fetch(url)).json(); }
+function px(x, a, b, w) { return (x - a) / (b - a) * w; }
+async function draw() {
+  const s = document.getElementById('series').value, p = document.getElementById('phase').value;
+  const q = `/api/window?t_min=${10 ** view[0]}&t_max=${10 ** view[1]}` +
+            `&max_points=${2 * cv.width}&phase=${p}&series=${s}`;
+  const t0 = performance.now(), w = await get(q);
+  const lo = w.series[s].min, hi = w.series[s].max;
+  const ys = lo.concat(hi).filter(v => v !== null);
+  const y0 = Math.min(...ys), y1 = Math.max(...ys) + 1e-300;
+  ctx.clearRect(0, 0, cv.width, cv.height);
+  ctx.strokeStyle = '#1f77b4';
+  ctx.beginPath();
+  w.log_t.forEach((x, i) => {
+    if (lo[i] === null) return;
+    const X = px(x, view[0], view[1], cv.width);
+    ctx.moveTo(X, cv.height - px(lo[i], y0, y1, cv.height));
+    ctx.lineTo(X, cv.height - px(hi[i], y0, y1, cv.height) - 1);
+  });
+  ctx.stroke();
+  document.getElementById('status').textContent =
+    `log10 t ∈ [${view[0].toFixed(3)}, ${view[1].toFixed(3)}]  ${s} ∈ [${y0.toPrecision(5)}, ` +
+    `${y1.toPrecision(5)}]  level ${w.level}, ${w.log_t.length} bins, ` +
+    `${(performance.now() - t0).toFixed(1)} ms`;
+}
+cv.onmousedown = e => { drag = e.offsetX; };
+cv.onmouseup = e => {
+  if (drag === null) return;
+  const a = Math.min(drag, e.offsetX), b = Math.max(drag, e.offsetX);
+  drag = null;
+  if (b - a < 3) return;
+  const span = view[1] - view[0];
+  view = [view[0] + span * a / cv.width, view[0] + span * b / cv.width];
+  draw();
+};
+cv.ondblclick = () => {
+  const c = (view[0] + view[1]) / 2, h = view[1] - view[0];
+  view = [Math.max(info.log_t_min, c - h), Math.min(info.log_t_max, c + h)];
+  draw();
+};
+document.getElementById('reset').onclick = () => { view = [info.log_t_min, info.log_t_max]; draw(); };
+(async () => {
+  info = await get('/api/info');
+  for (const [id, items] of [['series', info.series], ['phase', info.phases]])
+    for (const v of items) document.getElementById(id).add(new Option(v, v));
+  document.getElementById('series').onchange = draw;
+  document.getElementById('phase').onchange = draw;
+  view = [info.log_t_min, info.log_t_max];
+  draw();
+})();
+</script></body></html>
+"""
+
+def _handler(explorer):
+    """Request handler class bound to one explorer."""
+    
+    class Handler(BaseHTTPRequestHandler):
+        
+        def _send(self, status, body, content_type='application/json'):
+            if not isinstance(body, bytes):
+                body = json.dumps(body, allow_nan=False).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            parts = url.path.strip('/').split('/')
+            start = time.perf_counter()
+            try:
+                if url.path in ('/', '/index.html'):
+                    return self._send(200, PAGE.encode(), 'text/html; charset=utf-8')
+                if url.path == '/api/info':
+                    body = explorer.info()
+                elif url.path == '/api/window':
+                    series = query.get('series')
+                    body = explorer.window(
+                        float(query['t_min']) if 't_min' in query else None,
+                        float(query['t_max']) if 't_max' in query else None,
+                        int(query.get('max_points', WINDOW_MAX_POINTS)),
+                        query.get('phase', 'superfluid'),
+                        series.split(',') if series else None)
+                elif parts[:2] == ['api', 'tile'] and len(parts) == 5:
+                    tile = explorer.tile(parts[2], int(parts[3]), int(parts[4]))
+                    body = {name: _json_values(v) for name, v in tile.items()}
+                else:
+                    return self._send(404, {'error': f'not found: {url.path}'})
+            except ValueError as exc:
+                return self._send(400, {'error': str(exc)})
+            body['elapsed_ms'] = (time.perf_counter() - start) * 1e3
+            self._send(200, body)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    return Handler
+
+def serve(data_path, host='127.0.0.1', port=8050, rebuild=False):
+    """
+    Serve the explorer for a result set until interrupted.
+    
+    Parameters
+    ----------
+    data_path : str
+        Binary result set (kappa_analysis.kbin).
+    host : str
+        Interface to bind (local only by default).
+    port : int
+        TCP port.
+    rebuild : bool
+        Rebuild the pyramid even if it is up to date.
+    """
+    with span('open_explorer'):
+        explorer = KappaExplorer(data_path, rebuild=rebuild)
+    server = ThreadingHTTPServer((host, port), _handler(explorer))
+    print(f"Serving {data_path} at http://{host}:{server.server_address[1]}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+def main():
+    """Explorer command line."""
+    parser = argparse.ArgumentParser(
+        description='Serve an interactive κ explorer for a binary result set.')
+    parser.add_argument('data_path', help='result set (kappa_analysis.kbin)')
+    parser.add_argument('--host', default='127.0.0.1', help='interface to bind')
+    parser.add_argument('--port', type=int, default=8050, help='TCP port')
+    parser.add_argument('--rebuild', action='store_true', help='rebuild the pyramid')
+    parser.add_argument('--trace', nargs='?', const='1', default=os.environ.get(TRACE_ENV),
+                        metavar='PATH', help='trace the service (Chrome trace JSON at PATH)')
+    args = parser.parse_args()
+    if args.trace:
+        enable(None if args.trace == '1' else args.trace)
+    
+    serve(args.data_path, args.host, args.port, args.rebuild)
+
+if __name__ == '__main__':
+    main()
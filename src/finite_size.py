@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+System Classification: A.3 He-II λ-Transition κ Analysis
+Author: Oleksii Onasenko
+Developer: SubstanceNet
+Theoretical Framework: The Emergence Parameter κ ≈ 1: An Empirical Signature 
+                       of Criticality in Physical and Biological Systems
+
+Copyright 2025 Oleksii Onasenko
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Finite-size κ(t, L): the complexity ratio A/A_c away from the
+thermodynamic limit.
+
+For a system of linear size L the order cannot develop beyond L, so A/A_c
+is replaced by a crossover function g(L/ξ(t)) of the finite-size scaling
+variable, with g → 1 for L ≫ ξ (recovering κ∞(t)) and g → 0 for ξ ≫ L:
+
+    κ(t, L) = g(L/ξ(t)) × κ∞(t),    ξ(t) = ξ0 t^(-ν)
+
+κ is evaluated over (L, t) grids in blocks of bounded size; ξ(t) and κ∞(t)
+are computed once per temperature grid and shared by all sizes.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from kappa_analyzer import (NU, SWEEP_MAX_BYTES, T_LAMBDA, T_REF, ZETA, _kappa_block,
+                            _sweep_geometry)
+from tracing import count, traced
+
+XI0 = 1.0  # Correlation-length amplitude; sizes L are in the units of ξ0
+
+# Temperature grids whose ξ(t) arrays are kept per engine
+XI_CACHE_SIZE = 8
+
+# Bins of the scaling variable in collapse diagnostics
+COLLAPSE_BINS = 256
+
+def _exponential(y):
+    """g(y) = 1 - exp(-y), in place."""
+    np.negative(y, out=y)
+    np.expm1(y, out=y)
+    np.negative(y, out=y)
+
+def _tanh(y):
+    """g(y) = tanh(y), in place."""
+    np.tanh(y, out=y)
+
+def _rational(y):
+    """g(y) = y / (1 + y), in place."""
+    with np.errstate(invalid='ignore'):
+        np.divide(y, y + 1.0, out=y)
+    np.copyto(y, 1.0, where=np.isinf(y))
+
+# Crossover functions g(L/ξ) of A/A_c, evaluated in place
+CROSSOVERS = {
+    'exponential': _exponential,
+    'tanh': _tanh,
+    'rational': _rational,
+}
+
+class FiniteSizeScaling:
+    """κ(t, L) over ensembles of system sizes with a finite-size crossover."""
+    
+    def __init__(self, T_lambda=T_LAMBDA, zeta=ZETA, nu=NU, xi0=XI0,
+                 crossover='exponential', t_ref=T_REF, max_bytes=SWEEP_MAX_BYTES,
+                 cache_size=XI_CACHE_SIZE):
+        """
+        Initialize the engine.
+        
+        Parameters
+        ----------
+        T_lambda : float
+            Lambda point temperature.
+        zeta, nu : float
+            Superfluid density and correlation length exponents.
+        xi0 : float
+            Correlation-length amplitude, in the units of L.
+        crossover : str
+            Crossover function g of A/A_c (see `CROSSOVERS`).
+        t_ref : float
+            Reference reduced temperature (κ∞ = 1 at t = t_ref).
+        max_bytes : int
+            Working-set cap per (L, t) block.
+        cache_size : int
+            Temperature grids whose ξ(t) arrays are cached.
+        """
+        if crossover not in CROSSOVERS:
+            raise ValueError(f"crossover must be one of {sorted(CROSSOVERS)}, got '{crossover}'")
+        if xi0 <= 0:
+            raise ValueError(f"xi0 must be positive, got {xi0}")
+        self.T_lambda = T_lambda
+        self.zeta = zeta
+        self.nu = nu
+        self.xi0 = xi0
+        self.crossover = crossover
+        self.t_ref = t_ref
+        self.max_bytes = max_bytes
+        self.cache_size = cache_size
+        self._xi_cache = OrderedDict()
+    
+    def xi_arrays(self, T):
+        """
+        Temperature-only factors of κ(t, L), cached per temperature grid.
+        
+        Parameters
+        ----------
+        T : array_like
+            Temperature grid in Kelvin.
+            
+        Returns
+        -------
+        dict
+            't', 'inv_xi' (1/ξ(t), zero at and above T_λ) and 'kappa_inf'
+            (κ in the thermodynamic limit), each of shape (n,).
+        """
+        T = np.ascontiguousarray(T, dtype=np.float64).ravel()
+        key = hashlib.blake2b(memoryview(T), digest_size=16).hexdigest()
+        entry = self._xi_cache.get(key)
+        if entry is not None:
+            self._xi_cache.move_to_end(key)
+            count('xi_cache_hits')
+            return entry
+        
+        t = np.abs(1.0 - T / self.T_lambda)
+        superfluid = T < self.T_lambda
+        inv_xi = np.zeros_like(T)
+        np.power(t, self.nu, out=inv_xi, where=superfluid)
+        inv_xi /= self.xi0
+        kappa_inf = np.empty((1, T.size))
+        _kappa_block(T, np.array([[self.T_lambda]]), np.array([[self.zeta - self.nu]]),
+                     self.t_ref, kappa_inf)
+        np.copyto(kappa_inf[0], 0.0, where=~superfluid)  # also NaN temperatures
+        
+        entry = {'t': t, 'inv_xi': inv_xi, 'kappa_inf': kappa_inf[0]}
+        self._xi_cache[key] = entry
+        while len(self._xi_cache) > self.cache_size:
+            self._xi_cache.popitem(last=False)
+        return entry
+    
+    def _blocks(self, L, xi, n_arrays=1):
+        """(L slice, t slice, g block) over the grid, g = g(L/ξ) written in place."""
+        L = np.asarray(L, dtype=np.float64).ravel()
+        if np.any(~(L > 0)):
+            raise ValueError("system sizes L must be positive")
+        inv_xi = xi['inv_xi']
+        rows, cols = _sweep_geometry(L.size, inv_xi.size, self.max_bytes // n_arrays, 8)
+        buffer = np.empty(rows * cols)
+        g = CROSSOVERS[self.crossover]
+        for i in range(0, L.size, rows):
+            p = slice(i, min(i + rows, L.size))
+            for j in range(0, inv_xi.size, cols):
+                q = slice(j, min(j + cols, inv_xi.size))
+                block = buffer[:(p.stop - p.start) * (q.stop - q.start)]
+                block = block.reshape(p.stop - p.start, q.stop - q.start)
+                np.multiply(L[p, None], inv_xi[q], out=block)
+                g(block)
+                yield p, q, block
+    
+    def iter_kappa(self, L, T):
+        """
+        Iterate over blocks of the κ(L, t) grid.
+        
+        Parameters
+        ----------
+        L : array_like
+            System sizes, shape (m,).
+        T : array_like
+            Temperature grid in Kelvin, shape (n,).
+            
+        Yields
+        ------
+        tuple
+            (L_slice, T_slice, block) with `block` of shape
+            (len(L_slice), len(T_slice)). The buffer is reused between
+            iterations.
+        """
+        xi = self.xi_arrays(T)
+        for p, q, block in self._blocks(L, xi):
+            np.multiply(block, xi['kappa_inf'][q], out=block)
+            yield p, q, block
+    
+    @traced('finite_size_kappa')
+    def kappa(self, L, T, out=None, dtype=np.float64):
+        """
+        Evaluate κ(t, L) over a grid of sizes and temperatures.
+        
+        Parameters
+        ----------
+        L : array_like
+            System sizes, shape (m,).
+        T : array_like
+            Temperature grid in Kelvin, shape (n,).
+        out : ndarray, optional
+            Preallocated (m, n) output, e.g. an `np.memmap` for grids that
+            do not fit in RAM.
+        dtype : dtype
+            Output dtype when `out` is not given.
+            
+        Returns
+        -------
+        ndarray
+            κ of shape (m, n); zero at and above T_λ.
+        """
+        shape = (np.size(L), np.size(T))
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        elif out.shape != shape:
+            raise ValueError(f"out has shape {out.shape}, expected {shape}")
+        for p, q, block in self.iter_kappa(L, T):
+            out[p, q] = block
+        count('kappa_points', shape[0] * shape[1])
+        return out
+    
+    def t_crossover(self, L):
+        """Reduced temperature where ξ(t) = L, i.e. t = (L/ξ0)^(-1/ν)."""
+        return np.power(np.asarray(L, dtype=np.float64) / self.xi0, -1.0 / self.nu)
+    
+    @traced('finite_size_summary')
+    def size_summary(self, L, T):
+        """
+        Per-size reductions of κ(t, L) without materializing the grid.
+        
+        Parameters
+        ----------
+        L : array_like
+            System sizes, shape (m,).
+        T : array_like
+            Temperature grid in Kelvin, shape (n,).
+            
+        Returns
+        -------
+        dict
+            Arrays of shape (m,): 'L', 't_crossover', 'kappa_mean' (over
+            T < T_λ), 'kappa_max', 't_at_max' and 'A_ratio_at_t_ref'
+            (g at t = t_ref).
+        """
+        L = np.asarray(L, dtype=np.float64).ravel()
+        xi = self.xi_arrays(T)
+        n_super = np.count_nonzero(np.asarray(T, dtype=np.float64).ravel() < self.T_lambda)
+        total = np.zeros(L.size)
+        peak = np.full(L.size, -np.inf)
+        t_peak = np.full(L.size, np.nan)
+        for p, q, block in self.iter_kappa(L, T):
+            total[p] += block.sum(axis=1)
+            arg = block.argmax(axis=1)
+            value = block[np.arange(block.shape[0]), arg]
+            better = value > peak[p]
+            peak[p] = np.where(better, value, peak[p])
+            t_peak[p] = np.where(better, xi['t'][q][arg], t_peak[p])
+        
+        A_ratio = L * (np.power(self.t_ref, self.nu) / self.xi0)
+        CROSSOVERS[self.crossover](A_ratio)
+        count('kappa_points', L.size * np.size(T))
+        return {
+            'L': L,
+            't_crossover': self.t_crossover(L),
+            'kappa_mean': total / max(n_super, 1),
+            'kappa_max': peak,
+            't_at_max': t_peak,
+            'A_ratio_at_t_ref': A_ratio,
+        }
+    
+    @traced('finite_size_collapse')
+    def collapse(self, L, T, kappa=None, A_ratio=None, nu=None, n_bins=COLLAPSE_BINS):
+        """
+        Data-collapse diagnostics of A/A_c = κ(t, L)/κ∞(t).
+        
+        For each trial exponent ν' the points are binned in the scaling
+        variable x = log10 t + log10(L/ξ0)/ν'. The pooled within-bin
+        variance measures how far the sizes are from one curve. Relative to
+        the total variance it is about 0 for a perfect collapse and 1 for
+        none. The grid is streamed in blocks.
+        
+        A/A_c is taken from an observed grid when one is given and from the
+        engine's crossover model otherwise. An observed `kappa` is divided by
+        the engine's κ∞(t); pass `A_ratio` instead when κ∞ is known
+        independently. Non-finite observed values are treated as missing.
+        
+        Parameters
+        ----------
+        L : array_like
+            System sizes, shape (m,).
+        T : array_like
+            Temperature grid in Kelvin, shape (n,); only T < T_λ is used.
+        kappa : array_like, optional
+            Observed κ(t, L), shape (m, n), e.g. an `np.memmap`; it is read
+            one block at a time.
+        A_ratio : array_like, optional
+            Observed A/A_c, shape (m, n), instead of `kappa`.
+        nu : float or array_like, optional
+            Trial correlation-length exponents (defaults to the engine ν).
+        n_bins : int
+            Bins of the scaling variable.
+            
+        Returns
+        -------
+        dict
+            'nu' (trials), 'residual' (pooled within-bin variance),
+            'quality' (residual / total variance), 'best_nu', 'n_points',
+            and for the best trial the collapsed curve: 'x' (bin centers),
+            'A_ratio_mean', 'A_ratio_std' and 'bin_count'.
+        """
+        L = np.asarray(L, dtype=np.float64).ravel()
+        T = np.asarray(T, dtype=np.float64).ravel()
+        if kappa is not None and A_ratio is not None:
+            raise ValueError("pass either kappa or A_ratio, not both")
+        observed = kappa if kappa is not None else A_ratio
+        if observed is not None and np.shape(observed) != (L.size, T.size):
+            raise ValueError(f"observed grid has shape {np.shape(observed)}, "
+                             f"expected {(L.size, T.size)}")
+        columns = np.flatnonzero(T < self.T_lambda)
+        T = T[columns]
+        trials = np.atleast_1d(np.asarray(self.nu if nu is None else nu, dtype=np.float64))
+        if T.size == 0:
+            raise ValueError("collapse diagnostics need temperatures below T_lambda")
+        
+        xi = self.xi_arrays(T)
+        log_t = np.log10(xi['t'])
+        log_L = np.log10(L / self.xi0)
+        lo = log_t.min() + np.minimum(log_L.min() / trials, log_L.max() / trials)
+        hi = log_t.max() + np.maximum(log_L.min() / trials, log_L.max() / trials)
+        hi = np.where(hi > lo, hi, lo + 1.0)
+        scale = n_bins / (hi - lo)
+        
+        sums = np.zeros((trials.size, 3, n_bins))
+        # Block temporaries: g (or the observed block), x, bin index and g²
+        for p, q, block in self._blocks(L, xi, n_arrays=4 if observed is None else 5):
+            valid = None
+            if observed is not None:
+                block[...] = observed[p][:, columns[q]]
+                if kappa is not None:
+                    np.divide(block, xi['kappa_inf'][q], out=block)
+                valid = np.isfinite(block).ravel()
+                if valid.all():
+                    valid = None
+            weights = block.ravel() if valid is None else block.ravel()[valid]
+            squares = np.square(weights)
+            x = np.empty_like(block)
+            for k in range(trials.size):
+                np.add(log_L[p, None] / trials[k], log_t[q], out=x)
+                np.subtract(x, lo[k], out=x)
+                np.multiply(x, scale[k], out=x)
+                idx = x.astype(np.intp).ravel()
+                np.clip(idx, 0, n_bins - 1, out=idx)
+                if valid is not None:
+                    idx = idx[valid]
+                sums[k, 0] += np.bincount(idx, minlength=n_bins)
+                sums[k, 1] += np.bincount(idx, weights=weights, minlength=n_bins)
+                sums[k, 2] += np.bincount(idx, weights=squares, minlength=n_bins)
+        
+        n, s1, s2 = sums[:, 0], sums[:, 1], sums[:, 2]
+        n_points = n[0].sum()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = s1 / n
+            var = np.maximum(s2 / n - mean**2, 0.0)
+        used = n >= 2
+        residual = np.where(used, n * var, 0.0).sum(axis=1) / np.where(used, n, 0).sum(axis=1)
+        grand_mean = s1[0].sum() / n_points
+        total_var = max(s2[0].sum() / n_points - grand_mean**2, 0.0)
+        quality = residual / total_var if total_var > 0 else np.zeros_like(residual)
+        best = int(np.argmin(residual))
+        
+        filled = n[best] > 0
+        centers = lo[best] + (np.arange(n_bins) + 0.5) / scale[best]
+        return {
+            'nu': trials,
+            'residual': residual,
+            'quality': quality,
+            'best_nu': float(trials[best]),
+            'n_points': int(n_points),
+            'x': centers[filled],
+            'A_ratio_mean': mean[best][filled],
+            'A_ratio_std': np.sqrt(var[best][filled]),
+            'bin_count': n[best][filled].astype(np.int64),
+        }
@@ -28,9 +28,16 @@ Data sources:
 """
 
 import numpy as np
-import pandas as pd
 import os
 
+from kappa_stats import KappaAccumulator, SortedTIndex, accumulate
+from result_cache import ResultCache, cache_key
+from results_io import (BINARY_NAME, COLUMNS, BackgroundWriter, ColumnWriter,
+                        is_column_store, open_columns, write_columns)
+from tracing import count, count_bytes, enable_from_args, iter_spans, span, traced
+
+__version__ = '2.1.0.dev0'
+
 # Physical constants and critical exponents
 T_LAMBDA = 2.1768  # K (lambda point at vapor pressure, Lipa et al., 2003)
 
@@ -44,10 +51,265 @@ NU = 0.6717        # Correlation length exponent (XY universality class)
 ALPHA = -0.0127    # Specific heat exponent (experimental)
                    # Lipa et al. (2003), Table II, direct measurement
 
+T_REF = 0.01       # Reference reduced temperature for κ normalization (κ = 1)
+
+PROBE_WIDTH = 0.1  # Relative half-width of windowed κ queries (|t - t0| < 0.1 t0)
+
+# Lambda line T_λ(P), P in bar:
+P_SVP = 0.0504             # Saturated vapor pressure at T_λ
+P_UPPER_LAMBDA = 30.05     # Upper λ point, where the λ-line meets the melting curve
+LAMBDA_LINE_COEFFS = (T_LAMBDA, -0.0111, -8.9e-5)
+                           # Quadratic in (P - P_SVP): approximate smooth
+                           # representation ending near 1.763 K at the upper
+                           # λ point; use a measured table for precision work
+
+# Working-set cap for batched exponent sweeps (bytes)
+SWEEP_MAX_BYTES = 256 * 1024**2
+
+# Points per chunk in the streaming pipeline
+STREAM_CHUNK_SIZE = 1_000_000
+
+# Columns checked by the adaptive sampler unless told otherwise
+ADAPTIVE_OBSERVABLES = ('kappa', 'rho_s', 'xi_norm')
+
+# Column dtypes of the compact precision mode: T stays float64 (t near T_λ
+# is derived from it), the derived columns are stored as float32
+COMPACT_DTYPES = {'T': np.float64, 't': np.float32, 'kappa': np.float32,
+                  'rho_s': np.float32, 'xi_norm': np.float32}
+PRECISIONS = ('double', 'compact')
+
+# Stored column per measured quantity accepted by load_measurements
+MEASURED_COLUMNS = {'T': 'T', 'rho_s': 'rho_s_measured', 'C': 'heat_capacity'}
+
+def _kappa_block(T, T_lambda, exponent, t_ref, out):
+    """
+    Evaluate the closed form κ = (t/t_ref)^(ζ-ν) into a preallocated block.
+    
+    Parameters
+    ----------
+    T : ndarray
+        Temperature segment, shape (n,).
+    T_lambda : ndarray
+        Lambda temperatures, shape (p, 1).
+    exponent : ndarray
+        Exponent differences ζ - ν, shape (p, 1).
+    t_ref : float
+        Reference reduced temperature.
+    out : ndarray
+        Output block, shape (p, n). Overwritten in place.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(T, T_lambda, out=out)
+        np.subtract(1.0, out, out=out)
+        np.abs(out, out=out)
+        np.divide(out, t_ref, out=out)
+        np.power(out, exponent, out=out)
+    np.copyto(out, 0.0, where=T >= T_lambda)
+
+class LambdaLine:
+    """Pressure dependence of the lambda temperature, T_λ(P)."""
+    
+    def __init__(self, P=None, T=None):
+        """
+        Initialize λ-line.
+        
+        Parameters
+        ----------
+        P, T : array_like, optional
+            Tabulated pressures (bar, ascending) and lambda temperatures (K),
+            interpolated linearly. Without a table the quadratic
+            LAMBDA_LINE_COEFFS representation is used on [P_SVP, P_UPPER_LAMBDA].
+        """
+        if (P is None) != (T is None):
+            raise ValueError("P and T must be given together")
+        if P is None:
+            self.P = self.T = None
+            self.P_range = (P_SVP, P_UPPER_LAMBDA)
+        else:
+            self.P = np.asarray(P, dtype=float)
+            self.T = np.asarray(T, dtype=float)
+            if self.P.shape != self.T.shape or np.any(np.diff(self.P) <= 0):
+                raise ValueError("λ-line table needs matching, strictly ascending pressures")
+            self.P_range = (self.P[0], self.P[-1])
+    
+    def __call__(self, P):
+        """
+        Evaluate T_λ(P).
+        
+        Parameters
+        ----------
+        P : array_like
+            Pressure in bar.
+            
+        Returns
+        -------
+        ndarray
+            Lambda temperature in Kelvin (NaN outside the λ-line range).
+        """
+        P = np.asarray(P, dtype=float)
+        if self.P is None:
+            x = P - P_SVP
+            T_lambda = np.polynomial.polynomial.polyval(x, LAMBDA_LINE_COEFFS)
+        else:
+            T_lambda = np.interp(P, self.P, self.T)
+        inside = (P >= self.P_range[0]) & (P <= self.P_range[1])
+        return np.where(inside, T_lambda, np.nan)
+
+def compact_columns(columns, dtypes=COMPACT_DTYPES):
+    """
+    Cast analysis columns to compact dtypes and measure the rounding error.
+    
+    Parameters
+    ----------
+    columns : dict
+        Float64 column arrays.
+    dtypes : dict
+        Target dtype per column; other columns are returned unchanged.
+        
+    Returns
+    -------
+    tuple
+        (columns, errors): the cast columns and, per narrowed column, the
+        maximum absolute ('max_abs') and relative ('max_rel', over nonzero
+        values) error against the float64 values.
+    """
+    cast, errors = {}, {}
+    for name, values in columns.items():
+        dtype = np.dtype(dtypes.get(name, values.dtype))
+        cast[name] = values.astype(dtype, copy=False)
+        if dtype.itemsize < values.dtype.itemsize:
+            error = np.abs(cast[name] - values)
+            nonzero = values != 0
+            errors[name] = {
+                'max_abs': float(error.max(initial=0.0)),
+                'max_rel': float(np.max(error / np.abs(values), initial=0.0,
+                                        where=nonzero)),
+            }
+    return cast, errors
+
+def _merge_errors(total, errors):
+    """Fold per-chunk `compact_columns` errors into running maxima."""
+    for name, error in errors.items():
+        seen = total.setdefault(name, {'max_abs': 0.0, 'max_rel': 0.0})
+        for key, value in error.items():
+            seen[key] = max(seen[key], value)
+    return total
+
+def _ascending(T):
+    """Whether temperatures are non-decreasing, i.e. searchable with searchsorted."""
+    return bool(np.all(T[1:] >= T[:-1]))
+
+def _csv_sink(f):
+    """`BackgroundWriter` sink appending batches to an open CSV file."""
+    import pandas as pd
+    
+    header = [f.tell() == 0]
+    
+    def sink(batch):
+        with span('to_csv', n_points=len(batch['T'])):
+            pd.DataFrame(batch).to_csv(f, header=header[0], index=False)
+        header[0] = False
+    return sink
+
+def _sweep_geometry(n_params, n_T, max_bytes, itemsize):
+    """Rows (parameter sets) and columns (temperatures) per sweep block."""
+    # Each element costs one output value plus one byte of phase mask
+    budget = max(1, int(max_bytes) // (itemsize + 1))
+    if n_T <= budget:
+        return max(1, min(n_params, budget // max(n_T, 1))), n_T
+    return 1, budget
+
+def iter_kappa_sweep(T, zeta=ZETA, nu=NU, T_lambda=T_LAMBDA, t_ref=T_REF,
+                     max_bytes=SWEEP_MAX_BYTES):
+    """
+    Iterate over blocks of the batched κ tensor.
+    
+    The exponent arrays are broadcast against each other; every block holds
+    κ for a run of flattened parameter sets over a run of temperatures and
+    never exceeds `max_bytes` of working memory.
+    
+    Parameters
+    ----------
+    T : array_like
+        Temperature grid in Kelvin, shape (n,).
+    zeta, nu, T_lambda : array_like
+        Exponents and lambda temperatures, broadcast to a common shape S.
+    t_ref : float
+        Reference reduced temperature (κ = 1 at t = t_ref).
+    max_bytes : int
+        Upper bound on the size of one block.
+        
+    Yields
+    ------
+    tuple
+        (param_slice, T_slice, block) where `block` has shape
+        (len(param_slice), len(T_slice)) and indexes the flattened parameter
+        shape S. The block buffer is reused between iterations.
+    """
+    T = np.asarray(T, dtype=float).ravel()
+    zeta, nu, T_lambda = np.broadcast_arrays(
+        np.asarray(zeta, dtype=float), np.asarray(nu, dtype=float),
+        np.asarray(T_lambda, dtype=float))
+    exponent = (zeta - nu).reshape(-1, 1)
+    T_lambda = T_lambda.reshape(-1, 1)
+    n_params, n_T = exponent.shape[0], T.size
+    
+    rows, cols = _sweep_geometry(n_params, n_T, max_bytes, T.itemsize)
+    buffer = np.empty(rows * cols)
+    for i in range(0, n_params, rows):
+        p = slice(i, min(i + rows, n_params))
+        for j in range(0, n_T, cols):
+            q = slice(j, min(j + cols, n_T))
+            block = buffer[:(p.stop - p.start) * (q.stop - q.start)]
+            block = block.reshape(p.stop - p.start, q.stop - q.start)
+            _kappa_block(T[q], T_lambda[p], exponent[p], t_ref, block)
+            yield p, q, block
+
+def kappa_sweep(T, zeta=ZETA, nu=NU, T_lambda=T_LAMBDA, t_ref=T_REF,
+                max_bytes=SWEEP_MAX_BYTES, out=None):
+    """
+    Evaluate κ over a grid of exponents and lambda temperatures.
+    
+    Uses the closed form κ = (t/t_ref)^(ζ-ν) for T < T_λ and κ = 0 otherwise,
+    i.e. one `power` per element. Work is split into blocks of at most
+    `max_bytes`, written directly into `out`.
+    
+    Parameters
+    ----------
+    T : array_like
+        Temperature grid in Kelvin, shape (n,).
+    zeta, nu, T_lambda : array_like
+        Exponents and lambda temperatures, broadcast to a common shape S.
+    t_ref : float
+        Reference reduced temperature (κ = 1 at t = t_ref).
+    max_bytes : int
+        Working-set cap per block.
+    out : ndarray, optional
+        Output of shape S + (n,) (float64 or float32), e.g. an `np.memmap`
+        for sweeps that do not fit in RAM. Allocated as float64 if omitted.
+        
+    Returns
+    -------
+    ndarray
+        κ tensor of shape S + (n,).
+    """
+    T = np.asarray(T, dtype=float).ravel()
+    shape = np.broadcast_shapes(np.shape(zeta), np.shape(nu), np.shape(T_lambda))
+    if out is None:
+        out = np.empty(shape + (T.size,))
+    elif out.shape != shape + (T.size,):
+        raise ValueError(f"out has shape {out.shape}, expected {shape + (T.size,)}")
+    
+    flat = out.reshape(-1, T.size)
+    for p, q, block in iter_kappa_sweep(T, zeta, nu, T_lambda, t_ref, max_bytes):
+        flat[p, q] = block
+    
+    return out
+
 class HeliumLambdaAnalyzer:
     """Analyzer for emergence parameter κ in He-II λ-transition."""
     
-    def __init__(self, T_lambda=T_LAMBDA):
+    def __init__(self, T_lambda=T_LAMBDA, zeta=ZETA, nu=NU, cache=None, precision='double'):
         """
         Initialize analyzer.
         
@@ -55,9 +317,29 @@ class HeliumLambdaAnalyzer:
         ----------
         T_lambda : float
             Lambda transition temperature in Kelvin.
+        zeta : float
+            Superfluid density exponent ζ.
+        nu : float
+            Correlation length exponent ν.
+        cache : result_cache.ResultCache, optional
+            On-disk cache for synthetic data and analysis results.
+        precision : {'double', 'compact'}
+            Storage of generated data: all float64, or T in float64 and the
+            derived columns in float32 (24 instead of 40 bytes per point).
+            The maximum compact-mode rounding error per column is kept in
+            `precision_error`.
         """
+        if precision not in PRECISIONS:
+            raise ValueError(f"precision must be one of {', '.join(PRECISIONS)}")
         self.T_lambda = T_lambda
+        self.zeta = zeta
+        self.nu = nu
+        self.cache = cache
+        self.precision = precision
+        self.precision_error = {}
         self.data = None
+        self._cached = None
+        self._index = None
         
     def reduced_temperature(self, T):
         """
@@ -91,7 +373,7 @@ class HeliumLambdaAnalyzer:
         array_like
             Normalized superfluid density.
         """
-        return np.power(t, ZETA)
+        return np.power(t, self.zeta)
     
     def correlation_length(self, t):
         """
@@ -109,8 +391,9 @@ class HeliumLambdaAnalyzer:
         array_like
             Normalized correlation length.
         """
-        return np.power(t, -NU)
+        return np.power(t, -self.nu)
     
+    @traced('calculate_kappa')
     def calculate_kappa(self, T):
         """
         Calculate emergence parameter κ with normalization.
@@ -127,6 +410,7 @@ class HeliumLambdaAnalyzer:
         tuple
             (kappa, reduced_temperature)
         """
+        count('kappa_points', np.size(T))
         t = self.reduced_temperature(T)
         mask = T < self.T_lambda
         kappa = np.zeros_like(T)
@@ -138,15 +422,47 @@ class HeliumLambdaAnalyzer:
             kappa_raw = tau_raw * xi_raw
             
             # Normalize to κ = 1 at reference point
-            t_ref = 0.01
-            tau_ref = np.power(t_ref, ZETA)
-            xi_ref = np.power(t_ref, -NU)
+            tau_ref = np.power(T_REF, self.zeta)
+            xi_ref = np.power(T_REF, -self.nu)
             kappa_ref = tau_ref * xi_ref
             
             kappa[mask] = kappa_raw / kappa_ref
         
         return kappa, t
     
+    @traced('calculate_kappa_parallel')
+    def calculate_kappa_parallel(self, T, workers=None, block_size=None, with_t=True):
+        """
+        Calculate κ across worker processes over shared memory.
+        
+        Bit-identical to `calculate_kappa`. T, κ and t live in one
+        shared-memory block that workers write in place, so no per-worker
+        copies are made.
+        
+        Parameters
+        ----------
+        T : array_like
+            Temperature in Kelvin.
+        workers : int, optional
+            Worker processes (defaults to the CPU count).
+        block_size : int, optional
+            Points per worker task.
+        with_t : bool
+            Keep the reduced temperature in the grid.
+        
+        Returns
+        -------
+        SharedGrid
+            Arrays 'T', 'kappa' and (with `with_t`) 't'; call `close()`
+            or use it as a context manager to release the memory.
+        """
+        from parallel_kappa import PARALLEL_BLOCK_SIZE, calculate_kappa_shared
+        
+        count('kappa_points', np.size(T))
+        return calculate_kappa_shared(T, self.T_lambda, self.zeta, self.nu, workers=workers,
+                                      block_size=block_size or PARALLEL_BLOCK_SIZE,
+                                      with_t=with_t)
+    
     def theoretical_kappa_scaling(self, t):
         """
         Calculate theoretical scaling κ ∝ t^(ζ-ν).
@@ -161,37 +477,108 @@ class HeliumLambdaAnalyzer:
         array_like
             Normalized κ values.
         """
-        exponent = ZETA - NU
+        exponent = self.zeta - self.nu
         kappa_raw = np.power(t, exponent)
         
-        t_ref = 0.01
-        kappa_ref = np.power(t_ref, exponent)
+        kappa_ref = np.power(T_REF, exponent)
         
         return kappa_raw / kappa_ref
     
-    def generate_synthetic_data(self, n_points=100):
+    @traced('sweep_exponents')
+    def sweep_exponents(self, T, zeta=None, nu=None, T_lambda=None,
+                        max_bytes=SWEEP_MAX_BYTES, out=None):
         """
-        Generate synthetic data for κ analysis.
+        Calculate κ over batches of (ζ, ν, T_λ) in one broadcast computation.
         
         Parameters
         ----------
-        n_points : int
-            Number of data points.
+        T : array_like
+            Temperature grid in Kelvin.
+        zeta, nu, T_lambda : array_like, optional
+            Parameter grids; omitted ones default to the analyzer values.
+        max_bytes : int
+            Working-set cap per block.
+        out : ndarray, optional
+            Preallocated output (see `kappa_sweep`).
             
         Returns
         -------
-        DataFrame
-            Analysis data.
+        ndarray
+            κ tensor with the broadcast parameter shape followed by len(T).
+        """
+        return kappa_sweep(T,
+                           self.zeta if zeta is None else zeta,
+                           self.nu if nu is None else nu,
+                           self.T_lambda if T_lambda is None else T_lambda,
+                           max_bytes=max_bytes, out=out)
+    
+    @traced('pressure_kappa_grid')
+    def pressure_kappa_grid(self, P, T, lambda_line=None, max_bytes=SWEEP_MAX_BYTES,
+                            out=None, dtype=np.float64):
+        """
+        Evaluate κ over a (P, T) grid along the pressure-dependent λ-line.
+        
+        T_λ(P) is broadcast against the temperature grid in one batched
+        sweep; there is no loop over pressures.
+        
+        Parameters
+        ----------
+        P : array_like
+            Pressures in bar, shape (m,).
+        T : array_like
+            Temperatures in Kelvin, shape (n,).
+        lambda_line : LambdaLine, optional
+            λ-line (the default quadratic representation if omitted).
+        max_bytes : int
+            Working-set cap per block.
+        out : ndarray, optional
+            Preallocated (m, n) output, e.g. an `np.memmap`.
+        dtype : dtype
+            Output dtype when `out` is not given (float32 halves memory).
+            
+        Returns
+        -------
+        tuple
+            (kappa, T_lambda): κ of shape (m, n), NaN rows for pressures
+            outside the λ-line range, and T_λ(P) of shape (m,).
+        """
+        P = np.asarray(P, dtype=float).ravel()
+        T = np.asarray(T, dtype=float).ravel()
+        T_lambda = (lambda_line or LambdaLine())(P)
+        if out is None:
+            out = np.empty((P.size, T.size), dtype=dtype)
+        
+        kappa_sweep(T, self.zeta, self.nu, T_lambda, max_bytes=max_bytes, out=out)
+        
+        return out, T_lambda
+    
+    def _grid_segments(self, n_points):
+        """
+        Synthetic temperature grid as (spacing, start, stop, num) segments.
+        
+        Half of the points are linear from 0.5 K, half logarithmic over the
+        last 10 mK below T_λ; segments are in ascending temperature order.
         """
         T_min = 0.5
         T_max = self.T_lambda - 1e-9
         
-        T_near = np.logspace(np.log10(T_max - 0.01), np.log10(T_max), n_points//2)
-        T_far = np.linspace(T_min, T_max - 0.01, n_points//2)
-        
-        T = np.concatenate([T_far, T_near])
-        T = np.sort(T)
+        return [('linear', T_min, T_max - 0.01, n_points//2),
+                ('log', np.log10(T_max - 0.01), np.log10(T_max), n_points//2)]
+    
+    def _derived_columns(self, T):
+        """
+        Evaluate t, κ, ρ_s and normalized ξ on a temperature array.
         
+        Parameters
+        ----------
+        T : ndarray
+            Temperature in Kelvin.
+            
+        Returns
+        -------
+        tuple
+            (t, kappa, rho_s, xi_norm)
+        """
         kappa, t = self.calculate_kappa(T)
         
         rho_s = np.zeros_like(T)
@@ -202,29 +589,410 @@ class HeliumLambdaAnalyzer:
             t_super = t[mask]
             rho_s[mask] = self.superfluid_density(t_super)
             
-            t_ref = 0.01
             xi_raw = self.correlation_length(t_super)
-            xi_ref = self.correlation_length(t_ref)
+            xi_ref = self.correlation_length(T_REF)
             xi_norm[mask] = xi_raw / xi_ref
         
-        self.data = pd.DataFrame({
-            'T': T,
-            't': t,
-            'kappa': kappa,
-            'rho_s': rho_s,
-            'xi_norm': xi_norm
-        })
+        return t, kappa, rho_s, xi_norm
+    
+    def _store_columns(self, columns, reset=False):
+        """
+        Apply the storage precision to a dict of float64 columns.
+        
+        In compact mode the rounding error is folded into `precision_error`
+        (restarted when `reset` is set).
+        """
+        if reset:
+            self.precision_error = {}
+        if self.precision == 'double':
+            return columns
+        columns, errors = compact_columns(columns)
+        _merge_errors(self.precision_error, errors)
+        return columns
+    
+    def _storage_dtypes(self):
+        """Column dtypes of written result sets."""
+        return COMPACT_DTYPES if self.precision == 'compact' else None
+    
+    @traced('generate_synthetic_data')
+    def generate_synthetic_data(self, n_points=100):
+        """
+        Generate synthetic data for κ analysis.
+        
+        Parameters
+        ----------
+        n_points : int
+            Number of data points.
+            
+        Returns
+        -------
+        DataFrame
+            Analysis data.
+        """
+        import pandas as pd
+        
+        key = self._cache_key('synthetic', n_points) if self.cache is not None else None
+        if key is not None:
+            store = self.cache.get_data(key)
+            if store is not None:
+                self.data = store.to_frame()
+                self.precision_error = store.metadata.get('precision_error', {})
+                self._cached = (key, self.data)
+                return self.data
+        
+        (_, lin_start, lin_stop, n_lin), (_, log_start, log_stop, n_log) = \
+            self._grid_segments(n_points)
+        
+        T_near = np.logspace(log_start, log_stop, n_log)
+        T_far = np.linspace(lin_start, lin_stop, n_lin)
+        
+        T = np.concatenate([T_far, T_near])
+        T = np.sort(T)
+        
+        t, kappa, rho_s, xi_norm = self._derived_columns(T)
+        
+        with span('dataframe_build', n_points=len(T)):
+            self.data = pd.DataFrame(self._store_columns({
+                'T': T,
+                't': t,
+                'kappa': kappa,
+                'rho_s': rho_s,
+                'xi_norm': xi_norm
+            }, reset=True))
+        
+        if key is not None:
+            self.cache.put_data(key, self.data, self.metadata())
+            self._cached = (key, self.data)
         
         return self.data
     
-    def analyze(self, output_dir='../results'):
+    def _cache_key(self, kind, n_points):
+        """Content key of a synthetic run (see `result_cache.cache_key`)."""
+        return cache_key(kind=kind, T_lambda=self.T_lambda, zeta=self.zeta,
+                         nu=self.nu, alpha=ALPHA, n_points=n_points,
+                         grid=self._grid_segments(n_points), t_ref=T_REF,
+                         precision=self.precision, version=__version__)
+    
+    def _data_key(self):
+        """Cache key of the current data, if it came from a keyed run."""
+        if self.cache is None or self._cached is None or self._cached[1] is not self.data:
+            return None
+        return self._cached[0]
+    
+    @traced('generate_adaptive_data')
+    def generate_adaptive_data(self, tol=1e-3, t_min=1e-9, T_min=0.5, n_initial=32,
+                               max_points=100_000, observables=ADAPTIVE_OBSERVABLES):
+        """
+        Generate data on a grid refined only where the observables curve.
+        
+        Starting from `n_initial` points uniform in log t, every interval is
+        bisected in log t; the midpoint is kept, and the two halves are
+        refined further while the midpoint deviates from the linear
+        interpolation of its neighbours by more than `tol` (relative) for
+        any observable.
+        
+        Because the grid is packed near T_λ, every point carries a 'weight'
+        column: the width in T of the interval between the midpoints to its
+        neighbours. `analyze()` uses weighted moments on such data, so its
+        summary statistics match those of a dense uniform grid in T.
+        
+        Parameters
+        ----------
+        tol : float
+            Relative interpolation error tolerance.
+        t_min : float
+            Smallest reduced temperature sampled.
+        T_min : float
+            Lowest temperature in Kelvin (largest t).
+        n_initial : int
+            Points of the coarse starting grid.
+        max_points : int
+            Upper bound on the number of evaluated points.
+        observables : sequence of str or callable
+            Column names, or callables mapping the column dict
+            (T, t, kappa, rho_s, xi_norm) to an array.
+            
+        Returns
+        -------
+        DataFrame
+            Analysis data sorted by temperature, with a 'weight' column.
+        """
+        import pandas as pd
+        
+        def evaluate(log_t):
+            T = self.T_lambda * (1.0 - np.power(10.0, log_t))
+            t, kappa, rho_s, xi_norm = self._derived_columns(T)
+            columns = {'T': T, 't': t, 'kappa': kappa, 'rho_s': rho_s, 'xi_norm': xi_norm}
+            values = np.array([columns[o] if isinstance(o, str) else o(columns)
+                               for o in observables], dtype=float)
+            return columns, values
+        
+        log_t = np.linspace(np.log10(t_min), np.log10(1.0 - T_min / self.T_lambda), n_initial)
+        columns, values = evaluate(log_t)
+        chunks = [columns]
+        n_points = n_initial
+        
+        # Active intervals as (left, right) log t endpoints with observable values
+        left, right = log_t[:-1], log_t[1:]
+        f_left, f_right = values[:, :-1], values[:, 1:]
+        while left.size and n_points < max_points:
+            take = min(left.size, max_points - n_points)
+            left, right = left[:take], right[:take]
+            f_left, f_right = f_left[:, :take], f_right[:, :take]
+            
+            mid = 0.5 * (left + right)
+            columns, f_mid = evaluate(mid)
+            chunks.append(columns)
+            n_points += mid.size
+            
+            with np.errstate(invalid='ignore', divide='ignore'):
+                error = np.abs(f_mid - 0.5 * (f_left + f_right))
+                error /= np.maximum(np.abs(f_mid), np.finfo(float).tiny)
+            refine = np.any(error > tol, axis=0)
+            
+            left = np.concatenate([left[refine], mid[refine]])
+            right = np.concatenate([mid[refine], right[refine]])
+            f_left = np.concatenate([f_left[:, refine], f_mid[:, refine]], axis=1)
+            f_right = np.concatenate([f_mid[:, refine], f_right[:, refine]], axis=1)
+        
+        merged = {name: np.concatenate([c[name] for c in chunks]) for name in chunks[0]}
+        order = np.argsort(merged['T'], kind='stable')
+        merged = {name: column[order] for name, column in merged.items()}
+        
+        # Temperature interval represented by each point (midpoint rule)
+        edges = np.concatenate([merged['T'][:1], 0.5 * (merged['T'][1:] + merged['T'][:-1]),
+                                merged['T'][-1:]])
+        weight = np.diff(edges)
+        
+        self.data = pd.DataFrame(self._store_columns(merged, reset=True))
+        self.data['weight'] = weight
+        
+        return self.data
+    
+    @traced('load_measurements')
+    def load_measurements(self, path, output_path=None, columns=None, sep=None,
+                          chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Load a measurement table into a columnar binary result set.
+        
+        The file is parsed in chunks with float64 dtypes; rows with a
+        missing, non-finite or non-positive temperature are dropped, and
+        repeated temperatures are dropped (first occurrence kept) within a
+        chunk and against the preceding chunk, which covers sorted tables
+        and logs of successive sweeps. t, κ, ρ_s and ξ_norm are evaluated
+        per chunk exactly as for synthetic data, so peak memory is about
+        two chunks regardless of file size.
+        
+        Parameters
+        ----------
+        path : str
+            Delimited text file (compressed files are read transparently);
+            lines starting with '#' are comments.
+        output_path : str, optional
+            Result set directory (`path` with a .kbin extension if omitted).
+        columns : dict, optional
+            Source column name per quantity: 'T' (required), and optionally
+            'rho_s' (measured superfluid fraction) and 'C' (heat capacity),
+            stored as 'rho_s_measured' and 'heat_capacity'. Defaults to
+            {'T': 'T'}.
+        sep : str, optional
+            Field delimiter (commas for .csv files, whitespace otherwise).
+        chunk_size : int
+            Rows parsed per chunk.
+            
+        Returns
+        -------
+        DataFrame
+            Analysis data, memory-mapped from the result set.
+        """
+        import pandas as pd
+        
+        columns = dict(columns or {'T': 'T'})
+        if 'T' not in columns:
+            raise ValueError("columns must name the temperature column ('T')")
+        unknown = set(columns) - set(MEASURED_COLUMNS)
+        if unknown:
+            raise ValueError(f"unknown measurement quantities: {', '.join(sorted(unknown))}")
+        
+        if output_path is None:
+            output_path = os.path.splitext(path)[0] + '.kbin'
+        if sep is None:
+            sep = ',' if '.csv' in os.path.basename(path).lower() else r'\s+'
+        
+        source = {name: quantity for quantity, name in columns.items()}
+        stored = COLUMNS + tuple(MEASURED_COLUMNS[q] for q in columns if q != 'T')
+        self.precision_error = {}
+        reader = pd.read_csv(path, sep=sep, comment='#', usecols=list(source),
+                             dtype={name: np.float64 for name in source},
+                             chunksize=chunk_size)
+        
+        counts = {'n_rows_read': 0, 'n_invalid': 0, 'n_duplicates': 0}
+        previous = np.empty(0)
+        monotonic = True
+        last_T = -np.inf
+        metadata = dict(self.metadata(), source=os.path.abspath(path))
+        n_rows = 0
+        writer = BackgroundWriter(ColumnWriter(output_path, stored, metadata,
+                                               self._storage_dtypes()))
+        with writer:
+            for frame in iter_spans(reader, 'read_csv'):
+                values = {source[name]: frame[name].to_numpy(np.float64)
+                          for name in frame.columns}
+                T = values['T']
+                counts['n_rows_read'] += T.size
+                
+                valid = np.isfinite(T) & (T > 0)
+                counts['n_invalid'] += int(T.size - valid.sum())
+                
+                # First occurrence within the chunk, then against the previous chunk
+                unique, first = np.unique(T[valid], return_index=True)
+                keep = np.flatnonzero(valid)[np.sort(first)]
+                keep = keep[~np.isin(T[keep], previous)]
+                counts['n_duplicates'] += int(valid.sum() - keep.size)
+                previous = unique
+                
+                T = T[keep]
+                if T.size:
+                    monotonic &= bool(T[0] > last_T and np.all(np.diff(T) > 0))
+                    last_T = T[-1]
+                
+                t, kappa, rho_s, xi_norm = self._derived_columns(T)
+                chunk = self._store_columns({'T': T, 't': t, 'kappa': kappa,
+                                             'rho_s': rho_s, 'xi_norm': xi_norm})
+                for quantity in columns:
+                    if quantity != 'T':
+                        chunk[MEASURED_COLUMNS[quantity]] = values[quantity][keep]
+                with span('write_wait'):
+                    writer.append(chunk)
+                n_rows += T.size
+            
+            writer.metadata.update(counts, n_rows=n_rows, sorted=monotonic)
+            writer.metadata.update(self.metadata())
+        
+        count_bytes(output_path)
+        self.data = open_columns(output_path).to_frame()
+        self._cached = None
+        
+        return self.data
+    
+    def iter_synthetic_chunks(self, n_points=100, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Generate the synthetic grid of `generate_synthetic_data` in chunks.
+        
+        Grid points are computed from their indices (same arithmetic as
+        `np.linspace`/`np.logspace`), so memory stays flat in `n_points`.
+        
+        Parameters
+        ----------
+        n_points : int
+            Total number of data points.
+        chunk_size : int
+            Maximum number of points per chunk.
+            
+        Yields
+        ------
+        dict
+            Column arrays 'T', 't', 'kappa', 'rho_s', 'xi_norm', in the
+            storage precision (compact-mode errors accumulate in
+            `precision_error`).
+        """
+        for spacing, start, stop, num in self._grid_segments(n_points):
+            step = (stop - start) / (num - 1) if num > 1 else 0.0
+            for i in range(0, num, chunk_size):
+                idx = np.arange(i, min(i + chunk_size, num), dtype=float)
+                y = idx * step + start
+                if i + len(idx) == num and num > 1:
+                    y[-1] = stop
+                T = np.power(10.0, y) if spacing == 'log' else y
+                
+                t, kappa, rho_s, xi_norm = self._derived_columns(T)
+                yield self._store_columns({'T': T, 't': t, 'kappa': kappa,
+                                           'rho_s': rho_s, 'xi_norm': xi_norm})
+    
+    def metadata(self):
+        """
+        Run parameters stored alongside binary results.
+        
+        Returns
+        -------
+        dict
+            T_λ, exponents and normalization reference; in compact mode
+            also the precision and its maximum rounding errors.
+        """
+        metadata = {
+            'T_lambda': self.T_lambda,
+            'zeta': self.zeta,
+            'nu': self.nu,
+            'alpha': ALPHA,
+            't_ref': T_REF,
+        }
+        if self.precision != 'double':
+            metadata['precision'] = self.precision
+            metadata['precision_error'] = self.precision_error
+        return metadata
+    
+    def t_index(self):
+        """
+        Sorted reduced-temperature index over the superfluid points.
+        
+        Built once per data set and reused by `kappa_at` and `analyze()`.
+        
+        Returns
+        -------
+        SortedTIndex
+        """
+        if self._index is None or self._index[1] is not self.data:
+            T = self.data['T'].values
+            mask = T < self.T_lambda
+            self._index = (SortedTIndex(self.data['t'].values[mask],
+                                        self.data['kappa'].values[mask]), self.data)
+        return self._index[0]
+    
+    def kappa_at(self, t_values, width=PROBE_WIDTH, method='window'):
+        """
+        Query κ at arbitrary reduced temperatures.
+        
+        Parameters
+        ----------
+        t_values : array_like
+            Probe points t0.
+        width : float
+            Relative half-width of the averaging window (|t - t0| < width t0).
+        method : {'window', 'interp'}
+            Windowed mean of the data points or linear interpolation in t.
+            
+        Returns
+        -------
+        ndarray
+            κ per probe point (NaN where no data).
+        """
+        if self.data is None:
+            self.generate_synthetic_data()
+        
+        t_values = np.asarray(t_values, dtype=float)
+        if method == 'window':
+            return self.t_index().window_mean(t_values, width * t_values)
+        if method == 'interp':
+            return self.t_index().interpolate(t_values)
+        raise ValueError(f"unknown method '{method}'")
+    
+    @traced('analyze')
+    def analyze(self, output_dir='../results', export_csv=True, probes=None):
         """
         Perform complete κ analysis.
         
+        Data are written as a columnar binary result set
+        (kappa_analysis.kbin, see `results_io`) and, optionally, as CSV.
+        
         Parameters
         ----------
         output_dir : str
             Output directory path.
+        export_csv : bool
+            Also write kappa_analysis.csv.
+        probes : sequence of float, optional
+            Extra reduced temperatures at which windowed κ is reported
+            (results['kappa_at_probes'], see `kappa_at`).
             
         Returns
         -------
@@ -234,66 +1002,421 @@ class HeliumLambdaAnalyzer:
         if self.data is None:
             self.generate_synthetic_data()
         
-        mask = self.data['T'] < self.T_lambda
-        data_super = self.data[mask]
+        probes = None if probes is None else [float(p) for p in probes]
+        key = self._data_key()
+        if key is not None and probes:
+            key = cache_key(data=key, probes=probes)
+        results = self.cache.get_results(key) if key is not None else None
+        if results is not None:
+            if 'kappa_at_probes' in results:
+                results['kappa_at_probes'] = {float(p): v for p, v in
+                                              results['kappa_at_probes'].items()}
+            if not self._outputs_current(output_dir, key, export_csv):
+                self._write_outputs(output_dir, results, export_csv, key)
+            else:
+                print(f"Results unchanged in {output_dir}/ (cache hit)")
+            return results
         
-        kappa_mean = data_super['kappa'].mean()
-        kappa_std = data_super['kappa'].std()
-        kappa_min = data_super['kappa'].min()
-        kappa_max = data_super['kappa'].max()
+        weights = self.data['weight'].values if 'weight' in self.data else None
+        with span('accumulate', n_points=len(self.data)):
+            acc = accumulate(self.data['T'].values, self.data['t'].values,
+                             self.data['kappa'].values, self.T_lambda, weights=weights)
+        results = self._results_from(acc)
+        if probes:
+            results['kappa_at_probes'] = dict(zip(probes, self.kappa_at(probes).tolist()))
         
-        kappa_at_001 = data_super[np.abs(data_super['t'] - 0.01) < 0.001]['kappa'].mean()
-        kappa_at_01 = data_super[np.abs(data_super['t'] - 0.1) < 0.01]['kappa'].mean()
+        if key is not None:
+            self.cache.put_results(key, results)
         
-        results = {
-            'T_lambda': self.T_lambda,
-            'zeta': ZETA,
-            'nu': NU,
-            'zeta_minus_nu': ZETA - NU,
-            'kappa_mean': kappa_mean,
-            'kappa_std': kappa_std,
-            'kappa_min': kappa_min,
-            'kappa_max': kappa_max,
-            'kappa_at_t_001': kappa_at_001,
-            'kappa_at_t_01': kappa_at_01,
-            'n_points': len(data_super),
-            'T_range': (data_super['T'].min(), data_super['T'].max())
-        }
+        self._write_outputs(output_dir, results, export_csv, key, acc)
         
+        return results
+    
+    def _write_outputs(self, output_dir, results, export_csv, key=None, acc=None):
+        """Write data files and summary for `analyze()`."""
         os.makedirs(output_dir, exist_ok=True)
         
-        self.data.to_csv(f'{output_dir}/kappa_analysis.csv', index=False)
+        metadata = self.metadata()
+        if key is not None:
+            metadata['cache_key'] = key
+        if acc is not None:
+            metadata['kappa_state'] = acc.state()
+        metadata['segments'] = [{'rows': len(self.data),
+                                 'sorted': _ascending(self.data['T'].values)}]
+        with span('write_kbin'):
+            # Analysis columns first, then any others (weights, measurements)
+            columns = COLUMNS + tuple(name for name in self.data.columns if name not in COLUMNS
+                                      and np.issubdtype(self.data[name].dtype, np.number))
+            write_columns(f'{output_dir}/{BINARY_NAME}', self.data, metadata, columns)
+        count_bytes(f'{output_dir}/{BINARY_NAME}')
+        if export_csv:
+            with span('to_csv'):
+                self.data.to_csv(f'{output_dir}/kappa_analysis.csv', index=False)
+            count_bytes(f'{output_dir}/kappa_analysis.csv')
+        
+        with span('write_summary'):
+            self._write_summary(output_dir, results)
         
+        self._report_outputs(output_dir, export_csv)
+    
+    @traced('append_points')
+    def append_points(self, T, output_dir='../results', export_csv=None):
+        """
+        Extend an analyzed result set with new temperature points.
+        
+        Only the new points are evaluated. They are written as one
+        append-only, T-sorted segment of the binary result set (and appended
+        to the CSV), and the statistics persisted in the result-set header
+        are updated with them, so the cost is O(new points). A result set
+        without stored statistics (e.g. written on a cache hit) is reduced
+        once on its first append. Points whose temperature is already
+        stored are skipped.
+        
+        Parameters
+        ----------
+        T : array_like
+            Temperatures to add, in Kelvin.
+        output_dir : str
+            Directory of a previous `analyze()` or `analyze_streaming()`.
+        export_csv : bool, optional
+            Append to kappa_analysis.csv (default: if it exists).
+            
+        Returns
+        -------
+        dict
+            Analysis results over the extended set, as returned by
+            `analyze()` without probes.
+        """
+        path = f'{output_dir}/{BINARY_NAME}'
+        store = open_columns(path)
+        if 'weight' in store:
+            raise ValueError(f"{path} holds a weighted (adaptive) grid; point weights "
+                             "depend on the neighbours, so regenerate it instead of appending")
+        for name, value in self.metadata().items():
+            if name in ('T_lambda', 'zeta', 'nu', 't_ref') and store.metadata.get(name) != value:
+                raise ValueError(f"{path} was analyzed with {name} = "
+                                 f"{store.metadata.get(name)}, not {value}")
+        
+        segments = store.metadata.get('segments') or [{'rows': store.n_rows, 'sorted': None}]
+        state = store.metadata.get('kappa_state')
+        if state is not None:
+            acc = KappaAccumulator.from_state(state)
+        else:
+            with span('accumulate', n_points=store.n_rows):
+                acc = accumulate(store['T'], store['t'], store['kappa'], self.T_lambda)
+        
+        # New, distinct temperatures not stored in any segment
+        T = np.unique(np.asarray(T, dtype=float).ravel())
+        T = T[np.isfinite(T) & (T > 0)]
+        start = 0
+        for segment in segments:
+            stored_T = store['T'][start:start + segment['rows']]
+            if segment['sorted'] is None:
+                segment['sorted'] = _ascending(stored_T)
+            if segment['sorted']:
+                pos = np.minimum(np.searchsorted(stored_T, T), max(stored_T.size - 1, 0))
+                T = T[stored_T[pos] != T] if stored_T.size else T
+            else:
+                T = T[~np.isin(T, stored_T)]
+            start += segment['rows']
+        
+        # Evaluate in float64, then round to the stored dtypes before reducing
+        t, kappa, rho_s, xi_norm = self._derived_columns(T)
+        columns = {'T': T, 't': t, 'kappa': kappa, 'rho_s': rho_s, 'xi_norm': xi_norm}
+        for name in store.columns:
+            columns.setdefault(name, np.full(T.size, np.nan))
+        chunk, errors = compact_columns(columns, {name: store[name].dtype
+                                                  for name in store.columns})
+        accumulate(chunk['T'], chunk['t'], chunk['kappa'], self.T_lambda, acc=acc)
+        
+        with span('write_kbin', n_points=T.size), ColumnWriter.append_to(path) as writer:
+            writer.append(chunk)
+            if T.size:
+                segments.append({'rows': int(T.size), 'sorted': True})
+            writer.metadata.pop('cache_key', None)
+            if errors:
+                writer.metadata['precision_error'] = _merge_errors(
+                    writer.metadata.get('precision_error', {}), errors)
+            writer.metadata.update(segments=segments, kappa_state=acc.state())
+        count_bytes(path)
+        
+        import pandas as pd
+        
+        csv_path = f'{output_dir}/kappa_analysis.csv'
+        if export_csv is None:
+            export_csv = os.path.exists(csv_path)
+        if export_csv and T.size:
+            with span('to_csv'), open(csv_path, 'a', newline='') as f:
+                pd.DataFrame(chunk).to_csv(f, header=f.tell() == 0, index=False)
+        
+        # Owned copy: the result set may be rewritten by a later analyze()
+        store = open_columns(path)
+        self.data = pd.DataFrame({name: np.array(store[name]) for name in store.columns})
+        self._cached = None
+        self.precision_error = writer.metadata.get('precision_error', {})
+        
+        results = self._results_from(acc)
+        self._write_summary(output_dir, results)
+        
+        print(f"Appended {T.size} points to {output_dir}/ ({results['n_points']} superfluid points)")
+        return results
+    
+    def _outputs_current(self, output_dir, key, export_csv):
+        """True if `output_dir` already holds the outputs of cache entry `key`."""
+        path = f'{output_dir}/{BINARY_NAME}'
+        if not is_column_store(path) or open_columns(path).metadata.get('cache_key') != key:
+            return False
+        if not os.path.exists(f'{output_dir}/analysis_summary.txt'):
+            return False
+        return not export_csv or os.path.exists(f'{output_dir}/kappa_analysis.csv')
+    
+    @traced('analyze_streaming')
+    def analyze_streaming(self, n_points, output_dir='../results',
+                          chunk_size=STREAM_CHUNK_SIZE, export_csv=True):
+        """
+        Perform κ analysis over a synthetic grid without holding it in memory.
+        
+        Chunks from `iter_synthetic_chunks` are reduced incrementally into
+        the summary statistics while a `BackgroundWriter` thread appends the
+        previous ones to the binary result set and the CSV, so computation
+        and disk I/O overlap. `self.data` is left untouched.
+        
+        Parameters
+        ----------
+        n_points : int
+            Total number of data points.
+        output_dir : str
+            Output directory path.
+        chunk_size : int
+            Maximum number of points per chunk.
+        export_csv : bool
+            Also write kappa_analysis.csv.
+            
+        Returns
+        -------
+        dict
+            Analysis results, as returned by `analyze()`.
+        """
+        acc = KappaAccumulator()
+        self.precision_error = {}
+        
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Chunks are written by a background thread while the next is computed
+        csv_file = open(f'{output_dir}/kappa_analysis.csv', 'w', newline='') if export_csv else None
+        try:
+            writer = BackgroundWriter(
+                ColumnWriter(f'{output_dir}/{BINARY_NAME}', COLUMNS, self.metadata(),
+                             self._storage_dtypes()),
+                sinks=[_csv_sink(csv_file)] if csv_file is not None else [])
+            with writer:
+                # Sortedness across chunks, recorded for later appends
+                n_rows, ascending, last_T = 0, True, -np.inf
+                chunks = iter_spans(self.iter_synthetic_chunks(n_points, chunk_size),
+                                    'synthetic_chunk')
+                for chunk in chunks:
+                    with span('accumulate'):
+                        acc.update(chunk['T'], chunk['t'], chunk['kappa'],
+                                   chunk['T'] < self.T_lambda)
+                    if chunk['T'].size:
+                        ascending = (ascending and chunk['T'][0] >= last_T
+                                     and _ascending(chunk['T']))
+                        last_T = chunk['T'][-1]
+                        n_rows += chunk['T'].size
+                    with span('write_wait'):
+                        writer.append(chunk)
+                writer.metadata.update(self.metadata(), kappa_state=acc.state(),
+                                       segments=[{'rows': n_rows, 'sorted': ascending}])
+        finally:
+            if csv_file is not None:
+                csv_file.close()
+        
+        results = self._results_from(acc)
+        
+        count_bytes(f'{output_dir}/{BINARY_NAME}')
+        if export_csv:
+            count_bytes(f'{output_dir}/kappa_analysis.csv')
+        self._write_summary(output_dir, results)
+        
+        self._report_outputs(output_dir, export_csv)
+        
+        return results
+    
+    def _results_from(self, acc):
+        """
+        Build the `analyze()` results dict from a single-row accumulator.
+        
+        Parameters
+        ----------
+        acc : KappaAccumulator
+            Statistics over the superfluid points.
+            
+        Returns
+        -------
+        dict
+            Analysis results.
+        """
+        stats = {key: value[0] for key, value in acc.finalize().items()}
+        return {
+            'T_lambda': self.T_lambda,
+            'zeta': self.zeta,
+            'nu': self.nu,
+            'zeta_minus_nu': self.zeta - self.nu,
+            'kappa_mean': stats['kappa_mean'],
+            'kappa_std': stats['kappa_std'],
+            'kappa_min': stats['kappa_min'],
+            'kappa_max': stats['kappa_max'],
+            'kappa_at_t_001': stats['kappa_at_t_001'],
+            'kappa_at_t_01': stats['kappa_at_t_01'],
+            'n_points': int(stats['n_points']),
+            'T_range': (stats['T_min'], stats['T_max'])
+        }
+    
+    def _report_outputs(self, output_dir, export_csv):
+        """Print the list of written result files."""
+        print(f"Results saved to {output_dir}/")
+        print(f"  - {BINARY_NAME}")
+        if export_csv:
+            print(f"  - kappa_analysis.csv")
+        print(f"  - analysis_summary.txt")
+    
+    def _write_summary(self, output_dir, results):
+        """
+        Write analysis_summary.txt for a results dict.
+        
+        Parameters
+        ----------
+        output_dir : str
+            Output directory path.
+        results : dict
+            Analysis results.
+        """
         with open(f'{output_dir}/analysis_summary.txt', 'w') as f:
             f.write("System A.3: He-II λ-Transition - κ Analysis Summary\n")
             f.write("="*60 + "\n\n")
             f.write(f"Lambda Point: T_λ = {self.T_lambda:.4f} K\n\n")
             f.write("Critical Exponents (from Lipa et al., 2003):\n")
-            f.write(f"  ζ (superfluid density) = {ZETA:.4f}\n")
+            f.write(f"  ζ (superfluid density) = {self.zeta:.4f}\n")
             f.write(f"    Source: Goldner et al. (1992), Table I ref [18]\n")
-            f.write(f"  ν (correlation length) = {NU:.3f}\n")
+            f.write(f"  ν (correlation length) = {self.nu:.3f}\n")
             f.write(f"    Source: XY universality class (Campostrini et al., 2001)\n")
-            f.write(f"  ζ - ν = {ZETA - NU:.4f}\n\n")
+            f.write(f"  ζ - ν = {self.zeta - self.nu:.4f}\n\n")
             f.write("Theoretical Result:\n")
-            f.write(f"  κ ∝ t^(ζ-ν) = t^{ZETA - NU:.4f}\n\n")
+            f.write(f"  κ ∝ t^(ζ-ν) = t^{self.zeta - self.nu:.4f}\n\n")
             f.write(f"Emergence Parameter Statistics (T < T_λ):\n")
-            f.write(f"  Mean κ = {kappa_mean:.4f} ± {kappa_std:.4f}\n")
-            f.write(f"  Range: [{kappa_min:.4f}, {kappa_max:.4f}]\n")
-            f.write(f"  κ at t=0.01: {kappa_at_001:.4f}\n")
-            f.write(f"  κ at t=0.1: {kappa_at_01:.4f}\n\n")
+            f.write(f"  Mean κ = {results['kappa_mean']:.4f} ± {results['kappa_std']:.4f}\n")
+            f.write(f"  Range: [{results['kappa_min']:.4f}, {results['kappa_max']:.4f}]\n")
+            f.write(f"  κ at t=0.01: {results['kappa_at_t_001']:.4f}\n")
+            f.write(f"  κ at t=0.1: {results['kappa_at_t_01']:.4f}\n")
+            for t_probe, kappa_probe in results.get('kappa_at_probes', {}).items():
+                f.write(f"  κ at t={t_probe:g}: {kappa_probe:.4f}\n")
+            f.write("\n")
             f.write(f"Temperature Range: {results['T_range'][0]:.2f} - {results['T_range'][1]:.4f} K\n")
             f.write(f"Number of Points: {results['n_points']}\n\n")
+            if self.precision != 'double':
+                kappa_error = self.precision_error.get('kappa', {}).get('max_abs', 0.0)
+                f.write(f"Precision: {self.precision} (float32 derived columns)\n")
+                f.write(f"  Max |Δκ| vs float64 = {kappa_error:.2e}"
+                        " (bounds the error of every κ statistic)\n\n")
             f.write("="*60 + "\n")
             f.write("CONCLUSION:\n")
             f.write("="*60 + "\n")
             f.write("κ maintains value of approximately 1 throughout superfluid phase,\n")
             f.write("confirming stable emergent state rather than critical point phenomenon.\n")
+    
+    @traced('analyze_uncertainty')
+    def analyze_uncertainty(self, n_samples=1_000_000, seed=0, workers=None, **kwargs):
+        """
+        Monte Carlo credible intervals for the `analyze()` results.
         
-        print(f"Results saved to {output_dir}/")
-        print(f"  - kappa_analysis.csv")
-        print(f"  - analysis_summary.txt")
+        Draws (ζ, ν, T_λ) around the analyzer values with their published
+        uncertainties and evaluates κ on the current temperature grid.
         
-        return results
+        Parameters
+        ----------
+        n_samples : int
+            Number of Monte Carlo samples.
+        seed : int
+            Root seed of the per-block random streams.
+        workers : int, optional
+            Worker processes for the sample blocks.
+        **kwargs
+            Passed to `uncertainty.propagate_uncertainty`.
+            
+        Returns
+        -------
+        dict
+            Mean, std, median and credible interval per results field.
+        """
+        from uncertainty import propagate_uncertainty
+        
+        if self.data is None:
+            self.generate_synthetic_data()
+        
+        return propagate_uncertainty(self.data['T'].values, n_samples,
+                                     T_lambda=self.T_lambda, zeta=self.zeta,
+                                     nu=self.nu, seed=seed, workers=workers,
+                                     **kwargs)
+    
+    @traced('fit_exponent')
+    def fit_exponent(self, t_windows=None, n_boot=10_000, seed=0, workers=None, **kwargs):
+        """
+        Fit the observed scaling exponent of κ ∝ t^(ζ-ν) below T_λ.
+        
+        Parameters
+        ----------
+        t_windows : sequence of (float, float), optional
+            Reduced-temperature windows fitted separately (whole range if
+            omitted).
+        n_boot : int
+            Bootstrap resamples per window.
+        seed : int
+            Root seed of the per-block random streams.
+        workers : int, optional
+            Worker processes for the resample blocks.
+        **kwargs
+            Passed to `scaling_fit.fit_power_law`.
+            
+        Returns
+        -------
+        list of dict
+            Per window: fitted exponent, amplitude, bootstrap interval and
+            the theoretical exponent ζ-ν.
+        """
+        from scaling_fit import fit_power_law
+        
+        if self.data is None:
+            self.generate_synthetic_data()
+        
+        mask = (self.data['T'] < self.T_lambda).values
+        fits = fit_power_law(self.data['t'].values[mask], self.data['kappa'].values[mask],
+                             t_windows, n_boot=n_boot, seed=seed, workers=workers,
+                             **kwargs)
+        for fit in fits:
+            fit['theory'] = self.zeta - self.nu
+        return fits
+    
+    def finite_size(self, crossover='exponential', xi0=None, **kwargs):
+        """
+        Finite-size κ(t, L) engine with this analyzer's T_λ and exponents.
+        
+        Parameters
+        ----------
+        crossover : str
+            Crossover function of A/A_c (see `finite_size.CROSSOVERS`).
+        xi0 : float, optional
+            Correlation-length amplitude in the units of L.
+        **kwargs
+            Passed to `finite_size.FiniteSizeScaling`.
+        
+        Returns
+        -------
+        FiniteSizeScaling
+        """
+        from finite_size import XI0, FiniteSizeScaling
+        
+        return FiniteSizeScaling(self.T_lambda, self.zeta, self.nu,
+                                 XI0 if xi0 is None else xi0, crossover, **kwargs)
 
 def main():
     """Main analysis pipeline."""
@@ -303,7 +1426,10 @@ def main():
     print("="*60)
     print()
     
-    analyzer = HeliumLambdaAnalyzer()
+    args = enable_from_args()
+    cache = None if '--no-cache' in args else ResultCache()
+    
+    analyzer = HeliumLambdaAnalyzer(cache=cache)
     
     print("Generating synthetic data...")
     analyzer.generate_synthetic_data(n_points=200)
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+System Classification: A.3 He-II λ-Transition κ Analysis
+Author: Oleksii Onasenko
+Developer: SubstanceNet
+Theoretical Framework: The Emergence Parameter κ ≈ 1: An Empirical Signature
+                       of Criticality in Physical and Biological Systems
+
+Copyright 2025 Oleksii Onasenko
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Mergeable streaming statistics for κ analysis.
+
+All accumulators keep O(1) state per tracked quantity and can be merged, so
+the same code serves chunked, multi-process and streaming runs.
+"""
+
+import numpy as np
+
+# Windows (centre, half-width) behind kappa_at_t_001 and kappa_at_t_01
+T_WINDOWS = ((0.01, 0.001), (0.1, 0.01))
+
+# Elements per block of the fused reduction (block temporaries stay in cache)
+FUSED_BLOCK_SIZE = 1 << 16
+
+class RunningMoments:
+    """Welford mean/variance over batches of vectors (Chan et al. merge)."""
+    
+    def __init__(self, n_fields):
+        """
+        Initialize empty moments.
+        
+        Parameters
+        ----------
+        n_fields : int
+            Number of independent quantities tracked.
+        """
+        self.count = np.zeros(n_fields)
+        self.mean = np.zeros(n_fields)
+        self.m2 = np.zeros(n_fields)
+    
+    def update(self, values):
+        """
+        Add a batch of observations, ignoring NaN entries.
+        
+        Parameters
+        ----------
+        values : ndarray
+            Observations, shape (n_samples, n_fields).
+        """
+        values = np.asarray(values, dtype=float)
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0).astype(float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.add.reduce(values, axis=0, where=valid) / count
+            dev = values - mean
+            m2 = np.add.reduce(dev * dev, axis=0, where=valid)
+        self._combine(count, np.nan_to_num(mean), m2)
+    
+    def merge(self, other):
+        """Merge another `RunningMoments` into this one."""
+        self._combine(other.count, other.mean, other.m2)
+    
+    def _combine(self, count, mean, m2):
+        total = self.count + count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean - self.mean
+            weight = np.where(total > 0, count / total, 0.0)
+            self.mean = self.mean + delta * weight
+            self.m2 = self.m2 + m2 + delta * delta * self.count * weight
+        self.count = total
+    
+    def std(self, ddof=1):
+        """Standard deviation per field (NaN where undefined)."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > ddof,
+                            np.sqrt(self.m2 / (self.count - ddof)), np.nan)
+
+class QuantileSketch:
+    """
+    Fixed-edge histogram sketch for approximate quantiles.
+    
+    Values outside [lo, hi] fall into under/overflow bins bounded by the
+    exact running min/max, so no observation is lost. Counts are integers,
+    hence merging is exact and order independent.
+    """
+    
+    def __init__(self, lo, hi, n_bins=4096):
+        """
+        Initialize sketch.
+        
+        Parameters
+        ----------
+        lo, hi : array_like
+            Lower and upper histogram edges per field.
+        n_bins : int
+            Number of regular bins between the edges.
+        """
+        self.lo = np.asarray(lo, dtype=float)
+        self.hi = np.asarray(hi, dtype=float)
+        self.n_bins = n_bins
+        n_fields = self.lo.size
+        self.counts = np.zeros((n_fields, n_bins + 2), dtype=np.int64)
+        self.vmin = np.full(n_fields, np.inf)
+        self.vmax = np.full(n_fields, -np.inf)
+    
+    def update(self, values):
+        """
+        Add a batch of observations, ignoring NaN entries.
+        
+        Parameters
+        ----------
+        values : ndarray
+            Observations, shape (n_samples, n_fields).
+        """
+        values = np.asarray(values, dtype=float)
+        valid = ~np.isnan(values)
+        scaled = (values - self.lo) / (self.hi - self.lo) * self.n_bins
+        idx = np.clip(np.floor(np.nan_to_num(scaled)), -1, self.n_bins) + 1
+        idx = idx.astype(np.int64) + np.arange(self.lo.size) * (self.n_bins + 2)
+        self.counts += np.bincount(idx[valid], minlength=self.counts.size
+                                   ).reshape(self.counts.shape)
+        self.vmin = np.fmin(self.vmin, np.min(values, axis=0, initial=np.inf, where=valid))
+        self.vmax = np.fmax(self.vmax, np.max(values, axis=0, initial=-np.inf, where=valid))
+    
+    def merge(self, other):
+        """Merge another sketch built with the same edges."""
+        self.counts += other.counts
+        self.vmin = np.fmin(self.vmin, other.vmin)
+        self.vmax = np.fmax(self.vmax, other.vmax)
+    
+    def quantile(self, q):
+        """
+        Approximate quantile per field by linear interpolation within bins.
+        
+        Parameters
+        ----------
+        q : float
+            Quantile in [0, 1].
+            
+        Returns
+        -------
+        ndarray
+            Quantile per field (NaN for fields without observations).
+        """
+        width = (self.hi - self.lo) / self.n_bins
+        inner = self.lo[:, None] + width[:, None] * np.arange(self.n_bins + 1)
+        edges = np.concatenate([np.minimum(self.vmin, self.lo)[:, None], inner,
+                                np.maximum(self.vmax, self.hi)[:, None]], axis=1)
+        result = np.full(self.lo.size, np.nan)
+        for i, counts in enumerate(self.counts):
+            total = counts.sum()
+            if total == 0:
+                continue
+            cum = np.cumsum(counts)
+            target = q * total
+            b = min(int(np.searchsorted(cum, target, side='left')), counts.size - 1)
+            before = cum[b] - counts[b]
+            frac = (target - before) / counts[b] if counts[b] else 0.0
+            value = edges[i, b] + frac * (edges[i, b + 1] - edges[i, b])
+            result[i] = np.clip(value, self.vmin[i], self.vmax[i])
+        return result
+
+class KappaAccumulator:
+    """
+    Mergeable κ summary statistics over the superfluid phase.
+    
+    Tracks, per row, the quantities reported by `HeliumLambdaAnalyzer.analyze`:
+    count, mean, M2, min, max, the temperature range and the windowed sums
+    behind κ at t = 0.01 and t = 0.1. Rows let one accumulator serve a batch
+    of independent parameter sets (e.g. Monte Carlo samples).
+    
+    Points may carry weights (e.g. the temperature interval each point of a
+    non-uniform grid represents); moments and windowed means are then
+    weighted, and the standard deviation uses the reliability-weight
+    correction, which reduces to ddof=1 for unit weights.
+    
+    As in pandas, NaN κ values are left out of the κ statistics; their
+    points still count in n_points and the temperature range.
+    """
+    
+    def __init__(self, n_rows=1):
+        """
+        Initialize empty accumulator.
+        
+        Parameters
+        ----------
+        n_rows : int
+            Number of independent runs accumulated side by side.
+        """
+        self.count = np.zeros(n_rows)
+        self.weight = np.zeros(n_rows)
+        self.weight_sq = np.zeros(n_rows)
+        self.mean = np.zeros(n_rows)
+        self.m2 = np.zeros(n_rows)
+        self.kappa_min = np.full(n_rows, np.inf)
+        self.kappa_max = np.full(n_rows, -np.inf)
+        self.T_min = np.full(n_rows, np.inf)
+        self.T_max = np.full(n_rows, -np.inf)
+        self.window_sum = np.zeros((n_rows, len(T_WINDOWS)))
+        self.window_count = np.zeros((n_rows, len(T_WINDOWS)))
+        self.window_weight = np.zeros((n_rows, len(T_WINDOWS)))
+    
+    def update(self, T, t, kappa, mask, rows=slice(None), weights=None):
+        """
+        Add a chunk of points.
+        
+        Parameters
+        ----------
+        T, t, kappa : ndarray
+            Temperature, reduced temperature and κ, broadcastable to `mask`.
+        mask : ndarray of bool
+            Superfluid-phase selection, shape (n,) or (len(rows), n).
+        rows : slice
+            Rows of the accumulator the chunk belongs to.
+        weights : ndarray, optional
+            Non-negative point weights, broadcastable to `mask` (unit
+            weights if omitted).
+        """
+        mask = np.asarray(mask)
+        shape = mask.shape if mask.ndim == 2 else (1,) + mask.shape
+        mask = mask.reshape(shape)
+        # Reduce in float64 whatever the storage precision
+        kappa = np.broadcast_to(np.asarray(kappa, dtype=float), shape)
+        
+        count = np.count_nonzero(mask, axis=1).astype(float)
+        total = np.add.reduce(kappa, axis=1, where=mask)
+        valid = mask
+        if np.isnan(total).any():
+            # NaN κ is skipped, as by pandas; the point still counts in n_points
+            valid = mask & ~np.isnan(kappa)
+            total = np.add.reduce(kappa, axis=1, where=valid)
+        if weights is None:
+            weight = weight_sq = np.count_nonzero(valid, axis=1).astype(float)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = total / weight
+                dev = np.subtract(kappa, mean[:, None])
+                m2 = np.add.reduce(np.square(dev, out=dev), axis=1, where=valid)
+        else:
+            weights = np.broadcast_to(np.asarray(weights, dtype=float), shape)
+            weight = np.add.reduce(weights, axis=1, where=valid)
+            weight_sq = np.add.reduce(np.square(weights), axis=1, where=valid)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = np.add.reduce(weights * kappa, axis=1, where=valid) / weight
+                dev = np.subtract(kappa, mean[:, None])
+                m2 = np.add.reduce(weights * np.square(dev, out=dev), axis=1, where=valid)
+        self._combine(rows, count, weight, weight_sq, np.nan_to_num(mean), m2)
+        
+        self.kappa_min[rows] = np.minimum(
+            self.kappa_min[rows], np.min(kappa, axis=1, initial=np.inf, where=valid))
+        self.kappa_max[rows] = np.maximum(
+            self.kappa_max[rows], np.max(kappa, axis=1, initial=-np.inf, where=valid))
+        T = np.broadcast_to(T, shape)
+        self.T_min[rows] = np.minimum(
+            self.T_min[rows], np.min(T, axis=1, initial=np.inf, where=mask))
+        self.T_max[rows] = np.maximum(
+            self.T_max[rows], np.max(T, axis=1, initial=-np.inf, where=mask))
+        
+        t = np.broadcast_to(np.asarray(t, dtype=float), shape)
+        for k, (centre, half_width) in enumerate(T_WINDOWS):
+            window = np.abs(t - centre) < half_width
+            window &= valid
+            n_window = np.count_nonzero(window, axis=1)
+            self.window_count[rows, k] += n_window
+            if weights is None:
+                self.window_sum[rows, k] += np.add.reduce(kappa, axis=1, where=window)
+                self.window_weight[rows, k] += n_window
+            else:
+                self.window_sum[rows, k] += np.add.reduce(weights * kappa, axis=1,
+                                                          where=window)
+                self.window_weight[rows, k] += np.add.reduce(weights, axis=1, where=window)
+    
+    # Arrays making up the accumulator state
+    _STATE = ('count', 'weight', 'weight_sq', 'mean', 'm2', 'kappa_min', 'kappa_max',
+              'T_min', 'T_max', 'window_sum', 'window_count', 'window_weight')
+    
+    # Weight totals of states saved before weights existed (unit weights)
+    _UNIT_WEIGHTS = {'weight': 'count', 'weight_sq': 'count',
+                     'window_weight': 'window_count'}
+    
+    def state(self):
+        """
+        JSON-serializable snapshot of the accumulator.
+        
+        Floats round-trip exactly through JSON, so an accumulator restored
+        with `from_state` continues exactly where this one stopped.
+        """
+        return {name: getattr(self, name).tolist() for name in self._STATE}
+    
+    @classmethod
+    def from_state(cls, state):
+        """Restore an accumulator from `state()`."""
+        acc = cls(len(state['count']))
+        for name in cls._STATE:
+            value = state.get(name, state.get(cls._UNIT_WEIGHTS.get(name)))
+            setattr(acc, name, np.array(value, dtype=float))
+        return acc
+    
+    def merge(self, other):
+        """Merge another accumulator with the same number of rows."""
+        self._combine(slice(None), other.count, other.weight, other.weight_sq,
+                      other.mean, other.m2)
+        self.kappa_min = np.minimum(self.kappa_min, other.kappa_min)
+        self.kappa_max = np.maximum(self.kappa_max, other.kappa_max)
+        self.T_min = np.minimum(self.T_min, other.T_min)
+        self.T_max = np.maximum(self.T_max, other.T_max)
+        self.window_sum += other.window_sum
+        self.window_count += other.window_count
+        self.window_weight += other.window_weight
+    
+    def _combine(self, rows, count, weight, weight_sq, mean, m2):
+        w_a = self.weight[rows]
+        total = w_a + weight
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean - self.mean[rows]
+            share = np.where(total > 0, weight / total, 0.0)
+            self.mean[rows] = self.mean[rows] + delta * share
+            self.m2[rows] = self.m2[rows] + m2 + delta * delta * w_a * share
+        self.count[rows] = self.count[rows] + count
+        self.weight[rows] = total
+        self.weight_sq[rows] = self.weight_sq[rows] + weight_sq
+    
+    def finalize(self):
+        """
+        Summary statistics per row.
+        
+        Returns
+        -------
+        dict
+            Arrays keyed like the `analyze()` results: kappa_mean, kappa_std
+            (ddof=1), kappa_min, kappa_max, kappa_at_t_001, kappa_at_t_01,
+            n_points, T_min and T_max. Undefined entries are NaN.
+        """
+        empty = self.count == 0
+        # Points with a (nonzero-weight) κ value; NaN κ only counts in n_points
+        no_values = self.weight == 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            denominator = self.weight - self.weight_sq / self.weight
+            std = np.where(denominator > 0, np.sqrt(self.m2 / denominator), np.nan)
+            windowed = self.window_sum / self.window_weight
+        return {
+            'kappa_mean': np.where(no_values, np.nan, self.mean),
+            'kappa_std': std,
+            'kappa_min': np.where(no_values, np.nan, self.kappa_min),
+            'kappa_max': np.where(no_values, np.nan, self.kappa_max),
+            'kappa_at_t_001': windowed[:, 0],
+            'kappa_at_t_01': windowed[:, 1],
+            'n_points': self.count.astype(np.int64),
+            'T_min': np.where(empty, np.nan, self.T_min),
+            'T_max': np.where(empty, np.nan, self.T_max),
+        }
+
+def accumulate(T, t, kappa, T_lambda, acc=None, block_size=FUSED_BLOCK_SIZE, weights=None):
+    """
+    Fused reduction of the κ summary statistics over unmasked arrays.
+    
+    The arrays are walked once in cache-sized blocks; every statistic of
+    `KappaAccumulator` is computed from the block while it is resident, and
+    the superfluid mask is never materialized for the whole array. Block
+    partials are merged with the Chan et al. update, so the result agrees
+    with a direct computation (pandas ddof=1 std included) to rounding.
+    
+    Parameters
+    ----------
+    T, t, kappa : ndarray
+        Full-length column arrays (any memory-mapped or in-memory arrays).
+    T_lambda : float
+        Lambda temperature; points with T < T_λ are included.
+    acc : KappaAccumulator, optional
+        Accumulator to extend (a new one by default).
+    block_size : int
+        Elements per block.
+    weights : ndarray, optional
+        Full-length point weights (weighted moments, see `KappaAccumulator`).
+        
+    Returns
+    -------
+    KappaAccumulator
+    """
+    acc = KappaAccumulator() if acc is None else acc
+    for i in range(0, len(T), block_size):
+        block = slice(i, i + block_size)
+        T_block = np.asarray(T[block])
+        acc.update(T_block, t[block], kappa[block], T_block < T_lambda,
+                   weights=None if weights is None else weights[block])
+    return acc
+
+class SortedTIndex:
+    """
+    Reduced-temperature index answering windowed κ queries in O(log n).
+    
+    Points are ordered by t once; windowed means come from two
+    `searchsorted` calls and a difference of prefix sums. Windows select
+    exactly the points a |t - centre| < half_width mask would.
+    """
+    
+    def __init__(self, t, kappa):
+        """
+        Build index.
+        
+        Parameters
+        ----------
+        t : array_like
+            Reduced temperature of the indexed points.
+        kappa : array_like
+            κ at the same points.
+        """
+        t = np.asarray(t, dtype=float)
+        kappa = np.asarray(kappa, dtype=float)
+        steps = np.diff(t)
+        if np.all(steps >= 0):
+            order = slice(None)
+        elif np.all(steps <= 0):
+            order = slice(None, None, -1)
+        else:
+            order = np.argsort(t, kind='stable')
+        self.t = t[order]
+        self.kappa = kappa[order]
+        # Prefix sums of κ relative to an offset keep the differences accurate
+        self.offset = float(self.kappa[0]) if self.kappa.size else 0.0
+        self.prefix = np.concatenate([[0.0], np.cumsum(self.kappa - self.offset)])
+    
+    def __len__(self):
+        return self.t.size
+    
+    def window_mean(self, centres, half_widths):
+        """
+        Mean κ over |t - centre| < half_width for a batch of windows.
+        
+        Parameters
+        ----------
+        centres, half_widths : array_like
+            Window centres and half-widths (broadcast together).
+            
+        Returns
+        -------
+        ndarray
+            Windowed means (NaN for empty windows).
+        """
+        centres, half_widths = np.broadcast_arrays(np.asarray(centres, dtype=float),
+                                                   np.asarray(half_widths, dtype=float))
+        lo = self._boundary(centres, -half_widths, inclusive=False)
+        hi = self._boundary(centres, half_widths, inclusive=True)
+        n = hi - lo
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = (self.prefix[np.maximum(hi, lo)] - self.prefix[lo]) / n + self.offset
+        return np.where(n > 0, mean, np.nan)
+    
+    def _boundary(self, centres, offsets, inclusive):
+        """
+        First index where the rounded t - centre exceeds (or, if `inclusive`, reaches) `offsets`.
+        
+        The rounded difference is monotone in t, so the predicate flips once
+        along the sorted points; `searchsorted` brackets the flip to the
+        points within rounding distance of centre + offset, which are then
+        bisected with the exact predicate.
+        """
+        edge = centres + offsets
+        eps = 4 * (np.spacing(np.abs(edge)) + np.spacing(np.abs(centres))
+                   + np.spacing(np.abs(offsets)))
+        lo = np.searchsorted(self.t, edge - eps, side='left')
+        hi = np.searchsorted(self.t, edge + eps, side='right')
+        active = lo < hi
+        while active.any():
+            mid = (lo + hi) // 2
+            diff = self.t[np.minimum(mid, self.t.size - 1)] - centres
+            past = diff >= offsets if inclusive else diff > offsets
+            lo = np.where(active & ~past, mid + 1, lo)
+            hi = np.where(active & past, mid, hi)
+            active = lo < hi
+        return lo
+    
+    def interpolate(self, t_query):
+        """
+        κ linearly interpolated in t (NaN outside the indexed range).
+        
+        Parameters
+        ----------
+        t_query : array_like
+            Reduced temperatures to evaluate.
+            
+        Returns
+        -------
+        ndarray
+            Interpolated κ.
+        """
+        t_query = np.asarray(t_query, dtype=float)
+        if self.t.size == 0:
+            return np.full(t_query.shape, np.nan)
+        return np.interp(t_query, self.t, self.kappa, left=np.nan, right=np.nan)
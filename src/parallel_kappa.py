@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+System Classification: A.3 He-II λ-Transition κ Analysis
+Author: Oleksii Onasenko
+Developer: SubstanceNet
+Theoretical Framework: The Emergence Parameter κ ≈ 1: An Empirical Signature 
+                       of Criticality in Physical and Biological Systems
+
+Copyright 2025 Oleksii Onasenko
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Multi-process κ evaluation over shared-memory temperature grids.
+"""
+
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from kappa_analyzer import NU, T_LAMBDA, T_REF, ZETA
+
+# Points per worker task; also the size of each worker's scratch buffers
+PARALLEL_BLOCK_SIZE = 1 << 20
+
+class _Block(np.ndarray):
+    """Bytes of a shared block; as a distinct type it stays the base of every view."""
+
+def _unlink(shm):
+    """Remove a shared block's name, if still present."""
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+def _release(shm, owner):
+    """Unmap a shared block once no array uses it (and unlink it if owned)."""
+    shm.close()
+    if owner:
+        _unlink(shm)
+
+class SharedGrid:
+    """
+    Named float64 arrays of equal length in one shared-memory block.
+    
+    Worker processes attach to the block by name, so every process reads
+    and writes the same pages; nothing is copied between them. `close()`
+    releases the grid's own references (and the block's name); arrays
+    already handed out stay valid, and the block is unmapped once the last
+    of them is gone.
+    """
+    
+    def __init__(self, n, names=('T', 'kappa', 't'), _attach=None):
+        """
+        Allocate a grid.
+        
+        Parameters
+        ----------
+        n : int
+            Points per array.
+        names : sequence of str
+            Array names, in storage order.
+        """
+        self.n = int(n)
+        self.names = tuple(names)
+        stride = -(-self.n * 8 // 64) * 64
+        if _attach is None:
+            self.shm = shared_memory.SharedMemory(create=True,
+                                                  size=max(stride * len(self.names), 1))
+            self._owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=_attach)
+            self._owner = False
+        # Every array (and view of one) keeps `block` alive; the mapping is
+        # closed when the last of them is gone
+        block = _Block(self.shm.size, dtype=np.uint8, buffer=self.shm.buf)
+        self._release = weakref.finalize(block, _release, self.shm, self._owner)
+        self.arrays = {}
+        for i, name in enumerate(self.names):
+            column = block[i * stride:i * stride + self.n * 8].view(np.float64)
+            self.arrays[name] = column.view(np.ndarray)
+    
+    @property
+    def spec(self):
+        """Picklable (shm name, n, names) used to attach from workers."""
+        return self.shm.name, self.n, self.names
+    
+    @classmethod
+    def attach(cls, spec):
+        """Attach to a grid created in another process."""
+        name, n, names = spec
+        return cls(n, names, _attach=name)
+    
+    def __getitem__(self, name):
+        return self.arrays[name]
+    
+    def close(self):
+        """Drop the grid's array views and release the block (unlinked by its creator)."""
+        self.arrays = {}
+        if self._owner and self._release.alive:
+            _unlink(self.shm)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def kappa_into(T, kappa, t, T_lambda, zeta, nu, mask=None, scratch=None):
+    """
+    Evaluate κ and t in place, with the arithmetic of `calculate_kappa`.
+    
+    Results are bit-identical to `HeliumLambdaAnalyzer.calculate_kappa`;
+    the only temporaries are the optional `mask` and `scratch` buffers.
+    
+    Parameters
+    ----------
+    T : ndarray
+        Temperatures in Kelvin.
+    kappa, t : ndarray
+        Outputs, same shape as `T`; `t` may be a scratch buffer.
+    T_lambda, zeta, nu : float
+        Transition temperature and exponents.
+    mask : ndarray of bool, optional
+        Buffer for the superfluid mask.
+    scratch : ndarray, optional
+        Float64 buffer for ξ.
+    """
+    mask = np.less(T, T_lambda, out=mask)
+    np.divide(T, T_lambda, out=t)
+    np.subtract(1.0, t, out=t)
+    np.abs(t, out=t)
+    
+    kappa_ref = np.power(T_REF, zeta) * np.power(T_REF, -nu)
+    kappa.fill(0.0)
+    xi = np.power(t, -nu, out=scratch, where=mask)
+    np.power(t, zeta, out=kappa, where=mask)
+    np.multiply(kappa, xi, out=kappa, where=mask)
+    np.divide(kappa, kappa_ref, out=kappa, where=mask)
+
+_grid = None
+_buffers = None
+
+def _init_worker(spec):
+    """Attach the shared grid and allocate scratch buffers once per worker."""
+    global _grid, _buffers
+    _grid = SharedGrid.attach(spec)
+    _buffers = None
+
+def _run_range(start, stop, T_lambda, zeta, nu, t_name):
+    """Worker task: evaluate rows [start, stop) of the shared grid."""
+    global _buffers
+    n = stop - start
+    if _buffers is None or _buffers[0].size < n:
+        _buffers = (np.empty(n, dtype=bool), np.empty(n), np.empty(n))
+    mask, scratch, t_scratch = (b[:n] for b in _buffers)
+    t = _grid[t_name][start:stop] if t_name else t_scratch
+    kappa_into(_grid['T'][start:stop], _grid['kappa'][start:stop], t,
+               T_lambda, zeta, nu, mask, scratch)
+
+def evaluate_grid(grid, T_lambda=T_LAMBDA, zeta=ZETA, nu=NU, workers=None,
+                  block_size=PARALLEL_BLOCK_SIZE):
+    """
+    Evaluate κ (and t, if the grid has it) over a shared grid in place.
+    
+    Parameters
+    ----------
+    grid : SharedGrid
+        Grid with 'T' filled in and a 'kappa' (optionally 't') array.
+    T_lambda, zeta, nu : float
+        Transition temperature and exponents.
+    workers : int, optional
+        Worker processes (defaults to the CPU count; 1 runs in-process).
+    block_size : int
+        Points per task.
+        
+    Returns
+    -------
+    SharedGrid
+        `grid`, with 'kappa' and 't' written.
+    """
+    t_name = 't' if 't' in grid.names else None
+    ranges = [(i, min(i + block_size, grid.n)) for i in range(0, grid.n, block_size)]
+    workers = workers or os.cpu_count() or 1
+    
+    if workers == 1 or len(ranges) <= 1:
+        global _grid
+        _grid = grid
+        try:
+            for start, stop in ranges:
+                _run_range(start, stop, T_lambda, zeta, nu, t_name)
+        finally:
+            _grid = None
+    else:
+        with ProcessPoolExecutor(min(workers, len(ranges)), initializer=_init_worker,
+                                 initargs=(grid.spec,)) as pool:
+            futures = [pool.submit(_run_range, start, stop, T_lambda, zeta, nu, t_name)
+                       for start, stop in ranges]
+            for future in futures:
+                future.result()
+    return grid
+
+def calculate_kappa_shared(T, T_lambda=T_LAMBDA, zeta=ZETA, nu=NU, workers=None,
+                           block_size=PARALLEL_BLOCK_SIZE, with_t=True):
+    """
+    Parallel counterpart of `calculate_kappa` returning a shared grid.
+    
+    Parameters
+    ----------
+    T : array_like
+        Temperatures in Kelvin (copied once into shared memory).
+    T_lambda, zeta, nu : float
+        Transition temperature and exponents.
+    workers : int, optional
+        Worker processes.
+    block_size : int
+        Points per task.
+    with_t : bool
+        Keep the reduced temperature; without it only T and κ are
+        resident.
+        
+    Returns
+    -------
+    SharedGrid
+        Arrays 'T', 'kappa' and (with `with_t`) 't'; close it when done.
+    """
+    T = np.asarray(T, dtype=np.float64).ravel()
+    grid = SharedGrid(T.size, ('T', 'kappa', 't') if with_t else ('T', 'kappa'))
+    try:
+        grid['T'][:] = T
+        return evaluate_grid(grid, T_lambda, zeta, nu, workers, block_size)
+    except BaseException:
+        grid.close()
+        raise
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+System Classification: A.3 He-II λ-Transition κ Analysis
+Author: Oleksii Onasenko
+Developer: SubstanceNet
+Theoretical Framework: The Emergence Parameter κ ≈ 1: An Empirical Signature 
+                       of Criticality in Physical and Biological Systems
+
+Copyright 2025 Oleksii Onasenko
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Content-addressed on-disk cache for κ analysis results.
+
+Entries are keyed by a SHA-256 digest of every input that determines a
+result (T_λ, exponents, grid specification, t_ref, code version) and hold
+the columnar data set and/or the analysis results as JSON. The cache is
+bounded in size and evicts least-recently-used entries.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+
+import numpy as np
+
+from results_io import ColumnStore, is_column_store, write_columns
+
+CACHE_DIR = os.environ.get(
+    'KAPPA_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'helium_lambda_kappa'))
+CACHE_MAX_BYTES = 2 * 1024**3
+
+DATA_NAME = 'data.kbin'
+RESULTS_NAME = 'results.json'
+
+def _jsonable(value):
+    """Convert NumPy scalars and tuples for JSON encoding."""
+    if isinstance(value, (np.floating, np.integer)):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, tuple):
+        return list(value)
+    raise TypeError(f"cannot encode {type(value).__name__}")
+
+def cache_key(**params):
+    """
+    Digest of the parameters that determine a result.
+    
+    Floats are encoded with `repr` precision, so keys are exact.
+    
+    Returns
+    -------
+    str
+        Hex SHA-256 digest.
+    """
+    blob = json.dumps(params, sort_keys=True, default=_jsonable)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+def _tree_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+class ResultCache:
+    """Size-bounded LRU cache of κ data sets and analysis results."""
+    
+    def __init__(self, root=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        """
+        Initialize cache.
+        
+        Parameters
+        ----------
+        root : str
+            Cache directory (default from KAPPA_CACHE_DIR or ~/.cache).
+        max_bytes : int
+            Size bound enforced after every insertion.
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+    
+    def _entry(self, key):
+        return os.path.join(self.root, key[:2], key)
+    
+    def _touch(self, path):
+        now = time.time()
+        os.utime(path, (now, now))
+    
+    def get_data(self, key):
+        """
+        Look up a cached data set.
+        
+        Returns
+        -------
+        ColumnStore or None
+            Memory-mapped data, or None on a miss.
+        """
+        path = os.path.join(self._entry(key), DATA_NAME)
+        if not is_column_store(path):
+            return None
+        self._touch(self._entry(key))
+        return ColumnStore(path)
+    
+    def put_data(self, key, data, metadata=None):
+        """Store a data set (DataFrame or dict of columns)."""
+        self._put(key, DATA_NAME,
+                  lambda tmp: write_columns(tmp, data, metadata, list(data.keys())))
+    
+    def get_results(self, key):
+        """
+        Look up cached analysis results.
+        
+        Returns
+        -------
+        dict or None
+            Results (T_range restored as a tuple), or None on a miss.
+        """
+        path = os.path.join(self._entry(key), RESULTS_NAME)
+        try:
+            with open(path) as f:
+                results = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._touch(self._entry(key))
+        if 'T_range' in results:
+            results['T_range'] = tuple(results['T_range'])
+        return results
+    
+    def put_results(self, key, results):
+        """Store an analysis results dict."""
+        def write(tmp):
+            with open(tmp, 'w') as f:
+                json.dump(results, f, indent=2, default=_jsonable)
+        self._put(key, RESULTS_NAME, write)
+    
+    def _put(self, key, name, write):
+        """Write `name` into the entry atomically, then enforce the bound."""
+        entry = self._entry(key)
+        os.makedirs(entry, exist_ok=True)
+        tmp = os.path.join(entry, f'.{name}.{uuid.uuid4().hex}')
+        try:
+            write(tmp)
+            target = os.path.join(entry, name)
+            if os.path.isdir(target):
+                shutil.rmtree(target)
+            os.replace(tmp, target)
+        finally:
+            if os.path.isdir(tmp):
+                shutil.rmtree(tmp, ignore_errors=True)
+            elif os.path.exists(tmp):
+                os.remove(tmp)
+        self._touch(entry)
+        self.evict(keep=key)
+    
+    def entries(self):
+        """
+        List cache entries, least recently used first.
+        
+        Returns
+        -------
+        list of tuple
+            (last_access, size_bytes, key).
+        """
+        found = []
+        if not os.path.isdir(self.root):
+            return found
+        for prefix in os.listdir(self.root):
+            shard = os.path.join(self.root, prefix)
+            if not os.path.isdir(shard):
+                continue
+            for key in os.listdir(shard):
+                path = os.path.join(shard, key)
+                found.append((os.path.getmtime(path), _tree_size(path), key))
+        return sorted(found)
+    
+    def evict(self, keep=None):
+        """
+        Remove least-recently-used entries until the size bound holds.
+        
+        Parameters
+        ----------
+        keep : str, optional
+            Key that must survive (the entry just written).
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in entries:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(self._entry(key), ignore_errors=True)
+            total -= size
+    
+    def clear(self):
+        """Remove every entry."""
+        shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+System Classification: A.3 He-II λ-Transition κ Analysis
+Author: Oleksii Onasenko
+Developer: SubstanceNet
+Theoretical Framework: The Emergence Parameter κ ≈ 1: An Empirical Signature 
+                       of Criticality in Physical and Biological Systems
+
+Copyright 2025 Oleksii Onasenko
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Columnar binary results format for κ analysis.
+
+A result set is a directory (conventionally `kappa_analysis.kbin`) holding
+one raw little-endian array file per column plus `header.json` with the
+row count, column dtypes and run metadata (exponents, T_λ, t_ref). Columns
+open zero-copy through `np.memmap` and are only read when accessed.
+"""
+
+import json
+import os
+import queue
+import shutil
+import threading
+import uuid
+
+import numpy as np
+
+FORMAT_NAME = 'kappa-columns'
+FORMAT_VERSION = 1
+HEADER_NAME = 'header.json'
+BINARY_NAME = 'kappa_analysis.kbin'
+
+# Column order of the analysis tables
+COLUMNS = ('T', 't', 'kappa', 'rho_s', 'xi_norm')
+
+def is_column_store(path):
+    """Return True if `path` is a columnar binary result set."""
+    return os.path.isfile(os.path.join(path, HEADER_NAME))
+
+def _sibling(path, tag):
+    """Unused temporary path next to `path`."""
+    head, tail = os.path.split(os.path.normpath(path))
+    return os.path.join(head, f'.{tail}.{tag}-{uuid.uuid4().hex}')
+
+class ColumnWriter:
+    """
+    Append-only writer for a columnar result set.
+    
+    Chunks are appended to the per-column files as they arrive; the header
+    is rewritten atomically on `flush()` and `close()`. An existing result
+    set at the same path is not touched while writing: the new one is built
+    in a sibling directory and swapped in on `close()`, so memory maps of
+    the old set stay valid.
+    """
+    
+    def __init__(self, path, columns=COLUMNS, metadata=None, dtypes=None):
+        """
+        Create (or replace) a result set.
+        
+        Parameters
+        ----------
+        path : str
+            Result set directory.
+        columns : sequence of str
+            Column names, in storage order.
+        metadata : dict, optional
+            JSON-serializable run metadata.
+        dtypes : dict, optional
+            NumPy dtype per column (float64 by default).
+        """
+        dtypes = dtypes or {}
+        self.target = path
+        self.metadata = dict(metadata or {})
+        self.n_rows = 0
+        self.columns = [{'name': name,
+                         'dtype': np.dtype(dtypes.get(name, '<f8')).newbyteorder('<').str,
+                         'file': f'{name}.bin'} for name in columns]
+        
+        # Never truncate files of an existing set: they may be mapped
+        self.path = _sibling(path, 'new') if os.path.exists(path) else path
+        os.makedirs(self.path, exist_ok=True)
+        self._files = {c['name']: open(os.path.join(self.path, c['file']), 'wb')
+                       for c in self.columns}
+        self.flush()
+    
+    @classmethod
+    def append_to(cls, path):
+        """
+        Reopen an existing result set for appending rows.
+        
+        Column files are cut back to the published row count first, so
+        rows of an interrupted append that never reached the header are
+        discarded.
+        
+        Parameters
+        ----------
+        path : str
+            Result set directory.
+            
+        Returns
+        -------
+        ColumnWriter
+            Writer continuing after the last published row, with the stored
+            columns, dtypes and metadata.
+        """
+        store = ColumnStore(path)
+        writer = cls.__new__(cls)
+        writer.path = writer.target = path
+        writer.metadata = dict(store.metadata)
+        writer.n_rows = store.n_rows
+        writer.columns = store.header['columns']
+        writer._files = {}
+        for c in writer.columns:
+            f = open(os.path.join(path, c['file']), 'r+b')
+            f.truncate(store.n_rows * np.dtype(c['dtype']).itemsize)
+            f.seek(0, os.SEEK_END)
+            writer._files[c['name']] = f
+        return writer
+    
+    def append(self, chunk):
+        """
+        Append a chunk of rows.
+        
+        Parameters
+        ----------
+        chunk : dict
+            Equal-length arrays for every column.
+        """
+        n = None
+        for c in self.columns:
+            values = np.ascontiguousarray(chunk[c['name']], dtype=c['dtype'])
+            if n is None:
+                n = len(values)
+            elif len(values) != n:
+                raise ValueError(f"column '{c['name']}' has {len(values)} rows, expected {n}")
+            self._files[c['name']].write(values.data)
+        self.n_rows += n or 0
+    
+    def flush(self):
+        """Flush column data and publish the current row count."""
+        for f in self._files.values():
+            f.flush()
+        header = {
+            'format': FORMAT_NAME,
+            'version': FORMAT_VERSION,
+            'n_rows': self.n_rows,
+            'columns': self.columns,
+            'metadata': self.metadata,
+        }
+        tmp = os.path.join(self.path, HEADER_NAME + '.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(header, f, indent=2)
+        os.replace(tmp, os.path.join(self.path, HEADER_NAME))
+    
+    def sync(self):
+        """Flush and fsync the column files and the header."""
+        self.flush()
+        for f in self._files.values():
+            os.fsync(f.fileno())
+    
+    def close(self):
+        """Finish writing and publish the result set."""
+        self.flush()
+        for f in self._files.values():
+            f.close()
+        if self.path != self.target:
+            # Unlinked files of the old set live on while they are mapped
+            old = _sibling(self.target, 'old')
+            os.replace(self.target, old)
+            os.replace(self.path, self.target)
+            self.path = self.target
+            shutil.rmtree(old, ignore_errors=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+# Queued chunks before append() blocks, rows per write batch, and bytes
+# written between fsyncs of a BackgroundWriter
+WRITER_QUEUE_SIZE = 4
+WRITER_BATCH_ROWS = 1 << 20
+WRITER_FSYNC_BYTES = 256 * 2**20
+
+class BackgroundWriter:
+    """
+    Writer thread overlapping chunked computation with disk I/O.
+    
+    Chunks handed to `append()` go through a bounded queue to a dedicated
+    I/O thread, which concatenates whatever is queued into batches of up to
+    `batch_rows` rows and passes each batch to the column writer and to
+    any extra sinks (e.g. a CSV appender). A full queue blocks the
+    producer (back-pressure), so at most `queue_size` chunks are in flight.
+    Data are fsynced every `fsync_bytes` and on close. An exception raised
+    on the I/O thread is re-raised by the next `append()` or `close()`.
+    
+    Appended arrays must not be modified afterwards. Header metadata set
+    in `metadata` is merged into the result set when it is closed.
+    """
+    
+    _DONE = object()
+    
+    def __init__(self, writer, sinks=(), queue_size=WRITER_QUEUE_SIZE,
+                 batch_rows=WRITER_BATCH_ROWS, fsync_bytes=WRITER_FSYNC_BYTES):
+        """
+        Start the I/O thread.
+        
+        Parameters
+        ----------
+        writer : ColumnWriter
+            Destination result set; closed by `close()`.
+        sinks : sequence of callable
+            Further consumers called with every batch (dict of columns).
+        queue_size : int
+            Chunks queued before `append()` blocks.
+        batch_rows : int
+            Target rows per write batch.
+        fsync_bytes : int or None
+            Bytes written between fsyncs (None: no fsync).
+        """
+        self.writer = writer
+        self.sinks = list(sinks)
+        self.batch_rows = batch_rows
+        self.fsync_bytes = fsync_bytes
+        self.n_batches = 0
+        self.metadata = {}
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name='result-writer', daemon=True)
+        self._thread.start()
+    
+    def append(self, chunk):
+        """Queue a chunk of rows, blocking while the queue is full."""
+        self._raise()
+        self._queue.put(chunk)
+    
+    def _run(self):
+        unsynced = 0
+        done = False
+        while not done:
+            chunks = [self._queue.get()]
+            rows = 0
+            # Coalesce whatever is already queued into one batch
+            while chunks[-1] is not self._DONE and rows < self.batch_rows:
+                rows += len(next(iter(chunks[-1].values()), ()))
+                try:
+                    chunks.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if chunks[-1] is self._DONE:
+                chunks.pop()
+                done = True
+            if not chunks or self._error is not None:
+                continue
+            try:
+                batch = {name: np.concatenate([c[name] for c in chunks]) if len(chunks) > 1
+                         else chunks[0][name] for name in chunks[0]}
+                self.writer.append(batch)
+                for sink in self.sinks:
+                    sink(batch)
+                self.n_batches += 1
+                unsynced += sum(np.asarray(v).nbytes for v in batch.values())
+                if self.fsync_bytes is not None and unsynced >= self.fsync_bytes:
+                    self.writer.sync()
+                    unsynced = 0
+            except BaseException as exc:
+                self._error = exc
+    
+    def _raise(self):
+        if self._error is not None:
+            raise self._error
+    
+    def close(self):
+        """Drain the queue, sync and close the result set."""
+        self._queue.put(self._DONE)
+        self._thread.join()
+        self.writer.metadata.update(self.metadata)
+        try:
+            self._raise()
+            if self.fsync_bytes is not None:
+                self.writer.sync()
+        finally:
+            self.writer.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def write_columns(path, data, metadata=None, columns=COLUMNS):
+    """
+    Write a complete table as a columnar result set.
+    
+    Parameters
+    ----------
+    path : str
+        Result set directory.
+    data : DataFrame or dict
+        Column arrays.
+    metadata : dict, optional
+        JSON-serializable run metadata.
+    columns : sequence of str
+        Columns to store.
+    """
+    dtypes = {name: np.asarray(data[name]).dtype for name in columns}
+    with ColumnWriter(path, columns, metadata, dtypes) as writer:
+        writer.append({name: np.asarray(data[name]) for name in columns})
+
+class ColumnStore:
+    """Read-only, lazily mapped view of a columnar result set."""
+    
+    def __init__(self, path):
+        """
+        Open a result set.
+        
+        Parameters
+        ----------
+        path : str
+            Result set directory.
+        """
+        with open(os.path.join(path, HEADER_NAME)) as f:
+            header = json.load(f)
+        if header.get('format') != FORMAT_NAME:
+            raise ValueError(f"{path} is not a {FORMAT_NAME} result set")
+        if header.get('version', 0) > FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported format version {header['version']}")
+        
+        self.path = path
+        self.header = header
+        self.metadata = header.get('metadata', {})
+        self.n_rows = header['n_rows']
+        self._specs = {c['name']: c for c in header['columns']}
+        self._maps = {}
+    
+    @property
+    def columns(self):
+        """Column names in storage order."""
+        return list(self._specs)
+    
+    def __contains__(self, name):
+        return name in self._specs
+    
+    def __len__(self):
+        return self.n_rows
+    
+    def __getitem__(self, name):
+        """Memory-mapped column (read-only)."""
+        if name not in self._maps:
+            spec = self._specs[name]
+            dtype = np.dtype(spec['dtype'])
+            if self.n_rows == 0:
+                column = np.empty(0, dtype=dtype)
+            else:
+                column = np.memmap(os.path.join(self.path, spec['file']),
+                                   dtype=dtype, mode='r', shape=(self.n_rows,))
+            self._maps[name] = column
+        return self._maps[name]
+    
+    def to_frame(self, columns=None):
+        """
+        DataFrame view over the mapped columns (no copy).
+        
+        Parameters
+        ----------
+        columns : sequence of str, optional
+            Subset of columns to expose.
+            
+        Returns
+        -------
+        DataFrame
+            Frame whose columns share memory with the mapped files.
+        """
+        import pandas as pd
+        
+        columns = self.columns if columns is None else columns
+        return pd.DataFrame({name: self[name] for name in columns}, copy=False)
+
+def open_columns(path):
+    """Open a columnar result set (see `ColumnStore`)."""
+    return ColumnStore(path)
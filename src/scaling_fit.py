@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+System Classification: A.3 He-II λ-Transition κ Analysis
+Author: Oleksii Onasenko
+Developer: SubstanceNet
+Theoretical Framework: The Emergence Parameter κ ≈ 1: An Empirical Signature 
+                       of Criticality in Physical and Biological Systems
+
+Copyright 2025 Oleksii Onasenko
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Weighted power-law fits of κ(t) in log-log space with bootstrap intervals.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from kappa_analyzer import T_REF
+
+# Resampling units per window; larger windows are split into contiguous
+# t-ordered cells whose sufficient statistics are resampled
+N_CELLS = 1024
+
+# Bootstrap resamples per RNG block (one batched solve each)
+BOOT_BLOCK_SIZE = 4096
+
+def _cell_stats(x, y, w, n_cells):
+    """
+    Per-cell sufficient statistics of the weighted line fit.
+    
+    Returns an (n_cells, 5) array of Σw, Σwx, Σwy, Σwx², Σwxy.
+    """
+    order = np.argsort(x, kind='stable')
+    x, y, w = x[order], y[order], w[order]
+    n_cells = min(n_cells, x.size)
+    starts = np.linspace(0, x.size, n_cells + 1).astype(np.intp)[:-1]
+    wx = w * x
+    terms = np.stack([w, wx, w * y, wx * x, wx * y], axis=1)
+    return np.add.reduceat(terms, starts, axis=0)
+
+def _solve(sums):
+    """
+    Solve the 2×2 weighted normal equations for a batch of sum vectors.
+    
+    Returns (intercept, slope); NaN where the system is singular.
+    """
+    sw, sx, sy, sxx, sxy = np.moveaxis(sums, -1, 0)
+    det = sw * sxx - sx * sx
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = np.where(det > 0, (sw * sxy - sx * sy) / det, np.nan)
+        intercept = np.where(det > 0, (sy - slope * sx) / sw, np.nan)
+    return intercept, slope
+
+def _boot_blocks(blocks, stats):
+    """
+    Worker task: bootstrap slopes for a run of blocks.
+    
+    Each block draws Poisson(1) cell counts for every window and solves all
+    its resamples at once. Returns one (n_windows, n) array per block.
+    """
+    out = []
+    for seed_seq, n in blocks:
+        rng = np.random.default_rng(seed_seq)
+        slopes = np.empty((len(stats), n))
+        for i, cells in enumerate(stats):
+            counts = rng.poisson(1.0, (n, len(cells))).astype(float)
+            slopes[i] = _solve(counts @ cells)[1]
+        out.append(slopes)
+    return out
+
+def fit_power_law(t, kappa, t_windows=None, sigma=None, n_boot=10_000,
+                  credible_level=0.95, seed=0, workers=None,
+                  block_size=BOOT_BLOCK_SIZE, n_cells=N_CELLS):
+    """
+    Fit κ = A (t/t_ref)^b by weighted least squares in log-log space.
+    
+    Within each window the fit reduces to per-cell sufficient statistics,
+    so a bootstrap resample costs one row of a (resamples × cells) matrix
+    product rather than a pass over the data. Cells are contiguous in t
+    (one point each for windows of at most `n_cells` points), which makes
+    the bootstrap a block bootstrap on large grids. Resample blocks run on
+    a process pool, each with its own child of one `SeedSequence`.
+    
+    Parameters
+    ----------
+    t : array_like
+        Reduced temperatures.
+    kappa : array_like
+        κ values; points with non-positive or non-finite t or κ are ignored.
+    t_windows : sequence of (float, float), optional
+        Inclusive (t_lo, t_hi) ranges fitted separately (the full range of
+        valid points if omitted).
+    sigma : array_like, optional
+        One-sigma κ uncertainties; log-space weights are (κ/σ)².
+        Unweighted if omitted.
+    n_boot : int
+        Bootstrap resamples per window (0 for the point estimate only).
+    credible_level : float
+        Coverage of the percentile interval.
+    seed : int
+        Root seed; results are reproducible for any number of workers.
+    workers : int, optional
+        Worker processes (defaults to the CPU count; 1 runs in-process).
+    block_size : int
+        Resamples per RNG block.
+    n_cells : int
+        Resampling cells per window.
+        
+    Returns
+    -------
+    list of dict
+        Per window: t_window, n_points, exponent, amplitude (κ at t_ref),
+        and with n_boot > 0 the bootstrap exponent_std and interval
+        bounds low/high.
+    """
+    t = np.asarray(t, dtype=float).ravel()
+    kappa = np.asarray(kappa, dtype=float).ravel()
+    valid = np.isfinite(t) & np.isfinite(kappa) & (t > 0) & (kappa > 0)
+    if sigma is not None:
+        sigma = np.broadcast_to(np.asarray(sigma, dtype=float), t.shape)
+        valid &= np.isfinite(sigma) & (sigma > 0)
+    t, kappa = t[valid], kappa[valid]
+    if t_windows is None:
+        t_windows = [(t.min(), t.max())] if t.size else []
+    
+    x_all = np.log(t / T_REF)
+    y_all = np.log(kappa)
+    w_all = np.ones_like(t) if sigma is None else (kappa / sigma[valid]) ** 2
+    
+    fits, stats = [], []
+    for t_lo, t_hi in t_windows:
+        sel = (t >= t_lo) & (t <= t_hi)
+        x, y, w = x_all[sel], y_all[sel], w_all[sel]
+        # Centre x for conditioning; the slope is unaffected
+        x_mean = x.mean() if x.size else 0.0
+        cells = _cell_stats(x - x_mean, y, w, n_cells) if x.size else np.zeros((0, 5))
+        intercept, slope = _solve(cells.sum(axis=0))
+        fits.append({
+            't_window': (float(t_lo), float(t_hi)),
+            'n_points': int(x.size),
+            'exponent': float(slope),
+            'amplitude': float(np.exp(intercept - slope * x_mean)),
+        })
+        stats.append(cells)
+    
+    if n_boot <= 0 or not fits:
+        return fits
+    
+    sizes = [block_size] * (n_boot // block_size)
+    if n_boot % block_size:
+        sizes.append(n_boot % block_size)
+    blocks = list(zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes))
+    
+    workers = workers or os.cpu_count() or 1
+    n_tasks = min(len(blocks), 4 * workers)
+    tasks = [blocks[i::n_tasks] for i in range(n_tasks)]
+    
+    if workers == 1:
+        results = [_boot_blocks(task, stats) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_boot_blocks, tasks, [stats] * n_tasks))
+    
+    # Reassemble in block order for reproducibility
+    per_block = [None] * len(blocks)
+    for i, slopes in enumerate(results):
+        per_block[i::n_tasks] = slopes
+    slopes = np.concatenate(per_block, axis=1)
+    
+    tail = (1.0 - credible_level) / 2
+    for fit, boot in zip(fits, slopes):
+        boot = boot[~np.isnan(boot)]
+        if boot.size:
+            low, high = np.quantile(boot, [tail, 1.0 - tail])
+            std = boot.std(ddof=1) if boot.size > 1 else 0.0
+        else:
+            low = high = std = np.nan
+        fit.update({
+            'exponent_std': float(std),
+            'low': float(low),
+            'high': float(high),
+            'n_boot': n_boot,
+            'credible_level': credible_level,
+        })
+    return fits
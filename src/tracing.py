@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+System Classification: A.3 He-II λ-Transition κ Analysis
+Author: Oleksii Onasenko
+Developer: SubstanceNet
+Theoretical Framework: The Emergence Parameter κ ≈ 1: An Empirical Signature 
+                       of Criticality in Physical and Biological Systems
+
+Copyright 2025 Oleksii Onasenko
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Lightweight instrumentation: named spans, counters and memory sampling.
+
+Tracing is off unless enabled by `enable()`, or in the command-line tools
+by their `--trace[=PATH]` option or the KAPPA_TRACE environment variable
+(a trace file path, or 1 for the summary only). While disabled, `span()` returns a
+shared no-op context manager and `count()` returns immediately.
+
+Traces export as Chrome trace JSON (chrome://tracing, Perfetto) and as a
+per-stage summary table. Only the enabling process is traced.
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+TRACE_ENV = 'KAPPA_TRACE'
+
+# Memory sampling period (seconds)
+SAMPLE_INTERVAL = 0.01
+
+# RSS samples kept per trace; when full, every other one is dropped and the
+# sampling period doubles
+MAX_MEMORY_SAMPLES = 10_000
+
+_tracer = None
+
+class _NullSpan:
+    """Context manager doing nothing (tracing disabled)."""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+def _rss_bytes():
+    """Current resident set size (peak RSS where /proc is unavailable, 0 without either)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource  # Unix only
+    except ImportError:
+        return 0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+class _Span:
+    """Active span recording one complete trace event."""
+    
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        self.tracer.record(self.name, self.start, end, self.args)
+        return False
+
+class Tracer:
+    """Collector of span and counter events for one process."""
+    
+    def __init__(self, sample_memory=True, interval=SAMPLE_INTERVAL,
+                 max_samples=MAX_MEMORY_SAMPLES):
+        """
+        Initialize tracer.
+        
+        Parameters
+        ----------
+        sample_memory : bool
+            Sample RSS on a background thread.
+        interval : float
+            Initial sampling period in seconds.
+        max_samples : int
+            RSS samples kept; older ones are decimated to stay below it.
+        """
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.events = []
+        self.samples = []
+        self.max_samples = max(max_samples, 2)
+        self.counters = {}
+        self.peak_rss = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = None
+        if sample_memory:
+            self._sampler = threading.Thread(target=self._sample, args=(interval,),
+                                             name='trace-memory', daemon=True)
+            self._sampler.start()
+    
+    def _ts(self, t):
+        return (t - self.origin) * 1e6
+    
+    def _sample(self, interval):
+        while not self._stop.wait(interval):
+            rss = _rss_bytes()
+            with self._lock:
+                self.peak_rss = max(self.peak_rss, rss)
+                self.samples.append({'name': 'rss_mb', 'ph': 'C', 'pid': self.pid,
+                                     'ts': self._ts(time.perf_counter()),
+                                     'args': {'rss_mb': rss / 2**20}})
+                if len(self.samples) >= self.max_samples:
+                    del self.samples[1::2]
+                    interval *= 2
+    
+    def record(self, name, start, end, args):
+        """Add a complete span event."""
+        rss = _rss_bytes()
+        event = {'name': name, 'cat': 'stage', 'ph': 'X', 'pid': self.pid,
+                 'tid': threading.get_ident(), 'ts': self._ts(start),
+                 'dur': (end - start) * 1e6, 'args': dict(args, rss_mb=rss / 2**20)}
+        with self._lock:
+            self.peak_rss = max(self.peak_rss, rss)
+            self.events.append(event)
+    
+    def count(self, name, value):
+        """Add to a counter and record its running total."""
+        with self._lock:
+            total = self.counters.get(name, 0) + value
+            self.counters[name] = total
+            self.events.append({'name': name, 'ph': 'C', 'pid': self.pid,
+                                'ts': self._ts(time.perf_counter()),
+                                'args': {name: total}})
+    
+    def stop(self):
+        """Stop memory sampling."""
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+    
+    def chrome_trace(self):
+        """Events in Chrome trace format."""
+        with self._lock:
+            events = self.events + self.samples
+        meta = {'name': 'process_name', 'ph': 'M', 'pid': self.pid,
+                'args': {'name': os.path.basename(sys.argv[0]) or 'python'}}
+        return {'traceEvents': [meta] + events, 'displayTimeUnit': 'ms'}
+    
+    def stages(self):
+        """
+        Per-stage span statistics.
+        
+        Returns
+        -------
+        dict
+            Per span name: calls, total_s, mean_s, max_s and max_rss_mb
+            (RSS at the end of the span).
+        """
+        stats = {}
+        with self._lock:
+            spans = [e for e in self.events if e['ph'] == 'X']
+        for e in spans:
+            s = stats.setdefault(e['name'], {'calls': 0, 'total_s': 0.0, 'max_s': 0.0,
+                                             'max_rss_mb': 0.0})
+            s['calls'] += 1
+            s['total_s'] += e['dur'] / 1e6
+            s['max_s'] = max(s['max_s'], e['dur'] / 1e6)
+            s['max_rss_mb'] = max(s['max_rss_mb'], e['args']['rss_mb'])
+        for s in stats.values():
+            s['mean_s'] = s['total_s'] / s['calls']
+        return stats
+    
+    def summary(self):
+        """Per-stage summary table and counter totals as text."""
+        lines = [f"{'stage':<32s} {'calls':>7s} {'total ms':>10s} {'mean ms':>9s} "
+                 f"{'max ms':>9s} {'RSS MB':>8s}"]
+        stages = sorted(self.stages().items(), key=lambda item: -item[1]['total_s'])
+        for name, s in stages:
+            lines.append(f"{name:<32s} {s['calls']:7d} {s['total_s']*1e3:10.2f} "
+                         f"{s['mean_s']*1e3:9.2f} {s['max_s']*1e3:9.2f} "
+                         f"{s['max_rss_mb']:8.1f}")
+        for name, total in sorted(self.counters.items()):
+            lines.append(f"{name:<32s} {total:>38,}")
+        lines.append(f"{'peak RSS (MB)':<32s} {self.peak_rss / 2**20:38.1f}")
+        return '\n'.join(lines)
+
+def enabled():
+    """Return True while tracing is on."""
+    return _tracer is not None
+
+def span(name, **args):
+    """
+    Context manager timing a named stage.
+    
+    Parameters
+    ----------
+    name : str
+        Stage name.
+    **args
+        JSON-serializable details attached to the trace event.
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return _Span(_tracer, name, args)
+
+def traced(name=None):
+    """Decorator wrapping every call of a function in a span."""
+    def decorate(func):
+        label = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with _Span(_tracer, label, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def iter_spans(iterable, name):
+    """Iterate, timing each item's production as a span."""
+    if _tracer is None:
+        return iterable
+    return _iter_spans(iter(iterable), name)
+
+def _iter_spans(iterator, name):
+    while True:
+        with span(name):
+            item = next(iterator, _NULL_SPAN)
+        if item is _NULL_SPAN:
+            return
+        yield item
+
+def count(name, value=1):
+    """Add `value` to a named counter (points processed, bytes written)."""
+    if _tracer is not None:
+        _tracer.count(name, value)
+
+def count_bytes(path, name='bytes_written'):
+    """Count the size of a written file or result-set directory."""
+    if _tracer is None:
+        return
+    if os.path.isdir(path):
+        size = sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+    else:
+        size = os.path.getsize(path)
+    _tracer.count(name, size)
+
+def export_chrome(path):
+    """Write the collected events as Chrome trace JSON."""
+    if _tracer is None:
+        raise RuntimeError("tracing is not enabled")
+    with open(path, 'w') as f:
+        json.dump(_tracer.chrome_trace(), f)
+
+def summary():
+    """Per-stage summary table (empty when tracing is off)."""
+    return _tracer.summary() if _tracer is not None else ''
+
+def _finish(path):
+    tracer = _tracer
+    if tracer is None or tracer.pid != os.getpid():
+        return
+    disable()
+    if path:
+        with open(path, 'w') as f:
+            json.dump(tracer.chrome_trace(), f)
+    print("\nTrace summary" + (f" (Chrome trace: {path})" if path else ""), file=sys.stderr)
+    print(tracer.summary(), file=sys.stderr)
+
+def enable(path=None, sample_memory=True, report=True):
+    """
+    Start tracing in this process.
+    
+    Parameters
+    ----------
+    path : str, optional
+        Chrome trace file written at exit.
+    sample_memory : bool
+        Sample RSS on a background thread.
+    report : bool
+        At exit, write the trace (if `path` is given) and print the
+        summary to stderr.
+        
+    Returns
+    -------
+    Tracer
+    """
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(sample_memory)
+        if report:
+            atexit.register(_finish, path)
+    return _tracer
+
+def disable():
+    """Stop tracing; returns the tracer holding the collected events."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.stop()
+    return tracer
+
+def enable_from_args(argv=None):
+    """
+    Enable tracing from a --trace[=PATH] argument or KAPPA_TRACE.
+    
+    Returns the argument list without the --trace option.
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    path = os.environ.get(TRACE_ENV)
+    for arg in list(argv):
+        if arg == '--trace' or arg.startswith('--trace='):
+            argv.remove(arg)
+            path = arg.partition('=')[2] or '1'
+    if path:
+        enable(None if path == '1' else path)
+    return argv
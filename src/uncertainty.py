@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+System Classification: A.3 He-II λ-Transition κ Analysis
+Author: Oleksii Onasenko
+Developer: SubstanceNet
+Theoretical Framework: The Emergence Parameter κ ≈ 1: An Empirical Signature 
+                       of Criticality in Physical and Biological Systems
+
+Copyright 2025 Oleksii Onasenko
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Monte Carlo propagation of exponent and T_λ uncertainties into κ statistics.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from kappa_analyzer import (ZETA, NU, T_LAMBDA, T_REF, SWEEP_MAX_BYTES,
+                            iter_kappa_sweep)
+from kappa_stats import KappaAccumulator, QuantileSketch, RunningMoments
+
+# Published one-sigma uncertainties
+ZETA_ERR = 0.0006       # Goldner et al. (1992), Lipa Table I
+NU_ERR = 0.00027        # Campostrini et al. (2001), XY universality class
+T_LAMBDA_ERR = 1e-4     # Nominal absolute uncertainty of T_λ (K)
+
+# Fields reported for every analyze() result entry (T_range split in two)
+FIELDS = ('T_lambda', 'zeta', 'nu', 'zeta_minus_nu', 'kappa_mean', 'kappa_std',
+          'kappa_min', 'kappa_max', 'kappa_at_t_001', 'kappa_at_t_01',
+          'n_points', 'T_range_min', 'T_range_max')
+
+# Samples per RNG block; blocks, not workers, define the random streams
+BLOCK_SIZE = 4096
+
+_grid = None
+
+def _init_worker(T):
+    """Store the temperature grid once per worker process."""
+    global _grid
+    _grid = T
+
+def _draw(seed_seq, n, centre, sigma):
+    """Draw (ζ, ν, T_λ) samples from independent normal distributions."""
+    rng = np.random.default_rng(seed_seq)
+    return tuple(rng.normal(c, s, n) for c, s in zip(centre, sigma))
+
+def _block_fields(T, seed_seq, n, centre, sigma, max_bytes):
+    """Evaluate the analyze() fields for one block of samples."""
+    zeta, nu, T_lambda = _draw(seed_seq, n, centre, sigma)
+    acc = KappaAccumulator(n)
+    # κ block and reduced-temperature block share the working-set cap
+    for p, q, kappa in iter_kappa_sweep(T, zeta, nu, T_lambda, T_REF, max_bytes // 2):
+        T_seg = T[q]
+        T_l = T_lambda[p, None]
+        t = np.abs(1.0 - T_seg / T_l)
+        acc.update(T_seg, t, kappa, T_seg < T_l, rows=p)
+    stats = acc.finalize()
+    return np.column_stack([
+        T_lambda, zeta, nu, zeta - nu,
+        stats['kappa_mean'], stats['kappa_std'], stats['kappa_min'],
+        stats['kappa_max'], stats['kappa_at_t_001'], stats['kappa_at_t_01'],
+        stats['n_points'], stats['T_min'], stats['T_max'],
+    ])
+
+def _run_blocks(blocks, centre, sigma, max_bytes, lo, hi, n_bins):
+    """
+    Worker task: evaluate a run of blocks.
+    
+    Returns per-block moments (merged in block order by the caller, so the
+    result does not depend on the number of workers) and one merged sketch.
+    """
+    sketch = QuantileSketch(lo, hi, n_bins)
+    moments = []
+    for seed_seq, n in blocks:
+        values = _block_fields(_grid, seed_seq, n, centre, sigma, max_bytes)
+        block_moments = RunningMoments(len(FIELDS))
+        block_moments.update(values)
+        moments.append(block_moments)
+        sketch.update(values)
+    return moments, sketch
+
+def propagate_uncertainty(T, n_samples=1_000_000, T_lambda=T_LAMBDA, zeta=ZETA,
+                          nu=NU, sigma_T_lambda=T_LAMBDA_ERR, sigma_zeta=ZETA_ERR,
+                          sigma_nu=NU_ERR, credible_level=0.95, seed=0,
+                          workers=None, block_size=BLOCK_SIZE,
+                          max_bytes=SWEEP_MAX_BYTES, n_bins=4096):
+    """
+    Propagate (ζ, ν, T_λ) uncertainties into the κ summary statistics.
+    
+    Samples are drawn in blocks, each from its own child of one
+    `SeedSequence`, and evaluated as vectorized κ sweeps over the grid.
+    Blocks are spread over a process pool; only streaming reductions
+    (Welford moments and a histogram quantile sketch) are kept.
+    
+    Parameters
+    ----------
+    T : array_like
+        Temperature grid in Kelvin.
+    n_samples : int
+        Number of Monte Carlo samples.
+    T_lambda, zeta, nu : float
+        Central values.
+    sigma_T_lambda, sigma_zeta, sigma_nu : float
+        One-sigma uncertainties (normal distributions).
+    credible_level : float
+        Probability mass of the central credible interval.
+    seed : int
+        Root seed; results are reproducible for any number of workers.
+    workers : int, optional
+        Worker processes (defaults to the CPU count; 1 runs in-process).
+    block_size : int
+        Samples per RNG block.
+    max_bytes : int
+        Working-set cap per κ block.
+    n_bins : int
+        Resolution of the quantile sketch.
+        
+    Returns
+    -------
+    dict
+        Per analyze() field (T_range split into T_range_min/T_range_max):
+        mean, std, median and the credible interval bounds low/high.
+    """
+    if n_samples < 1:
+        raise ValueError("n_samples must be positive")
+    T = np.asarray(T, dtype=float).ravel()
+    centre = (zeta, nu, T_lambda)
+    sigma = (sigma_zeta, sigma_nu, sigma_T_lambda)
+    block_size = max(1, min(block_size, max_bytes // (2 * 9 * max(T.size, 1))))
+    
+    sizes = [block_size] * (n_samples // block_size)
+    if n_samples % block_size:
+        sizes.append(n_samples % block_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    blocks = list(zip(seeds, sizes))
+    
+    # Sketch edges from the first block, widened to absorb the tails
+    pilot = _block_fields(T, seeds[0], sizes[0], centre, sigma, max_bytes)
+    valid = ~np.isnan(pilot)
+    lo = np.min(pilot, axis=0, initial=np.inf, where=valid)
+    hi = np.max(pilot, axis=0, initial=-np.inf, where=valid)
+    lo, hi = np.where(valid.any(axis=0), lo, 0.0), np.where(valid.any(axis=0), hi, 1.0)
+    pad = np.maximum(hi - lo, 1e-12 * np.maximum(np.abs(lo), 1.0))
+    lo, hi = lo - pad, hi + pad
+    
+    # The pilot block is merged first; the remaining blocks go to the pool
+    pilot_moments = RunningMoments(len(FIELDS))
+    pilot_moments.update(pilot)
+    moments = RunningMoments(len(FIELDS))
+    moments.merge(pilot_moments)
+    sketch = QuantileSketch(lo, hi, n_bins)
+    sketch.update(pilot)
+    rest = blocks[1:]
+    
+    workers = workers or os.cpu_count() or 1
+    n_tasks = min(len(rest), 4 * workers)
+    tasks = [rest[i::n_tasks] for i in range(n_tasks)]
+    args = (centre, sigma, max_bytes, lo, hi, n_bins)
+    
+    if not tasks:
+        results = []
+    elif workers == 1:
+        _init_worker(T)
+        results = [_run_blocks(task, *args) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(T,)) as pool:
+            results = list(pool.map(_run_blocks, tasks, *[[a] * n_tasks for a in args]))
+    
+    # Merge moments in block order for bit-reproducibility
+    per_block = [None] * len(rest)
+    for i, (block_moments, _) in enumerate(results):
+        per_block[i::n_tasks] = block_moments
+    for block_moments in per_block:
+        moments.merge(block_moments)
+    for _, other in results:
+        sketch.merge(other)
+    
+    tail = (1.0 - credible_level) / 2
+    low, median, high = (sketch.quantile(q) for q in (tail, 0.5, 1.0 - tail))
+    std = moments.std()
+    summary = {
+        'n_samples': n_samples,
+        'credible_level': credible_level,
+        'seed': seed,
+    }
+    for i, field in enumerate(FIELDS):
+        summary[field] = {
+            'mean': moments.mean[i] if moments.count[i] else np.nan,
+            'std': std[i],
+            'median': median[i],
+            'low': low[i],
+            'high': high[i],
+        }
+    return summary
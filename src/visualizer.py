@@ -24,40 +24,530 @@ Visualization tools for He-II λ-transition κ analysis.
 """
 
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib as mpl
 from pathlib import Path
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import json
+import os
 import sys
+import time
 
-# Publication-quality settings
-mpl.rcParams['figure.dpi'] = 600
-mpl.rcParams['savefig.dpi'] = 600
-mpl.rcParams['font.size'] = 11
-mpl.rcParams['font.family'] = 'sans-serif'
-mpl.rcParams['axes.labelsize'] = 12
-mpl.rcParams['axes.titlesize'] = 13
-mpl.rcParams['xtick.labelsize'] = 10
-mpl.rcParams['ytick.labelsize'] = 10
-mpl.rcParams['legend.fontsize'] = 10
-mpl.rcParams['lines.linewidth'] = 2
-mpl.rcParams['lines.markersize'] = 6
+from kappa_analyzer import T_LAMBDA, T_REF, ZETA, NU, HeliumLambdaAnalyzer, __version__
+from result_cache import cache_key
+from results_io import HEADER_NAME, is_column_store, open_columns
+from scaling_fit import fit_power_law
+from tracing import count, count_bytes, enable_from_args, span, traced
+
+# Publication-quality settings, applied when pyplot is first loaded
+RC_PARAMS = {
+    'figure.dpi': 600,
+    'savefig.dpi': 600,
+    'font.size': 11,
+    'font.family': 'sans-serif',
+    'axes.labelsize': 12,
+    'axes.titlesize': 13,
+    'xtick.labelsize': 10,
+    'ytick.labelsize': 10,
+    'legend.fontsize': 10,
+    'lines.linewidth': 2,
+    'lines.markersize': 6,
+}
+
+# Default point budget for each plotted panel (level-of-detail decimation)
+LOD_MAX_POINTS = 4000
+
+# Figure methods rendered by generate_all_figures, in output order
+FIGURES = ('plot_kappa_plateau', 'plot_component_analysis',
+           'plot_phase_diagram', 'plot_scaling_verification')
+
+FIGURE_FILES = {
+    'plot_kappa_plateau': 'fig1_kappa_plateau.png',
+    'plot_component_analysis': 'fig2_component_analysis.png',
+    'plot_phase_diagram': 'fig3_phase_diagram.png',
+    'plot_scaling_verification': 'fig4_scaling_verification.png',
+}
+
+# Per-figure input digests of the last render, kept in the output directory
+FIGURE_INPUTS_NAME = '.figure_inputs.json'
+
+_plt = None
+
+def _pyplot():
+    """Import pyplot on first use and apply the publication settings."""
+    global _plt
+    if _plt is None:
+        import matplotlib as mpl
+        import matplotlib.pyplot as plt
+        mpl.rcParams.update(RC_PARAMS)
+        _plt = plt
+    return _plt
+
+def _savefig(plt, path):
+    """Save the current figure (or a Figure) at publication resolution, traced per file."""
+    with span('savefig', file=os.path.basename(path)):
+        plt.savefig(path, dpi=600, bbox_inches='tight')
+    count_bytes(path)
+
+# Figure templates of this process, by figure method
+_templates = {}
+
+# Subplot parameters computed by tight_layout, by template layout key
+_layouts = {}
+LAYOUT_CACHE_SIZE = 256
+
+class FigureTemplate:
+    """
+    A figure whose static artists are built once per process.
+    
+    Axes, labels, titles, text boxes, reference lines and legends are
+    created on first use; each render only swaps line data, spans and
+    dynamic label text, rescales, and saves. tight_layout results are
+    cached by axis limits and dynamic text, which (with the static
+    artists) determine the layout, so output is identical to building the
+    figure from scratch.
+    """
+    
+    def __init__(self, name, figsize, nrows=1, ncols=1):
+        """
+        Create an empty template figure (not managed by pyplot).
+        
+        Parameters
+        ----------
+        name : str
+            Template name (layout cache key).
+        figsize : tuple
+            Figure size in inches.
+        nrows, ncols : int
+            Subplot grid.
+        """
+        from matplotlib.figure import Figure
+        
+        _pyplot()
+        self.name = name
+        self.fig = Figure(figsize=figsize)
+        self.axes = self.fig.subplots(nrows, ncols)
+        self.artists = {}
+        self._legend_texts = {}
+        self._texts = []
+    
+    def add(self, name, artist):
+        """Register a dynamic artist under `name` and return it."""
+        if isinstance(artist, list):
+            artist, = artist
+        self.artists[name] = artist
+        return artist
+    
+    def add_text(self, name, text):
+        """Register a Text whose string or position changes per render."""
+        self._texts.append(self.add(name, text))
+        return text
+    
+    def legend(self, ax, **kwargs):
+        """Create the legend of `ax`, tracking entries of registered artists."""
+        legend = ax.legend(**kwargs)
+        handles, _ = ax.get_legend_handles_labels()
+        for name, artist in self.artists.items():
+            if artist in handles:
+                text = legend.get_texts()[handles.index(artist)]
+                self._legend_texts[name] = text
+                self._texts.append(text)
+        return legend
+    
+    def set_label(self, name, label):
+        """Relabel a registered artist and its legend entry."""
+        self.artists[name].set_label(label)
+        self._legend_texts[name].set_text(label)
+    
+    def set_span(self, name, v0, v1, vertical=False):
+        """Move a registered axhspan (axvspan if `vertical`) to cover [v0, v1]."""
+        patch = self.artists[name]
+        if hasattr(patch, 'set_height'):
+            if vertical:
+                patch.set_x(v0)
+                patch.set_width(v1 - v0)
+            else:
+                patch.set_y(v0)
+                patch.set_height(v1 - v0)
+        else:
+            # Polygon spans of older matplotlib
+            (a0, b0), _, (a1, b1), _ = patch.get_xy()[:4]
+            if vertical:
+                patch.set_xy([(v0, b0), (v0, b1), (v1, b1), (v1, b0), (v0, b0)])
+            else:
+                patch.set_xy([(a0, v0), (a0, v1), (a1, v1), (a1, v0), (a0, v0)])
+    
+    def _layout_key(self):
+        limits = tuple((ax.get_xlim(), ax.get_ylim()) for ax in self.fig.axes)
+        texts = tuple((t.get_text(), t.get_position()) for t in self._texts)
+        return self.name, limits, texts
+    
+    def render(self, path):
+        """Rescale to the current data, lay out and save the figure."""
+        for ax in self.fig.axes:
+            ax.relim()
+            ax.autoscale_view()
+        
+        key = self._layout_key()
+        params = _layouts.get(key)
+        if params is None:
+            import matplotlib as mpl
+            
+            # Lay out from the default subplot parameters, as a fresh figure would
+            self.fig.subplots_adjust(**{k: mpl.rcParams[f'figure.subplot.{k}']
+                                        for k in ('left', 'right', 'bottom', 'top',
+                                                  'wspace', 'hspace')})
+            with span('tight_layout', figure=self.name):
+                self.fig.tight_layout()
+            sp = self.fig.subplotpars
+            params = dict(left=sp.left, right=sp.right, bottom=sp.bottom, top=sp.top,
+                          wspace=sp.wspace, hspace=sp.hspace)
+            if len(_layouts) >= LAYOUT_CACHE_SIZE:
+                _layouts.pop(next(iter(_layouts)))
+            _layouts[key] = params
+        else:
+            count('layout_cache_hits')
+            self.fig.subplots_adjust(**params)
+        _savefig(self.fig, path)
+
+def _template(name, build):
+    """The process-wide template `name`, created by `build()` on first use."""
+    template = _templates.get(name)
+    if template is None:
+        with span('build_template', figure=name):
+            template = _templates[name] = build()
+    return template
+
+def clear_templates():
+    """Drop all figure templates and cached layouts (e.g. after changing rcParams)."""
+    _templates.clear()
+    _layouts.clear()
+
+@functools.lru_cache(maxsize=64)
+def _normal_branch(T_lambda, zeta, nu):
+    """Model κ for T ≥ T_λ (the normal branch of figure 3), computed once per model."""
+    T_normal = np.linspace(T_lambda, 2.5, 500)
+    kappa_normal, _ = HeliumLambdaAnalyzer(T_lambda, zeta, nu).calculate_kappa(T_normal)
+    return T_normal, kappa_normal
+
+def source_fingerprint(data_path):
+    """
+    Cheap content fingerprint of a data file or binary result set.
+    
+    Combines the binary header (row count, metadata) with the size and
+    modification time of every data file.
+    """
+    if is_column_store(data_path):
+        with open(os.path.join(data_path, HEADER_NAME), 'rb') as f:
+            header = f.read().decode()
+        files = sorted(os.path.join(data_path, name) for name in os.listdir(data_path)
+                       if name.endswith('.bin'))
+    else:
+        header = ''
+        files = [data_path]
+    stats = [(os.path.basename(p), os.stat(p).st_size, os.stat(p).st_mtime_ns)
+             for p in files]
+    return cache_key(header=header, files=stats)
+
+def lod_indices(t, series, max_points=LOD_MAX_POINTS):
+    """
+    Select points preserving the visual envelope of y(log t).
+    
+    The log t range is split into equal buckets; for every series the
+    minimum and maximum of each bucket are kept, together with the points
+    of smallest and largest t (the near-critical end is never dropped).
+    
+    Parameters
+    ----------
+    t : array_like
+        Reduced temperature (x axis, plotted on a log scale).
+    series : sequence of array_like
+        Y values sharing the x axis.
+    max_points : int or None
+        Point budget; None disables decimation.
+        
+    Returns
+    -------
+    ndarray
+        Sorted row indices to plot.
+    """
+    t = np.asarray(t)
+    n = t.size
+    if max_points is None or n <= max_points:
+        return np.arange(n)
+    
+    n_buckets = max(1, max_points // (2 * len(series)))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_t = np.log10(t)
+    finite = np.isfinite(log_t)
+    lo, hi = log_t[finite].min(), log_t[finite].max()
+    scale = n_buckets / (hi - lo) if hi > lo else 0.0
+    bucket = np.clip(((np.where(finite, log_t, lo) - lo) * scale).astype(np.int64),
+                     0, n_buckets - 1)
+    
+    keep = [np.array([np.argmin(np.where(finite, t, np.inf)), np.argmax(t)])]
+    for values in series:
+        order = np.lexsort((np.asarray(values), bucket))
+        edges = np.flatnonzero(np.diff(bucket[order])) + 1
+        keep.append(order[np.r_[0, edges]])          # bucket minima
+        keep.append(order[np.r_[edges - 1, n - 1]])  # bucket maxima
+    return np.unique(np.concatenate(keep))
+
+def _share_frame(data):
+    """
+    Copy DataFrame columns into one shared-memory block.
+    
+    Returns
+    -------
+    tuple
+        (SharedMemory, layout) where layout lists (name, dtype, offset, n).
+    """
+    layout = []
+    offset = 0
+    for name in data.columns:
+        values = data[name].values
+        layout.append((name, values.dtype.str, offset, len(values)))
+        offset += -(-values.nbytes // 64) * 64
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    for (name, dtype, start, n), values in zip(layout, (data[c].values for c in data.columns)):
+        np.ndarray(n, dtype=dtype, buffer=shm.buf, offset=start)[:] = values
+    return shm, layout
+
+def _attach_frame(shm, layout):
+    """Read-only DataFrame view over a shared-memory block."""
+    import pandas as pd
+    
+    columns = {}
+    for name, dtype, start, n in layout:
+        column = np.ndarray(n, dtype=dtype, buffer=shm.buf, offset=start)
+        column.flags.writeable = False
+        columns[name] = column
+    return pd.DataFrame(columns, copy=False)
+
+def _init_render_worker():
+    """Render workers draw off-screen."""
+    _pyplot().switch_backend('Agg')
+
+def _render_figure(shm_name, layout, metadata, max_points, method, output_dir):
+    """Worker task: render one figure from shared data, return its wall time."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        viz = HeliumVisualizer.from_data(_attach_frame(shm, layout), metadata,
+                                         max_points)
+        start = time.perf_counter()
+        getattr(viz, method)(output_dir)
+        elapsed = time.perf_counter() - start
+        del viz
+    finally:
+        shm.close()
+    return method, elapsed
+
+def _build_kappa_plateau():
+    """Static part of figure 1."""
+    tpl = FigureTemplate('kappa_plateau', (10, 6))
+    ax = tpl.axes
+    
+    tpl.add('kappa', ax.semilogx([], [], 
+                                 'o-', color='#e74c3c', alpha=0.7, 
+                                 label='κ(t)', markersize=4))
+    
+    ax.axhline(y=1.0, color='k', linestyle='--', 
+              linewidth=1.5, alpha=0.5, label='κ = 1')
+    
+    tpl.add('band', ax.axhspan(0.0, 1.0, alpha=0.2, color='green', label=' '))
+    
+    ax.axvline(x=1e-9, color='purple', linestyle=':', 
+              linewidth=2, alpha=0.7, label='Critical point (t→0)')
+    
+    ax.set_xlabel('Reduced Temperature t = |1 - T/T$_λ$|', fontsize=13)
+    ax.set_ylabel('Emergence Parameter κ', fontsize=13)
+    ax.set_title('He-II: κ Plateau in Superfluid Phase', 
+                fontsize=14, fontweight='bold')
+    tpl.legend(ax, loc='best', framealpha=0.9)
+    ax.grid(True, alpha=0.3, which='both')
+    ax.set_autoscalex_on(False)  # x limits follow the data t range
+    
+    ax.text(0.5, 0.95, 'κ ≈ 1: Stable Emergent State', 
+           transform=ax.transAxes, fontsize=11,
+           bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.3),
+           verticalalignment='top', horizontalalignment='center')
+    return tpl
+
+def _build_component_analysis():
+    """Static part of figure 2."""
+    tpl = FigureTemplate('component_analysis', (10, 10), 3, 1)
+    ax1, ax2, ax3 = tpl.axes
+    
+    # Panel 1: Superfluid density
+    tpl.add('rho_s', ax1.loglog([], [], 
+                                'o-', color='#3498db', alpha=0.7, markersize=4))
+    ax1.set_ylabel('τ = ρ$_s$/ρ\n(Topological Order)', fontsize=12)
+    ax1.set_title('Component Analysis: τ ∝ t$^{ζ}$ and Λ ∝ t$^{-ν}$', 
+                 fontsize=13, fontweight='bold')
+    ax1.grid(True, alpha=0.3, which='both')
+    tpl.add_text('zeta', ax1.text(0.05, 0.95, '', transform=ax1.transAxes,
+                                  fontsize=10, verticalalignment='top',
+                                  bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5)))
+    
+    # Panel 2: Correlation length
+    tpl.add('xi_norm', ax2.loglog([], [], 
+                                  'o-', color='#f39c12', alpha=0.7, markersize=4))
+    ax2.set_ylabel('Λ/Λ$_c$ = ξ/ξ$_{ref}$\n(Correlation)', fontsize=12)
+    ax2.grid(True, alpha=0.3, which='both')
+    tpl.add_text('nu', ax2.text(0.05, 0.95, '', transform=ax2.transAxes,
+                                fontsize=10, verticalalignment='top',
+                                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5)))
+    
+    # Panel 3: κ
+    tpl.add('kappa', ax3.semilogx([], [], 
+                                  'o-', color='#e74c3c', alpha=0.7, markersize=4))
+    ax3.axhline(y=1.0, color='k', linestyle='--', linewidth=1.5, alpha=0.5)
+    ax3.set_ylabel('κ = τ × (Λ/Λ$_c$)', fontsize=12)
+    ax3.set_xlabel('Reduced Temperature t = |1 - T/T$_λ$|', fontsize=13)
+    ax3.grid(True, alpha=0.3, which='both')
+    
+    tpl.add_text('exponent', ax3.text(0.5, 0.95, '', 
+                                      transform=ax3.transAxes, fontsize=11,
+                                      bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.5),
+                                      verticalalignment='top', horizontalalignment='center'))
+    return tpl
+
+def _build_phase_diagram():
+    """Static part of figure 3."""
+    tpl = FigureTemplate('phase_diagram', (10, 6))
+    ax = tpl.axes
+    
+    tpl.add('superfluid', ax.plot([], [], 
+                                  'r-', linewidth=3, label='Superfluid (He-II): κ ≈ 1'))
+    tpl.add('normal', ax.plot([], [], 
+                              'b-', linewidth=3, label='Normal (He-I): κ = 0'))
+    
+    tpl.add('T_lambda', ax.axvline(x=T_LAMBDA, color='purple', linestyle='--', 
+                                   linewidth=2, alpha=0.7))
+    tpl.add_text('T_lambda_text', ax.text(T_LAMBDA, 0.5, '',
+                                          rotation=90, verticalalignment='center', fontsize=11,
+                                          bbox=dict(boxstyle='round', facecolor='lavender', alpha=0.7)))
+    
+    tpl.add('emergent', ax.axvspan(0.5, T_LAMBDA, alpha=0.2, color='red', label='Emergent Phase'))
+    tpl.add('non_emergent', ax.axvspan(T_LAMBDA, 2.5, alpha=0.2, color='blue', label='Non-Emergent'))
+    
+    ax.set_xlabel('Temperature T (K)', fontsize=13)
+    ax.set_ylabel('Emergence Parameter κ', fontsize=13)
+    ax.set_title('He-II Phase Diagram: Emergent vs Non-Emergent States', 
+                fontsize=14, fontweight='bold')
+    ax.set_ylim(-0.1, 1.3)
+    tpl.legend(ax, loc='upper right', framealpha=0.9)
+    ax.grid(True, alpha=0.3)
+    return tpl
+
+def _build_scaling_verification():
+    """Static part of figure 4."""
+    tpl = FigureTemplate('scaling_verification', (14, 6), 1, 2)
+    ax1, ax2 = tpl.axes
+    
+    tpl.add('kappa', ax1.loglog([], [], 
+                                'o', color='#e74c3c', alpha=0.6, markersize=5, label='Calculated κ'))
+    tpl.add('theory', ax1.loglog([], [], 
+                                 'k--', linewidth=2, alpha=0.7, label=' '))
+    tpl.add('fit', ax1.loglog([], [], 
+                              'b-', linewidth=1.5, alpha=0.7, label=' '))
+    
+    ax1.set_xlabel('Reduced Temperature t', fontsize=12)
+    ax1.set_ylabel('κ', fontsize=12)
+    ax1.set_title('Scaling Verification (log-log)', fontsize=13, fontweight='bold')
+    tpl.legend(ax1, loc='best', framealpha=0.9)
+    ax1.grid(True, alpha=0.3, which='both')
+    
+    tpl.add('plateau', ax2.plot([], [], 
+                                'o-', color='#e74c3c', alpha=0.7, markersize=4))
+    
+    tpl.add('mean', ax2.axhline(y=1.0, color='green', linestyle='--', 
+                                linewidth=2, label=' '))
+    ax2.axhline(y=1.0, color='k', linestyle=':', 
+               linewidth=1.5, alpha=0.5, label='κ = 1')
+    
+    ax2.set_xlabel('Reduced Temperature t', fontsize=12)
+    ax2.set_ylabel('κ', fontsize=12)
+    ax2.set_title('κ ≈ const Plateau (linear scale)', fontsize=13, fontweight='bold')
+    tpl.legend(ax2, loc='best', framealpha=0.9)
+    ax2.grid(True, alpha=0.3)
+    ax2.set_xscale('log')
+    return tpl
 
 class HeliumVisualizer:
     """Visualization for He-II λ-transition analysis."""
     
-    def __init__(self, data_path):
+    def __init__(self, data_path, columns=None, max_points=LOD_MAX_POINTS):
         """
         Initialize visualizer.
         
         Parameters
         ----------
         data_path : str
-            Path to CSV data file.
+            Path to a CSV data file or a binary result set (kappa_analysis.kbin).
+        columns : sequence of str, optional
+            Columns to load; binary result sets map only these, lazily.
+        max_points : int or None
+            Point budget per plotted panel; larger series are decimated with
+            `lod_indices`. None plots every point.
+        """
+        import pandas as pd
+        
+        self.max_points = max_points
+        self.data_path = data_path
+        if is_column_store(data_path):
+            with span('open_columns'):
+                store = open_columns(data_path)
+                self.data = store.to_frame(columns)
+            metadata = store.metadata
+            if len(metadata.get('segments', ())) > 1 and 'T' in self.data:
+                # Appended segments are sorted individually; plot in T order
+                self.data = self.data.sort_values('T', kind='stable', ignore_index=True)
+        else:
+            with span('read_csv'):
+                self.data = pd.read_csv(data_path, usecols=columns)
+            metadata = {}
+        self._set_metadata(metadata)
+    
+    @classmethod
+    def from_data(cls, data, metadata=None, max_points=LOD_MAX_POINTS):
+        """
+        Create a visualizer for an in-memory table.
+        
+        Parameters
+        ----------
+        data : DataFrame
+            Analysis data with the kappa_analysis columns.
+        metadata : dict, optional
+            T_lambda, zeta and nu (defaults to the vapor-pressure values).
+        max_points : int or None
+            Point budget per plotted panel.
+            
+        Returns
+        -------
+        HeliumVisualizer
         """
-        self.data = pd.read_csv(data_path)
-        self.T_lambda = 2.1768
+        viz = cls.__new__(cls)
+        viz.data = data
+        viz.data_path = None
+        viz.max_points = max_points
+        viz._set_metadata(metadata or {})
+        return viz
+    
+    def _decimate(self, data_super, *columns):
+        """Rows of `data_super` kept by level-of-detail decimation."""
+        idx = lod_indices(data_super['t'].values,
+                          [data_super[c].values for c in columns], self.max_points)
+        if len(idx) == len(data_super):
+            return data_super
+        return data_super.iloc[idx]
+    
+    def _set_metadata(self, metadata):
+        self.T_lambda = metadata.get('T_lambda', T_LAMBDA)
+        self.zeta = metadata.get('zeta', ZETA)
+        self.nu = metadata.get('nu', NU)
         
+    @traced('plot_kappa_plateau')
     def plot_kappa_plateau(self, output_dir='../figures'):
         """
         Figure 1: κ Plateau Throughout Superfluid Phase.
@@ -67,45 +557,25 @@ class HeliumVisualizer:
         output_dir : str
             Output directory path.
         """
-        fig, ax = plt.subplots(figsize=(10, 6))
+        tpl = _template('kappa_plateau', _build_kappa_plateau)
         
         mask = self.data['T'] < self.T_lambda
         data_super = self.data[mask]
-        
-        ax.semilogx(data_super['t'], data_super['kappa'], 
-                   'o-', color='#e74c3c', alpha=0.7, 
-                   label='κ(t)', markersize=4)
-        
-        ax.axhline(y=1.0, color='k', linestyle='--', 
-                  linewidth=1.5, alpha=0.5, label='κ = 1')
+        data_plot = self._decimate(data_super, 'kappa')
+        tpl.artists['kappa'].set_data(data_plot['t'], data_plot['kappa'])
         
         kappa_mean = data_super['kappa'].mean()
         kappa_std = data_super['kappa'].std()
-        ax.axhspan(kappa_mean - kappa_std, kappa_mean + kappa_std,
-                  alpha=0.2, color='green', label=f'κ = {kappa_mean:.3f} ± {kappa_std:.3f}')
-        
-        ax.axvline(x=1e-9, color='purple', linestyle=':', 
-                  linewidth=2, alpha=0.7, label='Critical point (t→0)')
-        
-        ax.set_xlabel('Reduced Temperature t = |1 - T/T$_λ$|', fontsize=13)
-        ax.set_ylabel('Emergence Parameter κ', fontsize=13)
-        ax.set_title('He-II: κ Plateau in Superfluid Phase', 
-                    fontsize=14, fontweight='bold')
-        ax.legend(loc='best', framealpha=0.9)
-        ax.grid(True, alpha=0.3, which='both')
-        ax.set_xlim(data_super['t'].min() * 0.8, data_super['t'].max() * 1.2)
+        tpl.set_span('band', kappa_mean - kappa_std, kappa_mean + kappa_std)
+        tpl.set_label('band', f'κ = {kappa_mean:.3f} ± {kappa_std:.3f}')
         
-        ax.text(0.5, 0.95, 'κ ≈ 1: Stable Emergent State', 
-               transform=ax.transAxes, fontsize=11,
-               bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.3),
-               verticalalignment='top', horizontalalignment='center')
+        tpl.axes.set_xlim(data_super['t'].min() * 0.8, data_super['t'].max() * 1.2)
         
         Path(output_dir).mkdir(exist_ok=True)
-        plt.tight_layout()
-        plt.savefig(f'{output_dir}/fig1_kappa_plateau.png', dpi=600, bbox_inches='tight')
+        tpl.render(f'{output_dir}/fig1_kappa_plateau.png')
         print(f"Saved: {output_dir}/fig1_kappa_plateau.png")
-        plt.close()
         
+    @traced('plot_component_analysis')
     def plot_component_analysis(self, output_dir='../figures'):
         """
         Figure 2: Component Analysis (τ and Λ/Λ_c).
@@ -115,50 +585,24 @@ class HeliumVisualizer:
         output_dir : str
             Output directory path.
         """
+        tpl = _template('component_analysis', _build_component_analysis)
+        
         mask = self.data['T'] < self.T_lambda
         data_super = self.data[mask]
         
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(10, 10))
-        
-        # Panel 1: Superfluid density
-        ax1.loglog(data_super['t'], data_super['rho_s'], 
-                  'o-', color='#3498db', alpha=0.7, markersize=4)
-        ax1.set_ylabel('τ = ρ$_s$/ρ\n(Topological Order)', fontsize=12)
-        ax1.set_title('Component Analysis: τ ∝ t$^{ζ}$ and Λ ∝ t$^{-ν}$', 
-                     fontsize=13, fontweight='bold')
-        ax1.grid(True, alpha=0.3, which='both')
-        ax1.text(0.05, 0.95, f'ζ = 0.6705', transform=ax1.transAxes,
-                fontsize=10, verticalalignment='top',
-                bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
-        
-        # Panel 2: Correlation length
-        ax2.loglog(data_super['t'], data_super['xi_norm'], 
-                  'o-', color='#f39c12', alpha=0.7, markersize=4)
-        ax2.set_ylabel('Λ/Λ$_c$ = ξ/ξ$_{ref}$\n(Correlation)', fontsize=12)
-        ax2.grid(True, alpha=0.3, which='both')
-        ax2.text(0.05, 0.95, f'ν = 0.6717', transform=ax2.transAxes,
-                fontsize=10, verticalalignment='top',
-                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-        
-        # Panel 3: κ
-        ax3.semilogx(data_super['t'], data_super['kappa'], 
-                    'o-', color='#e74c3c', alpha=0.7, markersize=4)
-        ax3.axhline(y=1.0, color='k', linestyle='--', linewidth=1.5, alpha=0.5)
-        ax3.set_ylabel('κ = τ × (Λ/Λ$_c$)', fontsize=12)
-        ax3.set_xlabel('Reduced Temperature t = |1 - T/T$_λ$|', fontsize=13)
-        ax3.grid(True, alpha=0.3, which='both')
-        
-        exponent = 0.6705 - 0.6717
-        ax3.text(0.5, 0.95, f'κ ∝ t$^{{ζ-ν}}$ = t$^{{{exponent:.4f}}}$ ≈ const', 
-                transform=ax3.transAxes, fontsize=11,
-                bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.5),
-                verticalalignment='top', horizontalalignment='center')
+        data_plot = self._decimate(data_super, 'rho_s', 'xi_norm', 'kappa')
+        for name in ('rho_s', 'xi_norm', 'kappa'):
+            tpl.artists[name].set_data(data_plot['t'], data_plot[name])
         
-        plt.tight_layout()
-        plt.savefig(f'{output_dir}/fig2_component_analysis.png', dpi=600, bbox_inches='tight')
+        exponent = self.zeta - self.nu
+        tpl.artists['zeta'].set_text(f'ζ = {self.zeta:.4f}')
+        tpl.artists['nu'].set_text(f'ν = {self.nu:.4f}')
+        tpl.artists['exponent'].set_text(f'κ ∝ t$^{{ζ-ν}}$ = t$^{{{exponent:.4f}}}$ ≈ const')
+        
+        tpl.render(f'{output_dir}/fig2_component_analysis.png')
         print(f"Saved: {output_dir}/fig2_component_analysis.png")
-        plt.close()
         
+    @traced('plot_phase_diagram')
     def plot_phase_diagram(self, output_dir='../figures'):
         """
         Figure 3: Phase Diagram with κ Regimes.
@@ -168,42 +612,73 @@ class HeliumVisualizer:
         output_dir : str
             Output directory path.
         """
-        fig, ax = plt.subplots(figsize=(10, 6))
+        tpl = _template('phase_diagram', _build_phase_diagram)
+        
+        mask = self.data['T'] < self.T_lambda
+        data_plot = self._decimate(self.data[mask], 'kappa')
+        tpl.artists['superfluid'].set_data(data_plot['T'], data_plot['kappa'])
+        
+        # Normal branch from the model: κ = 0 for T ≥ T_λ
+        tpl.artists['normal'].set_data(*_normal_branch(self.T_lambda, self.zeta, self.nu))
+        
+        tpl.artists['T_lambda'].set_xdata([self.T_lambda, self.T_lambda])
+        tpl.artists['T_lambda_text'].set_position((self.T_lambda, 0.5))
+        tpl.artists['T_lambda_text'].set_text(f'  T$_λ$ = {self.T_lambda} K')
+        tpl.set_span('emergent', 0.5, self.T_lambda, vertical=True)
+        tpl.set_span('non_emergent', self.T_lambda, 2.5, vertical=True)
+        
+        tpl.render(f'{output_dir}/fig3_phase_diagram.png')
+        print(f"Saved: {output_dir}/fig3_phase_diagram.png")
         
-        T_full = np.linspace(0.5, 2.5, 1000)
-        kappa_full = np.zeros_like(T_full)
-        mask_super = T_full < self.T_lambda
+    @traced('plot_lambda_line')
+    def plot_lambda_line(self, P, T, kappa, T_lambda_P, output_dir='../figures',
+                         max_columns=2000):
+        """
+        Figure 5: κ over the (T, P) plane with the λ-line.
         
-        kappa_full[mask_super] = 1.0
-        kappa_full[~mask_super] = 0.0
+        Parameters
+        ----------
+        P : array_like
+            Pressures in bar, shape (m,).
+        T : array_like
+            Temperatures in Kelvin, shape (n,), ascending.
+        kappa : ndarray
+            κ grid of shape (m, n), e.g. from
+            `HeliumLambdaAnalyzer.pressure_kappa_grid`.
+        T_lambda_P : array_like
+            T_λ(P), shape (m,).
+        output_dir : str
+            Output directory path.
+        max_columns : int
+            Temperature columns drawn at most (the grid is strided beyond).
+        """
+        plt = _pyplot()
         
-        ax.plot(T_full[mask_super], kappa_full[mask_super], 
-               'r-', linewidth=3, label='Superfluid (He-II): κ ≈ 1')
-        ax.plot(T_full[~mask_super], kappa_full[~mask_super], 
-               'b-', linewidth=3, label='Normal (He-I): κ = 0')
+        P = np.asarray(P)
+        T = np.asarray(T)
+        stride = max(1, -(-T.size // max_columns))
         
-        ax.axvline(x=self.T_lambda, color='purple', linestyle='--', 
-                  linewidth=2, alpha=0.7)
-        ax.text(self.T_lambda, 0.5, f'  T$_λ$ = {self.T_lambda} K',
-               rotation=90, verticalalignment='center', fontsize=11,
-               bbox=dict(boxstyle='round', facecolor='lavender', alpha=0.7))
+        fig, ax = plt.subplots(figsize=(10, 6))
         
-        ax.axvspan(0.5, self.T_lambda, alpha=0.2, color='red', label='Emergent Phase')
-        ax.axvspan(self.T_lambda, 2.5, alpha=0.2, color='blue', label='Non-Emergent')
+        mesh = ax.pcolormesh(T[::stride], P, np.asarray(kappa[:, ::stride], dtype=float),
+                             shading='nearest', cmap='RdBu_r', vmin=0.0, vmax=1.3)
+        ax.plot(T_lambda_P, P, color='purple', linestyle='--', linewidth=2,
+                label='λ-line T$_λ$(P)')
+        fig.colorbar(mesh, ax=ax, label='Emergence Parameter κ')
         
         ax.set_xlabel('Temperature T (K)', fontsize=13)
-        ax.set_ylabel('Emergence Parameter κ', fontsize=13)
-        ax.set_title('He-II Phase Diagram: Emergent vs Non-Emergent States', 
+        ax.set_ylabel('Pressure P (bar)', fontsize=13)
+        ax.set_title('He-II: κ Along the Pressure-Dependent λ-Line', 
                     fontsize=14, fontweight='bold')
-        ax.set_ylim(-0.1, 1.3)
         ax.legend(loc='upper right', framealpha=0.9)
-        ax.grid(True, alpha=0.3)
         
+        Path(output_dir).mkdir(exist_ok=True)
         plt.tight_layout()
-        plt.savefig(f'{output_dir}/fig3_phase_diagram.png', dpi=600, bbox_inches='tight')
-        print(f"Saved: {output_dir}/fig3_phase_diagram.png")
+        _savefig(plt, f'{output_dir}/fig5_lambda_line.png')
+        print(f"Saved: {output_dir}/fig5_lambda_line.png")
         plt.close()
         
+    @traced('plot_scaling_verification')
     def plot_scaling_verification(self, output_dir='../figures'):
         """
         Figure 4: Verification of κ ∝ t^(ζ-ν) ≈ const.
@@ -213,81 +688,156 @@ class HeliumVisualizer:
         output_dir : str
             Output directory path.
         """
+        tpl = _template('scaling_verification', _build_scaling_verification)
+        
         mask = self.data['T'] < self.T_lambda
         data_super = self.data[mask]
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-        
-        exponent = 0.6705 - 0.6717
+        exponent = self.zeta - self.nu
         theory = np.power(data_super['t'].values, exponent)
         theory_normalized = theory / theory[len(theory)//2] * data_super['kappa'].iloc[len(theory)//2]
         
-        ax1.loglog(data_super['t'], data_super['kappa'], 
-                  'o', color='#e74c3c', alpha=0.6, markersize=5, label='Calculated κ')
-        ax1.loglog(data_super['t'], theory_normalized, 
-                  'k--', linewidth=2, alpha=0.7, label=f'Theory: κ ∝ t$^{{{exponent:.4f}}}$')
+        idx = lod_indices(data_super['t'].values, [data_super['kappa'].values],
+                          self.max_points)
+        data_plot = data_super.iloc[idx]
+        theory_normalized = theory_normalized[idx]
         
-        ax1.set_xlabel('Reduced Temperature t', fontsize=12)
-        ax1.set_ylabel('κ', fontsize=12)
-        ax1.set_title('Scaling Verification (log-log)', fontsize=13, fontweight='bold')
-        ax1.legend(loc='best', framealpha=0.9)
-        ax1.grid(True, alpha=0.3, which='both')
+        tpl.artists['kappa'].set_data(data_plot['t'], data_plot['kappa'])
+        tpl.artists['theory'].set_data(data_plot['t'], theory_normalized)
+        tpl.set_label('theory', f'Theory: κ ∝ t$^{{{exponent:.4f}}}$')
         
-        ax2.plot(data_super['t'], data_super['kappa'], 
-                'o-', color='#e74c3c', alpha=0.7, markersize=4)
+        fit, = fit_power_law(data_super['t'].values, data_super['kappa'].values, n_boot=0)
+        fitted = fit['amplitude'] * np.power(data_plot['t'].values / T_REF, fit['exponent'])
+        tpl.artists['fit'].set_data(data_plot['t'], fitted)
+        tpl.set_label('fit', f'Fit: κ ∝ t$^{{{fit["exponent"]:.4f}}}$')
+        
+        tpl.artists['plateau'].set_data(data_plot['t'], data_plot['kappa'])
         
         mean_kappa = data_super['kappa'].mean()
-        ax2.axhline(y=mean_kappa, color='green', linestyle='--', 
-                   linewidth=2, label=f'Mean: {mean_kappa:.4f}')
-        ax2.axhline(y=1.0, color='k', linestyle=':', 
-                   linewidth=1.5, alpha=0.5, label='κ = 1')
-        
-        ax2.set_xlabel('Reduced Temperature t', fontsize=12)
-        ax2.set_ylabel('κ', fontsize=12)
-        ax2.set_title('κ ≈ const Plateau (linear scale)', fontsize=13, fontweight='bold')
-        ax2.legend(loc='best', framealpha=0.9)
-        ax2.grid(True, alpha=0.3)
-        ax2.set_xscale('log')
+        tpl.artists['mean'].set_ydata([mean_kappa, mean_kappa])
+        tpl.set_label('mean', f'Mean: {mean_kappa:.4f}')
         
-        plt.tight_layout()
-        plt.savefig(f'{output_dir}/fig4_scaling_verification.png', dpi=600, bbox_inches='tight')
+        tpl.render(f'{output_dir}/fig4_scaling_verification.png')
         print(f"Saved: {output_dir}/fig4_scaling_verification.png")
-        plt.close()
         
-    def generate_all_figures(self, output_dir='../figures'):
+    @traced('generate_all_figures')
+    def generate_all_figures(self, output_dir='../figures', parallel=False, workers=None,
+                             force=False):
         """
         Generate all publication-quality figures.
         
+        Figures whose inputs (data file, exponents, point budget, code
+        version) are unchanged since the last render into `output_dir` are
+        skipped.
+        
         Parameters
         ----------
         output_dir : str
             Output directory path.
+        parallel : bool
+            Render each figure in its own worker process (Agg backend). The
+            data are shared through a read-only shared-memory block; output
+            files are identical to the serial path.
+        workers : int, optional
+            Maximum number of worker processes.
+        force : bool
+            Re-render every figure.
+            
+        Returns
+        -------
+        dict
+            Wall time in seconds per figure method (0 for skipped figures).
         """
         print("\n" + "="*60)
         print("Generating Publication Figures")
         print("="*60)
         
-        self.plot_kappa_plateau(output_dir)
-        self.plot_component_analysis(output_dir)
-        self.plot_phase_diagram(output_dir)
-        self.plot_scaling_verification(output_dir)
+        Path(output_dir).mkdir(exist_ok=True)
         
+        inputs = self._figure_inputs()
+        recorded = {} if force else self._recorded_inputs(output_dir)
+        pending = [m for m in FIGURES
+                   if inputs is None or recorded.get(FIGURE_FILES[m]) != inputs[m]
+                   or not os.path.exists(f'{output_dir}/{FIGURE_FILES[m]}')]
+        for method in FIGURES:
+            if method not in pending:
+                print(f"Unchanged: {output_dir}/{FIGURE_FILES[method]}")
+        
+        timings = dict.fromkeys(FIGURES, 0.0)
+        if parallel and pending:
+            timings.update(self._render_parallel(output_dir, workers, pending))
+        else:
+            for method in pending:
+                start = time.perf_counter()
+                getattr(self, method)(output_dir)
+                timings[method] = time.perf_counter() - start
+        
+        if inputs is not None:
+            recorded.update({FIGURE_FILES[m]: inputs[m] for m in pending})
+            with open(f'{output_dir}/{FIGURE_INPUTS_NAME}', 'w') as f:
+                json.dump(recorded, f, indent=2, sort_keys=True)
+        
+        print("-"*60)
+        for method in FIGURES:
+            print(f"  {method:<28s} {timings[method]:8.2f} s")
         print("="*60)
         print("All figures generated")
         print(f"Location: {output_dir}/")
         print("="*60)
+        
+        return timings
+    
+    def _figure_inputs(self):
+        """Input digest per figure method, or None for in-memory data."""
+        if self.data_path is None:
+            return None
+        source = source_fingerprint(self.data_path)
+        return {method: cache_key(source=source, method=method,
+                                  T_lambda=self.T_lambda, zeta=self.zeta, nu=self.nu,
+                                  max_points=self.max_points, version=__version__)
+                for method in FIGURES}
+    
+    def _recorded_inputs(self, output_dir):
+        """Input digests stored by the previous render into `output_dir`."""
+        try:
+            with open(f'{output_dir}/{FIGURE_INPUTS_NAME}') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _render_parallel(self, output_dir, workers, methods=FIGURES):
+        """Render figure methods concurrently from a shared-memory copy of the data."""
+        metadata = {'T_lambda': self.T_lambda, 'zeta': self.zeta, 'nu': self.nu}
+        shm, layout = _share_frame(self.data)
+        try:
+            with ProcessPoolExecutor(max_workers=workers or len(methods),
+                                     initializer=_init_render_worker) as pool:
+                futures = [pool.submit(_render_figure, shm.name, layout, metadata,
+                                       self.max_points, method, output_dir)
+                           for method in methods]
+                timings = dict(f.result() for f in futures)
+        finally:
+            shm.close()
+            shm.unlink()
+        return timings
 
 def main():
     """Main visualization pipeline."""
-    if len(sys.argv) < 2:
-        print("Usage: python visualizer.py <data_csv_path>")
-        print("Example: python visualizer.py ../results/kappa_analysis.csv")
+    argv = enable_from_args()
+    args = [a for a in argv if not a.startswith('--')]
+    parallel = '--parallel' in argv
+    force = '--no-cache' in argv
+    
+    if len(args) < 1:
+        print("Usage: python visualizer.py <data_path> [--parallel] [--no-cache] [--trace[=PATH]]")
+        print("Example: python visualizer.py ../results/kappa_analysis.kbin")
+        print("         python visualizer.py ../results/kappa_analysis.csv")
         sys.exit(1)
     
-    data_path = sys.argv[1]
+    data_path = args[0]
     
     viz = HeliumVisualizer(data_path)
-    viz.generate_all_figures()
+    viz.generate_all_figures(parallel=parallel, force=force)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,11 @@
+"""Put the analysis modules in src/ and the benchmarks on the import path."""
+
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+BENCH_DIR = os.path.join(ROOT_DIR, 'benchmarks')
+for path in (SRC_DIR, BENCH_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,53 @@
+"""Adaptive sampling must not bias the summary statistics."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip('pandas')
+
+from kappa_analyzer import HeliumLambdaAnalyzer
+from kappa_stats import accumulate
+
+TOL = 1e-3
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return HeliumLambdaAnalyzer(cache=None)
+
+
+def _summary(analyzer, T, t, kappa, weights=None):
+    return analyzer._results_from(accumulate(T, t, kappa, analyzer.T_lambda, weights=weights))
+
+
+def test_adaptive_summary_matches_uniform(analyzer):
+    data = analyzer.generate_adaptive_data(tol=TOL)
+    adaptive = _summary(analyzer, data['T'].values, data['t'].values,
+                        data['kappa'].values, data['weight'].values)
+
+    T = np.linspace(data['T'].iloc[0], data['T'].iloc[-1], 2_000_000)
+    kappa, t = analyzer.calculate_kappa(T)
+    uniform = _summary(analyzer, T, t, kappa)
+
+    assert adaptive['kappa_mean'] == pytest.approx(uniform['kappa_mean'], rel=TOL)
+    assert adaptive['kappa_std'] == pytest.approx(uniform['kappa_std'], rel=20 * TOL)
+    assert adaptive['kappa_at_t_001'] == pytest.approx(uniform['kappa_at_t_001'], rel=TOL)
+    assert adaptive['kappa_at_t_01'] == pytest.approx(uniform['kappa_at_t_01'], rel=TOL)
+
+
+def test_weights_cover_temperature_range(analyzer):
+    data = analyzer.generate_adaptive_data(tol=TOL)
+    span = data['T'].iloc[-1] - data['T'].iloc[0]
+    assert np.all(data['weight'].values >= 0)
+    assert data['weight'].sum() == pytest.approx(span, rel=1e-12)
+
+
+def test_unit_weights_match_unweighted():
+    rng = np.random.default_rng(0)
+    T = np.sort(rng.uniform(0.5, 2.2, 10_001))
+    t = np.abs(1 - T / 2.1768)
+    kappa = np.where(T < 2.1768, (t / 0.01) ** -0.0012, 0.0)
+    plain = accumulate(T, t, kappa, 2.1768).finalize()
+    unit = accumulate(T, t, kappa, 2.1768, weights=np.ones_like(T)).finalize()
+    for name, value in plain.items():
+        np.testing.assert_allclose(unit[name], value, rtol=1e-12)
@@ -0,0 +1,53 @@
+"""Appending points to a stored result set."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip('pandas')
+
+from kappa_analyzer import HeliumLambdaAnalyzer
+from results_io import BINARY_NAME, open_columns
+
+
+# Appends merge the new points into the stored moments (Chan et al.), which
+# rounds differently from a single pass over the union grid
+RTOL = 1e-12
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_append_matches_full_recompute(tmp_path, streaming):
+    analyzer = HeliumLambdaAnalyzer(cache=None)
+    if streaming:
+        analyzer.analyze_streaming(20_000, output_dir=str(tmp_path), chunk_size=3_000,
+                                   export_csv=False)
+    else:
+        analyzer.generate_synthetic_data(20_000)
+        analyzer.analyze(output_dir=str(tmp_path), export_csv=False)
+    stored_T = np.array(open_columns(str(tmp_path / BINARY_NAME))['T'])
+
+    # Includes points already stored, which must be skipped
+    T = np.concatenate([np.linspace(1.0, 2.17, 333), stored_T[::1000]])
+    appended = analyzer.append_points(T, output_dir=str(tmp_path))
+
+    full = HeliumLambdaAnalyzer(cache=None)
+    full.data = analyzer.data.copy()
+    union_T = np.sort(np.concatenate([stored_T, np.setdiff1d(T, stored_T)]))
+    np.testing.assert_array_equal(np.sort(full.data['T'].values), union_T)
+    recomputed = full.analyze(output_dir=str(tmp_path / 'full'), export_csv=False)
+
+    assert appended.keys() == recomputed.keys()
+    for name, value in recomputed.items():
+        if isinstance(value, float):
+            assert appended[name] == pytest.approx(value, rel=RTOL, nan_ok=True), name
+        else:
+            assert appended[name] == value, name
+
+
+def test_reanalyze_after_append(tmp_path):
+    analyzer = HeliumLambdaAnalyzer(cache=None)
+    analyzer.generate_synthetic_data(200)
+    analyzer.analyze(output_dir=str(tmp_path), export_csv=False)
+    appended = analyzer.append_points(np.linspace(2.0, 2.1, 7), output_dir=str(tmp_path))
+    results = analyzer.analyze(output_dir=str(tmp_path), export_csv=False)
+    assert results['n_points'] == appended['n_points']
+    assert not isinstance(analyzer.data['T'].values, np.memmap)
@@ -0,0 +1,15 @@
+"""Batch manifests."""
+
+from batch_runner import load_manifest
+
+
+def test_csv_names_and_output_dirs_stay_text(tmp_path):
+    manifest = tmp_path / 'manifest.csv'
+    manifest.write_text("name,output_dir,nu,n_points,export_csv\n"
+                        "001,out/001,0.67,100,yes\n"
+                        "1e3,1e3,0.68,200,no\n")
+    first, second = load_manifest(str(manifest))
+    assert (first['name'], first['output_dir']) == ('001', 'out/001')
+    assert (second['name'], second['output_dir']) == ('1e3', '1e3')
+    assert first['nu'] == 0.67 and first['n_points'] == 100 and first['export_csv'] is True
+    assert second['export_csv'] is False
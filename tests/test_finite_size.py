@@ -0,0 +1,47 @@
+"""Data-collapse diagnostics of the finite-size engine."""
+
+import numpy as np
+import pytest
+
+from finite_size import FiniteSizeScaling
+
+L = np.logspace(1, 4, 40)
+T = 2.1768 * (1 - np.logspace(-7, -0.5, 2000))
+TRIALS = np.linspace(0.6, 0.8, 21)
+
+
+@pytest.mark.parametrize('true_nu', [0.70, 0.75])
+def test_observed_A_ratio_recovers_nu(true_nu):
+    truth = FiniteSizeScaling(nu=true_nu)
+    A_ratio = truth.kappa(L, T) / truth.xi_arrays(T)['kappa_inf']
+    result = FiniteSizeScaling().collapse(L, T, A_ratio=A_ratio, nu=TRIALS)
+    assert result['best_nu'] == pytest.approx(true_nu)
+
+
+def test_observed_kappa_memmap_matches_array(tmp_path):
+    fss = FiniteSizeScaling(max_bytes=1 << 16)
+    T_all = np.append(T, 2.3)
+    kappa = fss.kappa(L, T_all)
+    stored = np.memmap(tmp_path / 'kappa.dat', dtype=np.float64, mode='w+', shape=kappa.shape)
+    stored[:] = kappa
+    stored.flush()
+    stored = np.memmap(tmp_path / 'kappa.dat', dtype=np.float64, mode='r', shape=kappa.shape)
+
+    observed = fss.collapse(L, T_all, kappa=stored, nu=TRIALS)
+    model = fss.collapse(L, T_all, nu=TRIALS)
+    np.testing.assert_allclose(observed['residual'], model['residual'], rtol=1e-9, atol=1e-15)
+    assert observed['best_nu'] == model['best_nu']
+
+
+def test_missing_observations_are_skipped():
+    fss = FiniteSizeScaling()
+    kappa = fss.kappa(L, T)
+    kappa[::3, ::7] = np.nan
+    result = fss.collapse(L, T, kappa=kappa, nu=TRIALS)
+    assert result['n_points'] == np.isfinite(kappa).sum()
+    assert np.all(np.isfinite(result['residual']))
+
+
+def test_observed_grid_shape_checked():
+    with pytest.raises(ValueError):
+        FiniteSizeScaling().collapse(L, T, kappa=np.ones((L.size, T.size - 1)))
@@ -0,0 +1,20 @@
+"""Importing the analysis modules must stay cheap (see benchmarks/bench_kappa.py)."""
+
+import pytest
+
+from bench_kappa import IMPORT_BUDGETS, LAZY_IMPORTS, _import_profile
+
+# Fresh interpreters per module; the fastest import counts
+REPEAT = 3
+
+
+@pytest.mark.parametrize('module', sorted(IMPORT_BUDGETS))
+def test_no_lazy_packages_imported(module):
+    loaded = {name.split('.')[0] for name in _import_profile(module)}
+    assert not loaded & set(LAZY_IMPORTS)
+
+
+@pytest.mark.parametrize('module', sorted(IMPORT_BUDGETS))
+def test_import_within_budget(module):
+    elapsed = min(_import_profile(module)[module] for _ in range(REPEAT))
+    assert elapsed <= IMPORT_BUDGETS[module], f"import {module} took {elapsed * 1e3:.0f} ms"
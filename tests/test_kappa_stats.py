@@ -0,0 +1,89 @@
+"""Fused κ reductions against the pandas computation they replace."""
+
+import numpy as np
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from kappa_stats import accumulate
+
+T_LAMBDA = 2.1768
+
+
+def _data(n=50_001, seed=0, nan_fraction=0.0):
+    rng = np.random.default_rng(seed)
+    T = rng.uniform(0.5, 2.4, n)
+    t = np.abs(1 - T / T_LAMBDA)
+    kappa = np.where(T < T_LAMBDA, (t / 0.01) ** -0.0012 + rng.normal(0, 1e-3, n), 0.0)
+    if nan_fraction:
+        holes = rng.random(n) < nan_fraction
+        T[holes] = np.nan
+        t[holes] = np.nan
+        kappa[holes] = np.nan
+    return pd.DataFrame({'T': T, 't': t, 'kappa': kappa})
+
+
+def _pandas_summary(data):
+    """Statistics as computed by the original pandas analyze()."""
+    data_super = data[data['T'] < T_LAMBDA]
+    return {
+        'kappa_mean': data_super['kappa'].mean(),
+        'kappa_std': data_super['kappa'].std(),
+        'kappa_min': data_super['kappa'].min(),
+        'kappa_max': data_super['kappa'].max(),
+        'kappa_at_t_001': data_super[np.abs(data_super['t'] - 0.01) < 0.001]['kappa'].mean(),
+        'kappa_at_t_01': data_super[np.abs(data_super['t'] - 0.1) < 0.01]['kappa'].mean(),
+        'n_points': len(data_super),
+        'T_min': data_super['T'].min(),
+        'T_max': data_super['T'].max(),
+    }
+
+
+def _fused(data, **kwargs):
+    acc = accumulate(data['T'].values, data['t'].values, data['kappa'].values, T_LAMBDA,
+                     **kwargs)
+    return {name: value[0] for name, value in acc.finalize().items()}
+
+
+@pytest.mark.parametrize('block_size', [1_000, 7, 1 << 20])
+@pytest.mark.parametrize('nan_fraction', [0.0, 0.05])
+@pytest.mark.parametrize('nan_kappa', [False, True])
+def test_matches_pandas(block_size, nan_fraction, nan_kappa):
+    data = _data(nan_fraction=nan_fraction)
+    if nan_kappa:
+        # Missing κ at valid temperatures: skipped, but counted in n_points
+        data.loc[data.index[::97], 'kappa'] = np.nan
+    expected = _pandas_summary(data)
+    fused = _fused(data, block_size=block_size)
+    assert fused['n_points'] == expected['n_points']
+    for name, value in expected.items():
+        assert fused[name] == pytest.approx(value, rel=1e-12), name
+
+
+def test_empty_selection_is_nan():
+    data = _data()
+    data = data[data['T'] >= T_LAMBDA]
+    fused = _fused(data)
+    assert fused['n_points'] == 0
+    for name in ('kappa_mean', 'kappa_std', 'kappa_min', 'kappa_at_t_001', 'T_max'):
+        assert np.isnan(fused[name]), name
+
+
+def test_weighted_matches_direct_computation():
+    data = _data(seed=1)
+    weights = np.random.default_rng(2).uniform(0.1, 3.0, len(data))
+    data_super = data.assign(w=weights)[data['T'] < T_LAMBDA]
+
+    w, kappa = data_super['w'], data_super['kappa']
+    mean = (w * kappa).sum() / w.sum()
+    v1, v2 = w.sum(), (w * w).sum()
+    std = np.sqrt((w * (kappa - mean) ** 2).sum() / (v1 - v2 / v1))
+    window = np.abs(data_super['t'] - 0.1) < 0.01
+
+    fused = _fused(data, weights=weights, block_size=999)
+    assert fused['kappa_mean'] == pytest.approx(mean, rel=1e-12)
+    assert fused['kappa_std'] == pytest.approx(std, rel=1e-10)
+    assert fused['kappa_at_t_01'] == pytest.approx(
+        (w * kappa)[window].sum() / w[window].sum(), rel=1e-12)
+    assert fused['kappa_min'] == kappa.min()
+    assert fused['n_points'] == len(data_super)
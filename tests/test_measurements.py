@@ -0,0 +1,29 @@
+"""Loading measurement tables."""
+
+import numpy as np
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from kappa_analyzer import HeliumLambdaAnalyzer
+from results_io import BINARY_NAME, open_columns
+
+
+def test_measured_columns_survive_analyze(tmp_path):
+    T = np.linspace(1.5, 2.3, 500)
+    rng = np.random.default_rng(1)
+    table = pd.DataFrame({'temp': T, 'rho': rng.uniform(0, 1, T.size),
+                          'cp': rng.uniform(1, 2, T.size)})
+    table.to_csv(tmp_path / 'sweep.csv', index=False)
+
+    analyzer = HeliumLambdaAnalyzer(cache=None)
+    analyzer.load_measurements(str(tmp_path / 'sweep.csv'),
+                               columns={'T': 'temp', 'rho_s': 'rho', 'C': 'cp'})
+    analyzer.analyze(output_dir=str(tmp_path / 'out'), export_csv=True)
+
+    store = open_columns(str(tmp_path / 'out' / BINARY_NAME))
+    csv = pd.read_csv(tmp_path / 'out' / 'kappa_analysis.csv')
+    assert list(store.columns) == list(csv.columns)
+    for name in ('rho_s_measured', 'heat_capacity'):
+        np.testing.assert_array_equal(store[name], analyzer.data[name])
+    np.testing.assert_allclose(store['heat_capacity'], table['cp'], rtol=1e-15)
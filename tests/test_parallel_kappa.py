@@ -0,0 +1,45 @@
+"""Shared-memory κ evaluation."""
+
+import subprocess
+import sys
+
+import numpy as np
+
+from conftest import SRC_DIR
+from kappa_analyzer import HeliumLambdaAnalyzer
+
+T = np.linspace(0.5, 2.3, 100_001)
+
+
+def test_parallel_matches_serial():
+    analyzer = HeliumLambdaAnalyzer(cache=None)
+    kappa, t = analyzer.calculate_kappa(T)
+    with analyzer.calculate_kappa_parallel(T, workers=2, block_size=10_000) as grid:
+        np.testing.assert_array_equal(grid['kappa'], kappa)
+        np.testing.assert_array_equal(grid['t'], t)
+
+
+def test_block_released_with_last_array():
+    grid = HeliumLambdaAnalyzer(cache=None).calculate_kappa_parallel(T, workers=1)
+    kappa, tail = grid['kappa'], grid['t'][10:]
+    grid.close()
+    assert grid._release.alive
+    del kappa
+    assert grid._release.alive
+    del tail
+    assert not grid._release.alive
+
+
+def test_use_after_close_in_fresh_process():
+    # A dangling mapping crashes the interpreter rather than failing an assert
+    code = ("import numpy as np\n"
+            "from kappa_analyzer import HeliumLambdaAnalyzer\n"
+            "T = np.linspace(0.5, 2.2, 3_000_000)\n"
+            "g = HeliumLambdaAnalyzer(cache=None).calculate_kappa_parallel(T, workers=2)\n"
+            "kk = g['kappa']\n"
+            "g.close()\n"
+            "print(kk.sum())\n")
+    proc = subprocess.run([sys.executable, '-c', code], cwd=SRC_DIR, capture_output=True,
+                          text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert float(proc.stdout) > 0
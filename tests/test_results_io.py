@@ -0,0 +1,30 @@
+"""Columnar result sets."""
+
+import os
+
+import numpy as np
+
+from results_io import ColumnWriter, open_columns, write_columns
+
+
+def test_rewrite_keeps_mapped_columns_valid(tmp_path):
+    path = str(tmp_path / 'set.kbin')
+    write_columns(path, {'T': np.arange(100_000.0)}, columns=('T',))
+    mapped = open_columns(path)['T']
+
+    write_columns(path, {'T': np.arange(10.0)}, columns=('T',))
+    assert mapped.sum() == np.arange(100_000.0).sum()
+    store = open_columns(path)
+    assert store.n_rows == 10
+    np.testing.assert_array_equal(store['T'], np.arange(10.0))
+    assert os.listdir(tmp_path) == ['set.kbin']
+
+
+def test_existing_set_visible_until_close(tmp_path):
+    path = str(tmp_path / 'set.kbin')
+    write_columns(path, {'T': np.ones(5)}, columns=('T',))
+    with ColumnWriter(path, ('T',)) as writer:
+        writer.append({'T': np.zeros(3)})
+        writer.flush()
+        assert open_columns(path).n_rows == 5
+    np.testing.assert_array_equal(open_columns(path)['T'], np.zeros(3))
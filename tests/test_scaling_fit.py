@@ -0,0 +1,18 @@
+"""Power-law fits of κ(t)."""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from scaling_fit import fit_power_law
+
+
+def test_points_at_t_zero_are_ignored_without_warnings():
+    t = np.concatenate([np.logspace(-6, -0.5, 5_000), [0.0, 0.0]])
+    kappa = np.concatenate([(t[:-2] / 0.01) ** -0.0012, [0.0, 1.0]])
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        fits = fit_power_law(t, kappa, n_boot=100, workers=1)
+    assert fits[0]['n_points'] == 5_000
+    assert fits[0]['exponent'] == pytest.approx(-0.0012, rel=1e-9)
@@ -0,0 +1,57 @@
+"""SortedTIndex against brute-force |t - centre| < half_width masks."""
+
+import numpy as np
+import pytest
+
+from kappa_stats import SortedTIndex
+
+
+def _brute_force(t, kappa, centre, half_width):
+    window = np.abs(t - centre) < half_width
+    return kappa[window].mean() if window.any() else np.nan
+
+
+def _check(t, kappa, centres, half_widths):
+    index = SortedTIndex(t, kappa)
+    got = index.window_mean(centres, half_widths)
+    expected = [_brute_force(t, kappa, c, h) for c, h in zip(centres, half_widths)]
+    np.testing.assert_allclose(got, expected, rtol=1e-12, equal_nan=True)
+
+
+@pytest.mark.parametrize('order', ['ascending', 'descending', 'shuffled'])
+def test_random_windows(order):
+    rng = np.random.default_rng(0)
+    t = np.sort(rng.uniform(0, 0.5, 20_000))
+    if order == 'descending':
+        t = t[::-1]
+    elif order == 'shuffled':
+        rng.shuffle(t)
+    kappa = rng.normal(1, 0.01, t.size)
+    centres = rng.uniform(0, 0.5, 200)
+    _check(t, kappa, centres, centres * rng.uniform(0.001, 0.5, 200))
+
+
+def test_bounds_are_open():
+    rng = np.random.default_rng(1)
+    centres = rng.uniform(1e-4, 0.5, 300)
+    half_widths = centres * rng.choice([0.01, 0.1, 0.3], 300)
+    for c, h in zip(centres, half_widths):
+        # Points at the rounded bounds and one ulp either side of them
+        edges = np.array([c - h, c + h])
+        t = np.concatenate([edges, np.nextafter(edges, np.inf), np.nextafter(edges, -np.inf),
+                            [c]])
+        kappa = rng.random(t.size)
+        _check(t, kappa, [c], [h])
+
+
+def test_ties():
+    t = np.repeat([0.009, 0.0095, 0.01, 0.0105, 0.011], 4)
+    kappa = np.arange(t.size, dtype=float)
+    _check(t, kappa, [0.01, 0.01, 0.0095, 0.01], [0.001, 0.0005, 0.0005, 0.0])
+
+
+def test_empty_windows():
+    t = np.linspace(0.1, 0.2, 11)
+    kappa = np.ones_like(t)
+    _check(t, kappa, [0.5, 0.05, 0.155, 0.15], [0.1, 0.01, 0.004, -1.0])
+    assert np.isnan(SortedTIndex([], []).window_mean([0.01], [0.001])).all()
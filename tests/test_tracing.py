@@ -0,0 +1,30 @@
+"""Tracing hooks."""
+
+import subprocess
+import sys
+import time
+
+from conftest import SRC_DIR
+from tracing import Tracer
+
+
+def test_memory_samples_bounded():
+    tracer = Tracer(interval=0.0005, max_samples=20)
+    time.sleep(0.3)
+    tracer.stop()
+    assert 0 < len(tracer.samples) < 20
+    assert tracer.peak_rss > 0
+    ts = [e['ts'] for e in tracer.samples]
+    assert ts == sorted(ts)
+
+
+def test_imports_without_resource_module():
+    # The resource module only exists on Unix
+    code = ("import sys\n"
+            "sys.modules['resource'] = None\n"
+            "import kappa_analyzer, tracing\n"
+            "print(tracing._rss_bytes() >= 0)\n")
+    proc = subprocess.run([sys.executable, '-c', code], cwd=SRC_DIR, capture_output=True,
+                          text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == 'True'
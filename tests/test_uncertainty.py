@@ -0,0 +1,20 @@
+"""Monte Carlo uncertainty propagation."""
+
+import numpy as np
+import pytest
+
+from uncertainty import propagate_uncertainty
+
+T = np.linspace(0.5, 2.3, 2_001)
+
+
+def test_results_independent_of_worker_count():
+    kwargs = dict(n_samples=5_000, block_size=512, seed=7)
+    serial = propagate_uncertainty(T, workers=1, **kwargs)
+    parallel = propagate_uncertainty(T, workers=3, **kwargs)
+    assert serial == parallel
+
+
+def test_rejects_empty_sample():
+    with pytest.raises(ValueError, match="n_samples must be positive"):
+        propagate_uncertainty(T, n_samples=0, workers=1)
@@ -0,0 +1,55 @@
+"""Figure rendering."""
+
+import os
+
+import pytest
+
+pytest.importorskip('pandas')
+pytest.importorskip('matplotlib')
+
+from kappa_analyzer import HeliumLambdaAnalyzer
+from results_io import BINARY_NAME
+from visualizer import FIGURE_FILES, HeliumVisualizer, clear_templates
+
+
+@pytest.fixture(scope='module')
+def data_path(tmp_path_factory):
+    output_dir = tmp_path_factory.mktemp('results')
+    analyzer = HeliumLambdaAnalyzer(cache=None)
+    analyzer.generate_synthetic_data(2_000)
+    analyzer.analyze(output_dir=str(output_dir), export_csv=False)
+    return str(output_dir / BINARY_NAME)
+
+
+def _pngs(output_dir):
+    return {name: (output_dir / name).read_bytes() for name in FIGURE_FILES.values()}
+
+
+def test_parallel_and_repeat_renders_identical_to_serial(data_path, tmp_path):
+    # Parallel first, so forked workers cannot inherit templates built here
+    viz = HeliumVisualizer(data_path)
+    viz.generate_all_figures(str(tmp_path / 'parallel'), parallel=True, workers=2)
+    clear_templates()
+    viz.generate_all_figures(str(tmp_path / 'serial'))
+    serial = _pngs(tmp_path / 'serial')
+    assert _pngs(tmp_path / 'parallel') == serial
+
+    # Second render in this process reuses the cached figure templates
+    viz.generate_all_figures(str(tmp_path / 'repeat'), force=True)
+    assert _pngs(tmp_path / 'repeat') == serial
+
+
+def test_unchanged_figures_skipped(data_path, tmp_path):
+    viz = HeliumVisualizer(data_path)
+    viz.generate_all_figures(str(tmp_path))
+    mtimes = {name: os.stat(tmp_path / name).st_mtime_ns for name in FIGURE_FILES.values()}
+
+    timings = HeliumVisualizer(data_path).generate_all_figures(str(tmp_path))
+    assert set(timings.values()) == {0.0}
+    assert {name: os.stat(tmp_path / name).st_mtime_ns for name in mtimes} == mtimes
+
+    # A changed input re-renders
+    viz = HeliumVisualizer(data_path)
+    viz.max_points //= 2
+    timings = viz.generate_all_figures(str(tmp_path))
+    assert all(value > 0 for value in timings.values())